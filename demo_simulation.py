@@ -30,13 +30,11 @@ import FillBetween3d as fb3d
 import functions_cMyBPC as fun
 import numpy as np
 import matplotlib.pyplot as plt
-import warnings
 from matplotlib import cm
 
 
 #%% cell 1: Miscellaneous settings
 
-warnings.filterwarnings("error")
 plt.rcParams.update({'font.family':'Arial'})
 
 saveFigs = False # saves figures as files
@@ -191,33 +189,20 @@ def plot_SS_3D_noD(kinase_name, kinase_vector, PPase_name,PPase_vector,xtick_arr
         ax.grid(False)
               
 def run_simulation(ICs,params,t0,t_end,h,naFun,naFunParams,model = mod.cMyBPC_model_final,noisyS = False):
-    output = np.array([])
-    try:
-        output = fun.odeRK4(model,ICs,params,t0,t_end+1,h,naFun,naFunParams)
-        if output[np.where(output<0)].shape[0] > 0:
-            print("Numerical issue occured: negative values\n retrying with reduced stepsize: 0.1")
-            h2 = 0.1
-            if noisyS == False:                
+    output = fun.odeRK4(model,ICs,params,t0,t_end+1,h,naFun,naFunParams,stopOnFailure = (noisyS == False))
+    if np.any(output<0) or np.any(~np.isfinite(output)):
+        print("Numerical issue occured: negative or non-finite values\n retrying with reduced stepsize: 0.1")
+        h2 = 0.1
+        if noisyS == False:                
+            output = fun.odeRK4(model,ICs,params,t0,t_end+1,h2,naFun,naFunParams,stopOnFailure = True)
+            if np.any(output<0) or np.any(~np.isfinite(output)): # checked before decimating so an aborted run cannot slip through
+                print("Numerical issue occured: negative or non-finite values\n retrying with reduced stepsize: 0.01")
+                h2 = 0.01
                 output = fun.odeRK4(model,ICs,params,t0,t_end+1,h2,naFun,naFunParams)
+                output = output[:,::100]
+            else:
                 output = output[:,::10]
-                if output[np.where(output<0)].shape[0] == 0:
-                    print("succeeded!")
-                else:
-                    print("Numerical issue occured: negative values\n retrying with reduced stepsize: 0.01")
-                    h2 = 0.01
-                    output = fun.odeRK4(model,ICs,params,t0,t_end+1,h2,naFun,naFunParams)
-                    output = output[:,::100]                   
-    except RuntimeWarning:
-        try:
-            print("Numerical issue occured: runtime warning\n retrying with reduced stepsize: 0.1")
-            h2 = 0.1
-            output = fun.odeRK4(model,ICs,params,t0,t_end+1,h2,naFun,naFunParams)
-            output = output[:,::10]
-        except:
-              print("Numerical issue occured: runtime warning\n retrying with reduced stepsize: 0.01")
-              h2 = 0.01
-              output = fun.odeRK4(model,ICs,params,t0,t_end+1,h2,naFun,naFunParams)
-              output = output[:,::100] 
+                print("succeeded!")
     return output
 
 #############################################################
@@ -226,8 +211,7 @@ def run_simulation(ICs,params,t0,t_end,h,naFun,naFunParams,model = mod.cMyBPC_mo
 # Steady state PKA vs PP1 
 
 PP1v = np.array([1e-7])
-PKAv = np.logspace(-11,-5, num=21)
-PKAv = PKAv[np.where(PKAv<=6e-6)]
+PKAv = np.logspace(-11,-5, num=21)[:20] # last grid point (1e-5) is beyond the 6e-6 cutoff
 
 # Time setting for simulations
 t0 = 0
@@ -241,7 +225,7 @@ time = np.linspace(t0,t_end,npts+1)
 ICs = np.zeros(9)    #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
 ICs[0] = 20e-6      #0P cMyBP-C
 
-signalPulses = [0, t_end+1]
+signalPulses = np.array([0, t_end+1])
 simDat_SS = []      
 simDat_rel_fracs_SS = []
 
@@ -257,7 +241,7 @@ if loadData == False:
                     k = paramsHJ[p,2:32]
                     K = paramsHJ[p,32:62]
                     additionalParams = paramsHJ[p,62:]
-                    params = [k,K,additionalParams,c_enzymes]
+                    params = (k,K,additionalParams,c_enzymes)
                     
                     output = run_simulation(ICs,params,t0,t_end,h,fun.fromIntv,signalPulses)
                         
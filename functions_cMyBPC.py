@@ -15,43 +15,70 @@ Preprint available under: https://doi.org/10.1101/2023.02.24.529959
 Code by Daniel Koch, 2021-2023
 """
 
-import numpy as np 
-import pandas as pd
+import numpy as np
 import random as rnd
+from numba import njit
+from scipy.interpolate import Akima1DInterpolator
 
 
-def odeRK4(fun,ICs,p,t_0,t_end,stepsize,naFun=None,naFunParams=None):
-    
-        # numerical integration of model using the 4th order Runge-Kutta scheme
-        # args: ODE system, parameters, initial conditions, 
-        # starting time t0, stepsize, number of steps 
-        
-        steps = int(t_end/stepsize)   
-        x = np.zeros([steps,len(ICs)])
-        t = np.zeros(steps)
+@njit(cache=True)
+def _odeRK4_autonomous(fun,ICs,p,t_0,t_end,stepsize,stopOnFailure):
+
+        steps = int(t_end/stepsize)
+        x = np.zeros((steps,len(ICs)))
+        t = t_0 + stepsize*np.arange(steps) # time grid computed up front
         x[0,:] = ICs
-        t[0] = t_0
-        
-        if naFun == None and naFunParams == None: # autonomous system
-            for i in range(1,steps):
-                t[i] = t_0 + i*stepsize
-                k1 = fun(t[i-1],x[i-1,:],p)*stepsize
-                k2 = fun(t[i-1],x[i-1,:]+k1/2,p)*stepsize
-                k3 = fun(t[i-1],x[i-1,:]+k2/2,p)*stepsize
-                k4 = fun(t[i-1],x[i-1,:]+k3,p)*stepsize
-                x_next = x[i-1,:] + (k1+2*k2+2*k3+k4)/6
-                x[i,:] = x_next
-        elif naFun != None: # non-autonomous system
-            for i in range(1,steps): 
-                t[i] = t_0 + i*stepsize
-                k1 = fun(t[i-1],x[i-1,:],p,naFun,naFunParams)*stepsize
-                k2 = fun(t[i-1],x[i-1,:]+k1/2,p,naFun,naFunParams)*stepsize
-                k3 = fun(t[i-1],x[i-1,:]+k2/2,p,naFun,naFunParams)*stepsize
-                k4 = fun(t[i-1],x[i-1,:]+k3,p,naFun,naFunParams)*stepsize
-                x_next = x[i-1,:] + (k1+2*k2+2*k3+k4)/6
-                x[i,:] = x_next
-                
-        return x.T 
+        x_prev = x[0,:]
+
+        for i in range(1,steps):
+            t_prev = t[i-1]
+            k1 = fun(t_prev,x_prev,p)*stepsize
+            k2 = fun(t_prev,x_prev+k1/2,p)*stepsize
+            k3 = fun(t_prev,x_prev+k2/2,p)*stepsize
+            k4 = fun(t_prev,x_prev+k3,p)*stepsize
+            x[i,:] = x_prev + (k1+2*k2+2*k3+k4)/6
+            x_prev = x[i,:]
+            if stopOnFailure and np.any((x_prev < 0) | ~np.isfinite(x_prev)):
+                break # doomed run, abort so the caller can retry cheaply
+
+        return x.T
+
+@njit(cache=True)
+def _odeRK4_nonautonomous(fun,ICs,p,t_0,t_end,stepsize,naFun,naFunParams,stopOnFailure):
+
+        steps = int(t_end/stepsize)
+        x = np.zeros((steps,len(ICs)))
+        t = t_0 + stepsize*np.arange(steps) # time grid computed up front
+        x[0,:] = ICs
+        x_prev = x[0,:]
+
+        for i in range(1,steps):
+            t_prev = t[i-1]
+            k1 = fun(t_prev,x_prev,p,naFun,naFunParams)*stepsize
+            k2 = fun(t_prev,x_prev+k1/2,p,naFun,naFunParams)*stepsize
+            k3 = fun(t_prev,x_prev+k2/2,p,naFun,naFunParams)*stepsize
+            k4 = fun(t_prev,x_prev+k3,p,naFun,naFunParams)*stepsize
+            x[i,:] = x_prev + (k1+2*k2+2*k3+k4)/6
+            x_prev = x[i,:]
+            if stopOnFailure and np.any((x_prev < 0) | ~np.isfinite(x_prev)):
+                break # doomed run, abort so the caller can retry cheaply
+
+        return x.T
+
+def odeRK4(fun,ICs,p,t_0,t_end,stepsize,naFun=None,naFunParams=None,stopOnFailure=False):
+
+        # numerical integration of model using the 4th order Runge-Kutta scheme
+        # args: ODE system, parameters, initial conditions,
+        # starting time t0, stepsize, number of steps
+
+        # thin dispatcher: the step loops above run fully compiled, so the
+        # only Python-level call per integration is this one; with
+        # stopOnFailure the integration aborts at the first negative or
+        # non-finite state instead of finishing a run the caller will discard
+        if naFun is None:
+            return _odeRK4_autonomous(fun,ICs,p,t_0,t_end,stepsize,stopOnFailure)
+        else:
+            return _odeRK4_nonautonomous(fun,ICs,p,t_0,t_end,stepsize,naFun,naFunParams,stopOnFailure)
     
   
 def fraction(x,species,model=1): 
@@ -86,9 +113,30 @@ def fraction(x,species,model=1):
              
     return f
 
+def fractions(x,model=1):
+    # relative fractions of all phosphospecies in a single pass over x;
+    # rows are ordered '4P','3P','2P','1P','0P' (matching xPstr in the
+    # simulation scripts), so the total is summed once instead of per species
+
+    total = np.sum(x,0)
+    f = np.empty((5,)+x.shape[1:])
+    if model < 4:
+        f[0,:] = (x[7,:])/total
+        f[1,:] = (x[3,:]+x[6,:])/total
+        f[2,:] = (x[2,:]+x[5,:])/total
+        f[3,:] = (x[1,:]+x[4,:])/total
+        f[4,:] = (x[0,:])/total
+    else:
+        f[0,:] = (x[8,:])/total
+        f[1,:] = (x[4,:]+x[7,:])/total
+        f[2,:] = (x[3,:]+x[6,:])/total
+        f[3,:] = (x[1,:]+x[2,:]+x[5,:])/total
+        f[4,:] = (x[0,:])/total
+    return f
+
 #%% analysis and processing of fitted parameter sets
 
-def meanSqrtErr(expDat,simDat,exp_ids):
+def meanSqrtErr(expDat,simDat,exp_ids,return_avg=False):
     mse = []
     for p in range(simDat.shape[0]):
         mse_paramset = []
@@ -97,72 +145,53 @@ def meanSqrtErr(expDat,simDat,exp_ids):
             for ii in range(5):
                 if len(exp_ids) > 1:
                     errors = ((simDat[p,n,ii,:] - expDat[n][ii,:])**2)
-                    mse_species.append(errors.mean(axis=None))
                 else:
                     errors = ((simDat[p,0,ii,:] - expDat[n][ii,:])**2)
-                    mse_species.append(errors.mean(axis=None))         
+                # accumulate in double even for float32 input
+                mse_species.append(errors.mean(axis=None, dtype=np.float64))
             mse_paramset.append(np.asarray(mse_species).mean(axis=None))
         mse.append(np.asarray(mse_paramset))
     mse = np.asarray(mse)
+    if return_avg: # average across experiments while the errors are still in cache
+        return mse, mse.mean(axis=1)
     return mse
 
 def filterParamSets(error, xSD_cutoff, expDat = np.array([]), simDat = np.array([]), expIds = [], up_bnd = 0):
     
     idx_excl = np.array([])
     idx_incl = np.array([])
-    
+
+    # normalizing by the column mean and thresholding at
+    # mean + xSD_cutoff*std is equivalent to thresholding the raw errors
+    # at mu + xSD_cutoff*sigma, so the mean/std per experiment is computed
+    # once and no normalized copy of the error matrix is needed
     if error.ndim > 1:
 
-        for n in range(error.shape[1]):
-            error_norm = error[:,n]/error[:,n].mean(axis=None)
-            cutoff = error_norm.mean(axis=None)+xSD_cutoff[n]*np.std(error_norm)
-            idx_excl = np.hstack((idx_excl,np.where(error_norm > cutoff)[0][:]))   
-        
-        idx_excl = np.unique(idx_excl)
-        idx_excl = idx_excl.astype(int)   
-        idx_incl = np.asarray(range(error.shape[0]))
-        idx_incl = np.setdiff1d(idx_incl,idx_excl)
-        
+        cutoff = error.mean(axis=0)+np.asarray(xSD_cutoff)*np.std(error,axis=0)
+        idx_excl = np.where(np.any(error > cutoff, axis=1))[0]
+        idx_incl = np.setdiff1d(np.arange(error.shape[0]),idx_excl)
+
     else:
-        
-        error_norm = error[:]/error[:].mean(axis=None)
-        cutoff = error_norm.mean(axis=None)+xSD_cutoff*np.std(error_norm)
-        idx_excl = np.where(error_norm > cutoff)[0][:]
-        idx_excl = idx_excl.astype(int)   
-        idx_incl = np.asarray(range(error.shape[0]))
-        idx_incl = np.setdiff1d(idx_incl,idx_excl)
-       
-    maxValsSim = []
-    maxValsExp = []
-    idx_excl_max = []
-    
+
+        cutoff = error.mean(axis=None)+xSD_cutoff*np.std(error)
+        idx_excl = np.where(error > cutoff)[0][:]
+        idx_incl = np.setdiff1d(np.arange(error.shape[0]),idx_excl)
+
     if expDat.shape[0] > 0 and simDat.shape[0] > 0:
-                
-        for i in range(simDat.shape[0]):
-            for ii in range(simDat.shape[1]):
-                for iii in range(simDat.shape[2]):
-                    maxValsSim.append(np.max(simDat[i,ii,iii,:]))
-        
-        maxValsSim = np.reshape(maxValsSim,[simDat.shape[0],simDat.shape[1],simDat.shape[2]])   
-        
-        for i in range(expDat.shape[0]):
-            for ii in range(expDat.shape[1]):
-                maxValsExp.append(np.max(expDat[i,ii,:]))       
-        maxValsExp = np.reshape(maxValsExp,[expDat.shape[0],expDat.shape[1]])
-
-        for i in range(maxValsSim.shape[0]):
-            for ii in range(len(expIds)):
-                for iii in range(maxValsSim.shape[2]):
-                    if maxValsSim[i,expIds[ii],iii] <= maxValsExp[expIds[ii],iii]+up_bnd[ii] and maxValsSim[i,expIds[ii],iii] >= maxValsExp[expIds[ii],iii]-up_bnd[ii]:
-                        pass
-                    else:
-                        idx_excl_max.append(i)
-        
-        idx_excl_max = np.unique(idx_excl_max)
-        
+
+        # peak values per (paramset, experiment, species) resp. (experiment, species)
+        maxValsSim = np.max(simDat,axis=3)
+        maxValsExp = np.max(expDat,axis=2)
+
+        # exclude parametersets whose simulated peak deviates from the experimental
+        # one by more than up_bnd (NaNs from failed integrations are excluded too)
+        devs = np.abs(maxValsSim[:,expIds,:]-maxValsExp[expIds,:])
+        outOfBounds = ~(devs <= np.asarray(up_bnd)[None,:,None])
+        idx_excl_max = np.where(np.any(outOfBounds,axis=(1,2)))[0]
+
         idx_excl = np.union1d(idx_excl,idx_excl_max)
         idx_incl = np.setdiff1d(np.asarray(range(simDat.shape[0])),idx_excl)
-        
+
     return idx_incl, idx_excl
 
 def reconkK2225(params):
@@ -189,16 +218,15 @@ def numDerivative(x,y):
         print("Invalid input for function numDerivative")
         
 def akimaIntp(x,y,xnew):
-    ynew = []
-    for i in xnew:
-        if i in x:
-            idx = np.where(x == i)[0][0]
-            ynew.append(y[idx])
-        else:
-            ynew.append(None)
-    df = pd.DataFrame({'X': xnew,'Y': ynew})
-    dfIntp = df.interpolate(method='akima')
-    return np.array(dfIntp['Y'])
+    # Akima interpolation over the sample positions in xnew, matching the
+    # previous pandas df.interpolate(method='akima') behaviour (which works
+    # on the index axis); positions outside the known range stay NaN
+    pos = np.where(np.isin(xnew,x))[0]
+    yKnown = [y[np.where(x == xnew[p])[0][0]] for p in pos]
+    ynew = np.full(len(xnew),np.nan)
+    sel = np.arange(pos[0],pos[-1]+1)
+    ynew[sel] = Akima1DInterpolator(pos,np.asarray(yKnown))(sel)
+    return ynew
 
 
 def intpExpDat(x, y, xnew, nReps):
@@ -261,6 +289,7 @@ def sigGenFun(nr_of_pulses, pulse_dur, pause_dur, p_shuffle, t_first, t_end):
     s.sort()
     return np.array(s)
 
+@njit(cache=True) # compiled: called once per RHS evaluation during non-autonomous integration
 def fromIntv(t,intv):
     for i in range(0,len(intv),2):
         if t>=intv[i] and t<=intv[i+1]:
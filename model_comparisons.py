@@ -45,14 +45,15 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import cm
 from scipy import stats
-import warnings
-warnings.filterwarnings("error")
 plt.rcParams.update({'font.family':'Arial'})
 
 saveFigs = True # save figures as files
 loadData = True # load result from previous simulations if available 
 saveData = True # data of simulations for comparison are saved  
 plotFigures = True # plot results from simulations
+high_precision = False # keep AIC scores in float64 instead of the float32 default
+
+aic_dtype = np.float64 if high_precision else np.float32
 
 
 # define colors for plotting
@@ -65,6 +66,29 @@ xPstr = ['4P','3P','2P','1P','0P']
 # dictionary for storing AIC scores
 AIC = {}
 
+# in-memory cache of simulation results, so that re-running cells in the
+# same session reuses the arrays that were just computed or loaded
+# instead of going back to disk
+simDat_cache = {}
+
+def loadSimData(flnm, **kwargs):
+    if flnm not in simDat_cache:
+        path = os.path.join(path_simdat,flnm)
+        if os.path.exists(path):
+            simDat_cache[flnm] = np.load(path, **kwargs)
+        else: # compressed variant written by saveSimData for large arrays
+            simDat_cache[flnm] = np.load(os.path.splitext(path)[0]+'.npz')['arr']
+    return simDat_cache[flnm]
+
+def saveSimData(flnm, arr):
+    # deliberate format choice by size: plain .npy (fast, memory-mappable)
+    # below ~50 MB, compressed npz beyond that
+    if arr.nbytes < 50*1024*1024:
+        np.save(os.path.join(path_simdat,flnm), arr)
+    else:
+        np.savez_compressed(os.path.join(path_simdat,os.path.splitext(flnm)[0]+'.npz'), arr=arr)
+    simDat_cache[flnm] = arr
+
 
 datFlNm = [
     os.path.join(path_expdat, 'exp1_plotting.txt'), # ABD/ABGD + PP1      0
@@ -113,7 +137,19 @@ c_enzymes_exp = np.array([  #PKA, PKC, PP1, PP2A
     [0,0,0,1e-7],
     [2.46184e-9,0,0,0],
     [2.46184e-9,0,0,0],
-    ])    
+    ])
+
+# initial conditions for the 9-species model versions (>= 4):
+# P0,A,Atr,AB,ABG,D,AD,ABD,ABGD, with Atr = 0 in all experiments
+exp_ICs_9 = np.zeros((12,9))
+exp_ICs_9[:,[0,1,3,4,5,6,7,8]] = exp_ICs
+
+# Time setting for simulations (identical for all models/experiments)
+t0 = 0
+tend = 3600
+h = 1
+npts = int(tend/h)
+time = np.linspace(t0,tend,npts+1)
 
 
 # Interpolation of experimental data
@@ -129,7 +165,7 @@ for n in range(12):
     intpDat = fun.intpExpDat(t_exp,dataClean,time_intp,expReps[n])
     
     expDat.append(dataClean)
-    expDat_interpol.append(intpDat)
+    expDat_interpol.append(intpDat.astype(np.float32))
     time_exp.append(t_exp)
     
 # indices of reactions/experiments for dephosphorylation by PP1 only
@@ -149,6 +185,10 @@ for i in exp_ids_PP1:
     data = expDat[i].T
     data = data[~np.all(data == 0, axis=1)]
     n_obs_PP1only.append(data.shape[0]*data.shape[1])
+
+# total nr of observations (used by the AIC computations in every cell)
+N_obs = sum(n_obs)
+N_obs_PP1only = sum(n_obs_PP1only)
     
 #%% cell 2: Plotting Functions
 
@@ -243,11 +283,13 @@ def plot_simNexp(expIds, idx_incl, idx_excl, model_nr = 1, plotData = 'all', plo
                 else:
                     print("figure "+'model'+str(model_nr)+'_'+expNames[n]+'.svg'+" saved")
                     plt.savefig(os.path.join(path_figures,'model'+str(model_nr)+'_'+expNames[n]+'.svg'), bbox_inches = "tight")
-            
-            if plotPP1 == True:  
+                plt.close(n)
+
+            if plotPP1 == True:
                 plt.figure(13)
                 print("figure "+'model'+str(model_nr)+'_ABCDvsAD.svg'+" saved")
                 plt.savefig(os.path.join(path_figures, 'model'+str(model_nr)+'_ABCDvsAD.svg'), bbox_inches = "tight")
+                plt.close(13)
         if tQSSA == True:
             for n in expIds:
                 plt.figure(n)
@@ -257,11 +299,13 @@ def plot_simNexp(expIds, idx_incl, idx_excl, model_nr = 1, plotData = 'all', plo
                 else:
                     print("figure "+'model'+str(model_nr)+'_tQSSA_'+expNames[n]+'.svg'+" saved")
                     plt.savefig(os.path.join(path_figures,'model'+str(model_nr)+'_tQSSA_'+expNames[n]+'.svg'), bbox_inches = "tight")
+                plt.close(n)
             
             if plotPP1 == True:  
                 plt.figure(13)
                 print("figure "+'model'+str(model_nr)+'_tQSSA_ABCDvsAD.svg'+" saved")
                 plt.savefig(os.path.join(path_figures, 'model'+str(model_nr)+'_tQSSA_ABCDvsAD.svg'), bbox_inches = "tight")
+                plt.close(13)
 
     plt.show()
             
@@ -314,9 +358,10 @@ def plot_paramDistrPP1(modelStr, idx_incl):
     plt.tight_layout()
     
     if saveFigs == True:
-        plt.figure(14)
+        fig = plt.figure(14)
         print("figure "+modelStr+'_'+'_paramDistr_PP1.svg'+" saved")
-        plt.savefig(os.path.join(path_figures,modelStr+'_'+'_paramDistr_PP1.svg'), bbox_inches = "tight")
+        fig.savefig(os.path.join(path_figures,modelStr+'_'+'_paramDistr_PP1.svg'), bbox_inches = "tight")
+        plt.close(fig)
         
 def plot_paramDistr(modelStr, idx_incl):
     
@@ -361,9 +406,10 @@ def plot_paramDistr(modelStr, idx_incl):
     plt.tight_layout()
     
     if saveFigs == True:
-        plt.figure(14)
+        fig = plt.figure(14)
         print("figure "+modelStr+'_'+'_paramDistr.svg'+" saved")
-        plt.savefig(os.path.join(path_figures, modelStr+'_'+'_paramDistr.svg'), bbox_inches = "tight")
+        fig.savefig(os.path.join(path_figures, modelStr+'_'+'_paramDistr.svg'), bbox_inches = "tight")
+        plt.close(fig)
 
 def plot_MSEdistr(modelStr, expIDs, mse, cutoffs):
     plt.figure(333,figsize=(10,7))
@@ -400,13 +446,6 @@ paramsHJ = np.load(os.path.join(path_paramsets,'resultsPE_model1_HJ.npy'))
 paramsGA = fun.reconkK2225(paramsGA)
 paramsHJ = fun.reconkK2225(paramsHJ)
 
-# Time setting for simulations
-t0 = 0
-tend = 3600
-h = 1
-npts = int(tend/h)
-time = np.linspace(t0,tend,npts+1)        
-
 simDat = []      
 simDat_rel_fracs = []
 nr_paramsets = paramsHJ.shape[0]
@@ -422,7 +461,7 @@ if loadData == False:
             k = paramsHJ[p,2:32]
             K = paramsHJ[p,32:62]
             
-            params = [k,K,c_enzymes_exp[n]]
+            params = (k,K,c_enzymes_exp[n])
             output = fun.odeRK4(mod.cMyBPC_model1,ICs,params,t0,tend+1,h)
             simDat.append(output)
             simDat_rel_fracs.append([
@@ -434,19 +473,24 @@ if loadData == False:
                 ])
             
     simDat = np.reshape(simDat, (nr_paramsets,12,8,npts+1))        
-    simDat_rel_fracs = np.reshape(simDat_rel_fracs, (nr_paramsets,12,5,npts+1))
+    simDat_rel_fracs = np.reshape(simDat_rel_fracs, (nr_paramsets,12,5,npts+1)).astype(np.float32)
     
     if saveData:
-        np.save(os.path.join(path_simdat,'simDat_rel_fracs_m1.npy'),simDat_rel_fracs)
-        np.save(os.path.join(path_simdat,'simDat_m1.npy'),simDat)
+        # compressed npz (float32) instead of two uncompressed .npy files:
+        # smaller on disk and faster to reload
+        np.savez_compressed(os.path.join(path_simdat,'simDat_m1.npz'),
+                            rel_fracs=simDat_rel_fracs.astype(np.float32),
+                            raw=simDat.astype(np.float32))
+    simDat_cache['simDat_m1.npz'] = {'rel_fracs': simDat_rel_fracs, 'raw': simDat}
 else:
-    simDat_rel_fracs = np.load(os.path.join(path_simdat,'simDat_rel_fracs_m1.npy'))
-    simDat = np.load(os.path.join(path_simdat,'simDat_m1.npy'))
+    npzDat = loadSimData('simDat_m1.npz')
+    simDat_rel_fracs = npzDat['rel_fracs']
+    simDat = npzDat['raw']
 
 # Mean squared errors between interpolated data
 # and simulations for each experiment and each parameter set
 
-mse_m1 = fun.meanSqrtErr(expDat_interpol, simDat_rel_fracs, range(12))
+mse_m1, mse_avg = fun.meanSqrtErr(expDat_interpol, simDat_rel_fracs, range(12), return_avg=True)
 
 # Exclude parametersets for which MSE for any of the PP1 experiments 
 # exceeds the mean by more than X std devs (cutoff). 
@@ -466,12 +510,7 @@ plot_MSEdistr('model 1, all experiments', range(12), mse_m1, cutoffs)
 
 # calculate the AIC values for included parametersets of model 1
 
-mse_avg = np.mean(mse_m1,axis=1)
-
-AICs = []
-for i in range(len(mse_avg)):
-    AICs.append(fun.AIC(mse_avg[i], paramsHJ.shape[1], sum(n_obs)))
-AICs = np.asarray(AICs)
+AICs = fun.AIC(mse_avg, paramsHJ.shape[1], N_obs).astype(aic_dtype)
 AIC['model 1, all data'] = AICs[idx_incl_m1]
 
 if plotFigures:
@@ -498,13 +537,6 @@ paramsHJ = fun.reconkK2225(paramsHJ)
 # saveData=True
 
 
-# Time setting for simulations
-t0 = 0
-tend = 3600
-h = 1
-npts = int(tend/h)
-time = np.linspace(t0,tend,npts+1)        
-
 simDat = []      
 simDat_rel_fracs = []
 nr_paramsets = paramsHJ.shape[0]
@@ -520,7 +552,7 @@ if loadData == False:
             k = paramsHJ[p,2:32]
             K = paramsHJ[p,32:62]
             
-            params = [k,K,c_enzymes_exp[n]]
+            params = (k,K,c_enzymes_exp[n])
             output = fun.odeRK4(mod.cMyBPC_model1,ICs,params,t0,tend+1,h)
             simDat.append(output)
             simDat_rel_fracs.append([
@@ -532,14 +564,19 @@ if loadData == False:
                 ])
             
     simDat = np.reshape(simDat, (nr_paramsets,12,8,npts+1))        
-    simDat_rel_fracs = np.reshape(simDat_rel_fracs, (nr_paramsets,12,5,npts+1))
+    simDat_rel_fracs = np.reshape(simDat_rel_fracs, (nr_paramsets,12,5,npts+1)).astype(np.float32)
     
     if saveData:
-        np.save(os.path.join(path_simdat, 'simDat_rel_fracs_m1_pp1.npy'),simDat_rel_fracs)
-        np.save(os.path.join(path_simdat, 'simDat_m1_pp1.npy'),simDat)
+        # compressed npz (float32) instead of two uncompressed .npy files:
+        # smaller on disk and faster to reload
+        np.savez_compressed(os.path.join(path_simdat,'simDat_m1_pp1.npz'),
+                            rel_fracs=simDat_rel_fracs.astype(np.float32),
+                            raw=simDat.astype(np.float32))
+    simDat_cache['simDat_m1_pp1.npz'] = {'rel_fracs': simDat_rel_fracs, 'raw': simDat}
 else:
-    simDat_rel_fracs = np.load(os.path.join(path_simdat,'simDat_rel_fracs_m1_pp1.npy'))
-    simDat = np.load(os.path.join(path_simdat,'simDat_m1_pp1.npy'))
+    npzDat = loadSimData('simDat_m1_pp1.npz')
+    simDat_rel_fracs = npzDat['rel_fracs']
+    simDat = npzDat['raw']
 
 # Mean squared errors between interpolated data
 # and simulations for each experiment and each parameter set
@@ -561,10 +598,7 @@ plot_MSEdistrPP1('model 1, PP1 data only', exp_ids_PP1, mse, cutoffs)
 
 mse_avg_PP1only = np.mean(mse[:,exp_ids_PP1],axis=1)
 
-AICs = []
-for i in range(len(mse_avg_PP1only)):
-    AICs.append(fun.AIC(mse_avg_PP1only[i], len(rxsPP1)*2, sum(n_obs_PP1only)))
-AICs = np.asarray(AICs)
+AICs = fun.AIC(mse_avg_PP1only, len(rxsPP1)*2, N_obs_PP1only).astype(aic_dtype)
 AIC['model 1, pp1 data'] = AICs[idx_incl]
 
 if plotFigures:
@@ -588,13 +622,6 @@ paramsHJ = fun.reconkK2225(paramsHJ)
 loadData=True
 saveData=False
 
-# Time setting for simulations
-t0 = 0
-tend = 3600
-h = 1
-npts = int(tend/h)
-time = np.linspace(t0,tend,npts+1)        
-
 simDat = []      
 simDat_rel_fracs = []
 nr_paramsets = paramsHJ.shape[0]
@@ -609,7 +636,7 @@ if loadData == False:
             k = paramsHJ[p,2:32]
             K = paramsHJ[p,32:62]
             additionalParams = paramsHJ[p,62:]
-            params = [k,K,additionalParams,c_enzymes_exp[n]]
+            params = (k,K,additionalParams,c_enzymes_exp[n])
             output = fun.odeRK4(mod.cMyBPC_model2,ICs,params,t0,tend+1,h)
             simDat.append(output)
             simDat_rel_fracs.append([
@@ -621,14 +648,19 @@ if loadData == False:
                 ])
             
     simDat = np.reshape(simDat, (nr_paramsets,12,8,npts+1))        
-    simDat_rel_fracs = np.reshape(simDat_rel_fracs, (nr_paramsets,12,5,npts+1))
+    simDat_rel_fracs = np.reshape(simDat_rel_fracs, (nr_paramsets,12,5,npts+1)).astype(np.float32)
     
     if saveData:
-        np.save(os.path.join(path_simdat, 'simDat_rel_fracs_m2_pp1.npy'),simDat_rel_fracs)
-        np.save(os.path.join(path_simdat, 'simDat_m2_pp1.npy'),simDat)
-else:    
-    simDat_rel_fracs = np.load(os.path.join(path_simdat,'simDat_rel_fracs_m2_pp1.npy'))
-    simDat = np.load(os.path.join(path_simdat, 'simDat_m2_pp1.npy'))
+        # compressed npz (float32) instead of two uncompressed .npy files:
+        # smaller on disk and faster to reload
+        np.savez_compressed(os.path.join(path_simdat,'simDat_m2_pp1.npz'),
+                            rel_fracs=simDat_rel_fracs.astype(np.float32),
+                            raw=simDat.astype(np.float32))
+    simDat_cache['simDat_m2_pp1.npz'] = {'rel_fracs': simDat_rel_fracs, 'raw': simDat}
+else:
+    npzDat = loadSimData('simDat_m2_pp1.npz')
+    simDat_rel_fracs = npzDat['rel_fracs']
+    simDat = npzDat['raw']
 
 # Mean squared errors between interpolated data
 # and simulations for each experiment and each parameter set
@@ -650,10 +682,7 @@ plot_MSEdistrPP1('model 2, PP1 data only', exp_ids_PP1, mse, cutoffs)
 
 mse_avg_PP1only = np.mean(mse[:,exp_ids_PP1],axis=1)
 
-AICs = []
-for i in range(len(mse_avg_PP1only)):
-    AICs.append(fun.AIC(mse_avg_PP1only[i], len(rxsPP1)*2+2, sum(n_obs_PP1only)))
-AICs = np.asarray(AICs)
+AICs = fun.AIC(mse_avg_PP1only, len(rxsPP1)*2+2, N_obs_PP1only).astype(aic_dtype)
 AIC['model 2, pp1 data'] = AICs[idx_incl]
 
 
@@ -667,16 +696,16 @@ if plotFigures:
     plt.figure(666).suptitle('model 2, PP1 data only, additional parameters')
     
     plt.subplot(1,2,1)
-    for i in idx_incl:
-        plt.plot(paramsHJ[i,62].T, 'ok',alpha=0.15,ms=5)
+    vals = paramsHJ[idx_incl,62]
+    plt.scatter(np.zeros(len(vals)), vals, c='k', alpha=0.15, s=25)
     ax = plt.gca()
     ax.set_xticks([0])
     ax.set_xticklabels(['$r2_{actF}$'])
     plt.ylabel("parameter value")
     
     plt.subplot(1,2,2)
-    for i in idx_incl:
-        plt.plot(paramsHJ[i,63].T, 'ok',alpha=0.15,ms=5)
+    vals = paramsHJ[idx_incl,63]
+    plt.scatter(np.zeros(len(vals)), vals, c='k', alpha=0.15, s=25)
     ax = plt.gca()
     ax.set_xticks([0])
     ax.set_xticklabels(['$r2_{Ka}$'])
@@ -685,9 +714,11 @@ if plotFigures:
     plt.tight_layout()
 
     if saveFigs == True:
-        plt.figure(666,figsize=(3,3))
+        fig = plt.figure(666)
+        fig.set_size_inches(3,3)
         print("figure model2_distrAdditionalParams.svg saved")
-        plt.savefig(os.path.join(path_figures,'model2_distrAdditionalParams.svg'), bbox_inches = "tight")
+        fig.savefig(os.path.join(path_figures,'model2_distrAdditionalParams.svg'), bbox_inches = "tight")
+        plt.close(fig)
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -702,13 +733,6 @@ paramsHJ = np.load(os.path.join(path_paramsets,'resultsPE_model3_PP1_only_HJ.npy
 paramsGA = fun.reconkK2225(paramsGA)
 paramsHJ = fun.reconkK2225(paramsHJ)
 
-# Time setting for simulations
-t0 = 0
-tend = 3600
-h = 1
-npts = int(tend/h)
-time = np.linspace(t0,tend,npts+1)        
-
 simDat = []      
 simDat_rel_fracs = []
 nr_paramsets = paramsHJ.shape[0]
@@ -723,7 +747,7 @@ if loadData == False:
             k = paramsHJ[p,2:32]
             K = paramsHJ[p,32:62]
             additionalParams = paramsHJ[p,62:]
-            params = [k,K,additionalParams,c_enzymes_exp[n]]
+            params = (k,K,additionalParams,c_enzymes_exp[n])
             output = fun.odeRK4(mod.cMyBPC_model3,ICs,params,t0,tend+1,h)
             simDat.append(output)
             simDat_rel_fracs.append([
@@ -735,14 +759,19 @@ if loadData == False:
                 ])
             
     simDat = np.reshape(simDat, (nr_paramsets,12,8,npts+1))        
-    simDat_rel_fracs = np.reshape(simDat_rel_fracs, (nr_paramsets,12,5,npts+1))
+    simDat_rel_fracs = np.reshape(simDat_rel_fracs, (nr_paramsets,12,5,npts+1)).astype(np.float32)
     
     if saveData:
-        np.save(os.path.join(path_simdat,'simDat_rel_fracs_m3_pp1.npy'),simDat_rel_fracs)
-        np.save(os.path.join(path_simdat,'simDat_m3_pp1.npy'),simDat)
-else:    
-    simDat_rel_fracs = np.load(os.path.join(path_simdat,'simDat_rel_fracs_m3_pp1.npy'))
-    simDat = np.load(os.path.join(path_simdat,'simDat_m3_pp1.npy'))
+        # compressed npz (float32) instead of two uncompressed .npy files:
+        # smaller on disk and faster to reload
+        np.savez_compressed(os.path.join(path_simdat,'simDat_m3_pp1.npz'),
+                            rel_fracs=simDat_rel_fracs.astype(np.float32),
+                            raw=simDat.astype(np.float32))
+    simDat_cache['simDat_m3_pp1.npz'] = {'rel_fracs': simDat_rel_fracs, 'raw': simDat}
+else:
+    npzDat = loadSimData('simDat_m3_pp1.npz')
+    simDat_rel_fracs = npzDat['rel_fracs']
+    simDat = npzDat['raw']
 
 # Mean squared errors between interpolated data
 # and simulations for each experiment and each parameter set
@@ -763,10 +792,7 @@ plot_MSEdistrPP1('model 3, PP1 data only', exp_ids_PP1, mse, cutoffs)
 
 mse_avg_PP1only = np.mean(mse[:,exp_ids_PP1],axis=1)
 
-AICs = []
-for i in range(len(mse_avg_PP1only)):
-    AICs.append(fun.AIC(mse_avg_PP1only[i], len(rxsPP1)*2+3, sum(n_obs_PP1only)))
-AICs = np.asarray(AICs)
+AICs = fun.AIC(mse_avg_PP1only, len(rxsPP1)*2+3, N_obs_PP1only).astype(aic_dtype)
 AIC['model 3, pp1 data'] = AICs[idx_incl]
 
 if plotFigures:
@@ -828,13 +854,6 @@ paramsHJ = fun.reconkK2225(paramsHJ)
 
 paramsHJ[np.where(paramsHJ<1e-12)] = 0
 
-# Time setting for simulations
-t0 = 0
-tend = 3600
-h = 1
-npts = int(tend/h)
-time = np.linspace(t0,tend,npts+1)        
-
 simDat = []      
 simDat_rel_fracs = []
 nr_paramsets = paramsHJ.shape[0]
@@ -843,31 +862,23 @@ if loadData == False:
         print('simulations model 4 for PP1 data '+str(100*p/nr_paramsets)+'% complete.')
         for n in range(12):
             
-            #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
-            ICs = [exp_ICs[n,0],exp_ICs[n,1],0,exp_ICs[n,2],exp_ICs[n,3],exp_ICs[n,4],exp_ICs[n,5],exp_ICs[n,6],exp_ICs[n,7]]
+            ICs = exp_ICs_9[n] #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
             
             # parameters
             k = paramsHJ[p,2:32]
             K = paramsHJ[p,32:62]
             additionalParams = paramsHJ[p,62:]
-            params = [k,K,additionalParams,c_enzymes_exp[n]]
+            params = (k,K,additionalParams,c_enzymes_exp[n])
             
-            output = np.array([])
-            try:
-                output = fun.odeRK4(mod.cMyBPC_model4,ICs,params,t0,tend+1,h)
-                if output[np.where(output<0)].shape[0] > 0:
-                    print("Numerical issue occured: negative values\n retrying with reduced stepsize...")
-                    h2 = 0.1
-                    output = fun.odeRK4(mod.cMyBPC_model4,ICs,params,t0,tend+1,h2)
-                    output = output[:,::10]
-                    if output[np.where(output<0)].shape[0] == 0:
-                        print("succeeded!")
-                    else:
-                        print("failed!")                    
-            except RuntimeWarning:
-                print("Numerical issue occured: runtime warning\n retrying with reduced stepsize...")
+            output = fun.odeRK4(mod.cMyBPC_model4,ICs,params,t0,tend+1,h,stopOnFailure = True)
+            if np.any(output<0) or np.any(~np.isfinite(output)):
+                print("Numerical issue occured: negative or non-finite values\n retrying with reduced stepsize: 0.1")
                 h2 = 0.1
                 output = fun.odeRK4(mod.cMyBPC_model4,ICs,params,t0,tend+1,h2)
+                if np.any(output<0) or np.any(~np.isfinite(output)): # checked before decimating so an aborted run cannot slip through
+                    print("failed!")
+                else:
+                    print("succeeded!")
                 output = output[:,::10]
                 
             simDat.append(output)
@@ -880,14 +891,19 @@ if loadData == False:
                 ])
             
     simDat = np.reshape(simDat, (nr_paramsets,12,9,npts+1))        
-    simDat_rel_fracs = np.reshape(simDat_rel_fracs, (nr_paramsets,12,5,npts+1))
+    simDat_rel_fracs = np.reshape(simDat_rel_fracs, (nr_paramsets,12,5,npts+1)).astype(np.float32)
     
     if saveData:
-        np.save(os.path.join(path_simdat,'simDat_rel_fracs_m4_pp1.npy'),simDat_rel_fracs)
-        np.save(os.path.join(path_simdat,'simDat_m4_pp1.npy'),simDat)
-else:    
-    simDat_rel_fracs = np.load(os.path.join(path_simdat,'simDat_rel_fracs_m4_pp1.npy'))
-    simDat = np.load(os.path.join(path_simdat,'simDat_m4_pp1.npy'))
+        # compressed npz (float32) instead of two uncompressed .npy files:
+        # smaller on disk and faster to reload
+        np.savez_compressed(os.path.join(path_simdat,'simDat_m4_pp1.npz'),
+                            rel_fracs=simDat_rel_fracs.astype(np.float32),
+                            raw=simDat.astype(np.float32))
+    simDat_cache['simDat_m4_pp1.npz'] = {'rel_fracs': simDat_rel_fracs, 'raw': simDat}
+else:
+    npzDat = loadSimData('simDat_m4_pp1.npz')
+    simDat_rel_fracs = npzDat['rel_fracs']
+    simDat = npzDat['raw']
 
 # Mean squared errors between interpolated data
 # and simulations for each experiment and each parameter set
@@ -909,10 +925,7 @@ plot_MSEdistrPP1('model 4, PP1 data only', exp_ids_PP1, mse, cutoffs)
 
 mse_avg_PP1only = np.mean(mse[:,exp_ids_PP1],axis=1)
 
-AICs = []
-for i in range(len(mse_avg_PP1only)):
-    AICs.append(fun.AIC(mse_avg_PP1only[i], len(rxsPP1)*2+4, sum(n_obs_PP1only)))
-AICs = np.asarray(AICs)
+AICs = fun.AIC(mse_avg_PP1only, len(rxsPP1)*2+4, N_obs_PP1only).astype(aic_dtype)
 AIC['model 4, pp1 data'] = AICs[idx_incl]
 
 if plotFigures:
@@ -925,8 +938,8 @@ if plotFigures:
     plt.figure(666).suptitle('model 4, PP1 data only, additional parameters')
     
     plt.subplot(1,4,1)
-    for i in idx_incl:
-        plt.plot(paramsHJ[i,62].T, 'ok',alpha=0.15,ms=5)
+    vals = paramsHJ[idx_incl,62]
+    plt.scatter(np.zeros(len(vals)), vals, c='k', alpha=0.15, s=25)
     # plt.yscale('log')
     ax = plt.gca()
     ax.set_xticks([0])
@@ -934,8 +947,8 @@ if plotFigures:
     plt.ylabel("parameter value ($s^{-1}$)")
     
     plt.subplot(1,4,2)
-    for i in idx_incl:
-        plt.plot(paramsHJ[i,63].T, 'ok',alpha=0.15,ms=5)
+    vals = paramsHJ[idx_incl,63]
+    plt.scatter(np.zeros(len(vals)), vals, c='k', alpha=0.15, s=25)
     # plt.yscale('log')
     ax = plt.gca()
     ax.set_xticks([0])
@@ -943,8 +956,8 @@ if plotFigures:
     plt.ylabel("parameter value ($M$)")
     
     plt.subplot(1,4,3)
-    for i in idx_incl:
-        plt.plot(paramsHJ[i,64].T, 'ok',alpha=0.15,ms=5)
+    vals = paramsHJ[idx_incl,64]
+    plt.scatter(np.zeros(len(vals)), vals, c='k', alpha=0.15, s=25)
     # plt.yscale('log')
     ax = plt.gca()
     ax.set_xticks([0])
@@ -952,8 +965,8 @@ if plotFigures:
     plt.ylabel("parameter value ($s^{-1}$)")
     
     plt.subplot(1,4,4)
-    for i in idx_incl:
-        plt.plot(paramsHJ[i,65].T, 'ok',alpha=0.15,ms=5)
+    vals = paramsHJ[idx_incl,65]
+    plt.scatter(np.zeros(len(vals)), vals, c='k', alpha=0.15, s=25)
     # plt.yscale('log')
     ax = plt.gca()
     ax.set_xticks([0])
@@ -963,9 +976,11 @@ if plotFigures:
     plt.tight_layout()
     
     if saveFigs == True:
-        plt.figure(666,figsize=(3,4))
+        fig = plt.figure(666)
+        fig.set_size_inches(3,4)
         print("figure model4_distrAdditionalParams_PP1.svg saved")
-        plt.savefig(os.path.join(path_figures,'model4_distrAdditionalParams_PP1.svg'), bbox_inches = "tight")
+        fig.savefig(os.path.join(path_figures,'model4_distrAdditionalParams_PP1.svg'), bbox_inches = "tight")
+        plt.close(fig)
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -995,13 +1010,6 @@ paramsHJ[len(idx_incl_m1_PKA):2*len(idx_incl_m1_PKA),params_PKA] = x
 paramsHJ[2*len(idx_incl_m1_PKA):,params_PKA] = x[:(len(paramsHJ[:,0]) - 2*len(idx_incl_m1_PKA)),:]
 
 
-# Time setting for simulations
-t0 = 0
-tend = 3600
-h = 1
-npts = int(tend/h)
-time = np.linspace(t0,tend,npts+1)        
-
 simDat = []      
 simDat_rel_fracs = []
 nr_paramsets = paramsHJ.shape[0]
@@ -1012,38 +1020,27 @@ if loadData == False:
         print("paramset ", str(int(paramsHJ[p,0])))
         for n in range(12):
             
-            #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
-            ICs = [exp_ICs[n,0],exp_ICs[n,1],0,exp_ICs[n,2],exp_ICs[n,3],exp_ICs[n,4],exp_ICs[n,5],exp_ICs[n,6],exp_ICs[n,7]]
+            ICs = exp_ICs_9[n] #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
             
             # parameters
             k = paramsHJ[p,2:32]
             K = paramsHJ[p,32:62]
             additionalParams = paramsHJ[p,62:]
-            params = [k,K,additionalParams,c_enzymes_exp[n]]
+            params = (k,K,additionalParams,c_enzymes_exp[n])
             
-            output = np.array([])
-            try:
-                output = fun.odeRK4(mod.cMyBPC_model4_full,ICs,params,t0,tend+1,h)
-                if output[np.where(output<0)].shape[0] > 0:
-                    print("Numerical issue occured: negative values\n retrying with reduced stepsize...")
-                    h2 = 0.1
-                    output = fun.odeRK4(mod.cMyBPC_model4_full,ICs,params,t0,tend+1,h2)
-                    output = output[:,::10]
-                    if output[np.where(output<0)].shape[0] == 0:
-                        print("succeeded!")
-                    else:
-                        print("failed!")                    
-            except RuntimeWarning:
-                try:
-                    print("Numerical issue occured: runtime warning\n retrying with reduced stepsize: 0.1")
-                    h2 = 0.1
+            output = fun.odeRK4(mod.cMyBPC_model4_full,ICs,params,t0,tend+1,h,stopOnFailure = True)
+            if np.any(output<0) or np.any(~np.isfinite(output)):
+                print("Numerical issue occured: negative or non-finite values\n retrying with reduced stepsize: 0.1")
+                h2 = 0.1
+                output = fun.odeRK4(mod.cMyBPC_model4_full,ICs,params,t0,tend+1,h2,stopOnFailure = True)
+                if np.any(output<0) or np.any(~np.isfinite(output)): # checked before decimating so an aborted run cannot slip through
+                    print("Numerical issue occured: negative or non-finite values\n retrying with reduced stepsize: 0.01")
+                    h2 = 0.01
                     output = fun.odeRK4(mod.cMyBPC_model4_full,ICs,params,t0,tend+1,h2)
+                    output = output[:,::100]
+                else:
                     output = output[:,::10]
-                except:
-                      print("Numerical issue occured: runtime warning\n retrying with reduced stepsize: 0.01")
-                      h2 = 0.01
-                      output = fun.odeRK4(mod.cMyBPC_model4_full,ICs,params,t0,tend+1,h2)
-                      output = output[:,::100]   
+                    print("succeeded!")
                 
             simDat.append(output)
             simDat_rel_fracs.append([
@@ -1055,19 +1052,24 @@ if loadData == False:
                 ])
             
     simDat = np.reshape(simDat, (nr_paramsets,12,9,npts+1))        
-    simDat_rel_fracs = np.reshape(simDat_rel_fracs, (nr_paramsets,12,5,npts+1))
+    simDat_rel_fracs = np.reshape(simDat_rel_fracs, (nr_paramsets,12,5,npts+1)).astype(np.float32)
     
     if saveData:
-        np.save(os.path.join(path_simdat,'simDat_rel_fracs_m4_pp1,pp2a.npy'),simDat_rel_fracs)
-        np.save(os.path.join(path_simdat,'simDat_m4_pp1,pp2a.npy'),simDat)
-else:    
-    simDat_rel_fracs = np.load(os.path.join(path_simdat,'simDat_rel_fracs_m4_pp1,pp2a.npy'))
-    simDat = np.load(os.path.join(path_simdat,'simDat_m4_pp1,pp2a.npy'))
+        # compressed npz (float32) instead of two uncompressed .npy files:
+        # smaller on disk and faster to reload
+        np.savez_compressed(os.path.join(path_simdat,'simDat_m4_pp1,pp2a.npz'),
+                            rel_fracs=simDat_rel_fracs.astype(np.float32),
+                            raw=simDat.astype(np.float32))
+    simDat_cache['simDat_m4_pp1,pp2a.npz'] = {'rel_fracs': simDat_rel_fracs, 'raw': simDat}
+else:
+    npzDat = loadSimData('simDat_m4_pp1,pp2a.npz')
+    simDat_rel_fracs = npzDat['rel_fracs']
+    simDat = npzDat['raw']
     
 # Mean squared errors between interpolated data
 # and simulations for each experiment and each parameter set
 
-mse = fun.meanSqrtErr(expDat_interpol, simDat_rel_fracs, range(12))
+mse, mse_avg = fun.meanSqrtErr(expDat_interpol, simDat_rel_fracs, range(12), return_avg=True)
 
 # Exclude parametersets for which MSE for any of the PP1 experiments 
 # exceeds the mean by more than X std devs (cutoff). 
@@ -1076,9 +1078,7 @@ cutoffs = [0,0.5,0, 0.5,1,-0.5, 1.5,1.5,1.5, 1.5,5,5]
 
 
 #convert interpolated experimental data into numpy array
-npar_expDatInterp = np.zeros([12,5,3601])
-for i in range(12):
-    npar_expDatInterp[i,:,:] = expDat_interpol[i] 
+npar_expDatInterp = np.asarray(expDat_interpol)
 
 idx_incl_m4, idx_excl_m4  = fun.filterParamSets(mse, cutoffs, 
                                           npar_expDatInterp, simDat_rel_fracs, 
@@ -1090,12 +1090,7 @@ plot_MSEdistr('model 4, all experiments', range(12), mse, cutoffs)
 
 # calculate the AIC values for included parametersets of model 4
 
-mse_avg = np.mean(mse,axis=1)
-
-AICs = []
-for i in range(len(mse_avg)):
-    AICs.append(fun.AIC(mse_avg[i], paramsHJ.shape[1], sum(n_obs)))
-AICs = np.asarray(AICs)
+AICs = fun.AIC(mse_avg, paramsHJ.shape[1], N_obs).astype(aic_dtype)
 AIC['model 4, all data'] = AICs[idx_incl_m4]
 
 if plotFigures:
@@ -1105,63 +1100,29 @@ if plotFigures:
     plot_paramDistr('model 4', idx_incl_m4)
     
     # plot distribution of model specific parameters
-    plt.figure(666,figsize=(7.5,4))
-    plt.figure(666).suptitle('model 4, all experiments, additional parameters')
-    
-    plt.subplot(1,6,1)
-    for i in idx_incl_m4:
-        plt.plot(paramsHJ[i,62].T, 'ok',alpha=0.15,ms=5)
-    ax = plt.gca()
-    ax.set_xticks([0])
-    ax.set_xticklabels(['k$_{2, fast}$'])
-    plt.ylabel("parameter value ($s^{-1}$)")
-    
-    plt.subplot(1,6,2)
-    for i in idx_incl_m4:
-        plt.plot(paramsHJ[i,63].T, 'ok',alpha=0.15,ms=5)
-    ax = plt.gca()
-    ax.set_xticks([0])
-    ax.set_xticklabels(['K$_{2, fast}$'])
-    plt.ylabel("parameter value ($M$)")
-    
-    plt.subplot(1,6,3)
-    for i in idx_incl_m4:
-        plt.plot(paramsHJ[i,66].T, 'ok',alpha=0.15,ms=5)
-    ax = plt.gca()
-    ax.set_xticks([0])
-    ax.set_xticklabels(['k$_{3, fast}$'])
-    plt.ylabel("parameter value ($s^{-1}$)")
-    
-    plt.subplot(1,6,4)
-    for i in idx_incl_m4:
-        plt.plot(paramsHJ[i,67].T, 'ok',alpha=0.15,ms=5)
-    ax = plt.gca()
-    ax.set_xticks([0])
-    ax.set_xticklabels(['K$_{3, fast}$'])
-    plt.ylabel("parameter value ($M$)")
-    
-    plt.subplot(1,6,5)
-    for i in idx_incl_m4:
-        plt.plot(paramsHJ[i,64].T, 'ok',alpha=0.15,ms=5)
-    ax = plt.gca()
-    ax.set_xticks([0])
-    ax.set_xticklabels(['$k_{iso,F}$'])
-    plt.ylabel("parameter value ($s^{-1}$)")
-    
-    plt.subplot(1,6,6)
-    for i in idx_incl_m4:
-        plt.plot(paramsHJ[i,65].T, 'ok',alpha=0.15,ms=5)
-    ax = plt.gca()
-    ax.set_xticks([0])
-    ax.set_xticklabels(['$k_{iso,R}$'])
-    plt.ylabel("parameter value ($s^{-1}$)")
-    
+    addParams = [(62,'k$_{2, fast}$','parameter value ($s^{-1}$)'),
+                 (63,'K$_{2, fast}$','parameter value ($M$)'),
+                 (66,'k$_{3, fast}$','parameter value ($s^{-1}$)'),
+                 (67,'K$_{3, fast}$','parameter value ($M$)'),
+                 (64,'$k_{iso,F}$','parameter value ($s^{-1}$)'),
+                 (65,'$k_{iso,R}$','parameter value ($s^{-1}$)')]
+    vals = paramsHJ[np.ix_(idx_incl_m4,[col for col,_,_ in addParams])]
+
+    fig, axes = plt.subplots(1,6,figsize=(7.5,4),num=666,clear=True)
+    fig.suptitle('model 4, all experiments, additional parameters')
+    for ax, (col, lab, unit), v in zip(axes, addParams, vals.T):
+        ax.scatter(np.zeros(v.size), v, c='k', alpha=0.15, s=25)
+        ax.set_xticks([0])
+        ax.set_xticklabels([lab])
+        ax.set_ylabel(unit)
     plt.tight_layout()
     
     if saveFigs == True:
-        plt.figure(666,figsize=(3,4))
+        fig = plt.figure(666)
+        fig.set_size_inches(3,4)
         print("figure model4_distrAdditionalParams.svg saved")
-        plt.savefig(os.path.join(path_figures,'model4_distrAdditionalParams.svg'), bbox_inches = "tight")
+        fig.savefig(os.path.join(path_figures,'model4_distrAdditionalParams.svg'), bbox_inches = "tight")
+        plt.close(fig)
 
     
 #Calculate lifetime of Atr
@@ -1224,12 +1185,15 @@ print ('\n \n Calculate statistics for AIC:  model 1-4, PP1 data...\n')
 #plot AIC distribution for models 1 and 2
 plt.figure(figsize=(3.25,2.75))
 
-minAIC = np.min([np.min(AIC['model 1, pp1 data']),np.min(AIC['model 2, pp1 data'])])
-maxAIC = np.max([np.max(AIC['model 1, pp1 data']),np.max(AIC['model 2, pp1 data'])])
+aicKeys = ['model 1, pp1 data', 'model 2, pp1 data']
+minAIC = min(AIC[k].min() for k in aicKeys)
+maxAIC = max(AIC[k].max() for k in aicKeys)
 bins = np.linspace(minAIC,maxAIC,25)
 
-plt.hist(AIC['model 1, pp1 data'],bins,color='b',alpha=0.33,label='model 1')
-plt.hist(AIC['model 3, pp1 data'],bins,color='m',alpha=0.33,label='model 3')
+for key, c, lab in [('model 1, pp1 data','b','model 1'),
+                     ('model 3, pp1 data','m','model 3')]:
+    h, _ = np.histogram(AIC[key], bins)
+    plt.bar(bins[:-1], h, width=np.diff(bins), color=c, alpha=0.33, align='edge', label=lab)
 plt.ylim((0,50))
 plt.yticks([0,25,50])
 plt.legend(['model 1', 'model 2'])
@@ -1240,18 +1204,22 @@ plt.tight_layout()
 if saveFigs == True:
     print("figure AIC_m1m2_pp1.svg saved")
     plt.savefig(os.path.join(path_figures,'AIC_m1m2m4_pp1.svg'), bbox_inches = "tight")
+    plt.close()
 
 
 #plot AIC distribution for models 1,3 and 4
 plt.figure(figsize=(3.25,3))
 
-minAIC = np.min([np.min(AIC['model 1, pp1 data']),np.min(AIC['model 3, pp1 data']),np.min(AIC['model 4, pp1 data'])])
-maxAIC = np.max([np.max(AIC['model 1, pp1 data']),np.max(AIC['model 3, pp1 data']),np.max(AIC['model 4, pp1 data'])])
+aicKeys = ['model 1, pp1 data', 'model 3, pp1 data', 'model 4, pp1 data']
+minAIC = min(AIC[k].min() for k in aicKeys)
+maxAIC = max(AIC[k].max() for k in aicKeys)
 bins = np.linspace(minAIC,maxAIC,25)
 
-plt.hist(AIC['model 1, pp1 data'],bins,color='b',alpha=0.33,label='model 1')
-plt.hist(AIC['model 3, pp1 data'],bins,color='g',alpha=0.33,label='model 3')
-plt.hist(AIC['model 4, pp1 data'],bins,color='r',alpha=0.33,label='model 4')
+for key, c, lab in [('model 1, pp1 data','b','model 1'),
+                     ('model 3, pp1 data','g','model 3'),
+                     ('model 4, pp1 data','r','model 4')]:
+    h, _ = np.histogram(AIC[key], bins)
+    plt.bar(bins[:-1], h, width=np.diff(bins), color=c, alpha=0.33, align='edge', label=lab)
 plt.ylim((0,50))
 plt.yticks([0,25,50])
 plt.legend(['model 1', 'model 3', 'model 4'],fontsize=13)
@@ -1262,6 +1230,7 @@ plt.tight_layout()
 if saveFigs == True:
     print("figure AIC_m1m3m4_pp1.svg saved")
     plt.savefig(os.path.join(path_figures,'AIC_m1m3m4_pp1.svg'),dpi=500, bbox_inches = "tight")
+    plt.close()
 
 
 print('Distribution measures of AIC values')
@@ -1306,12 +1275,15 @@ print ('\n \n Calculate statistics for AIC:  model 1 and 4, all data....\n')
 
 #plot AIC distribution for models 1 and 4
 plt.figure(figsize=(3.25,2.75))
-minAIC = np.min([np.min(AIC['model 1, all data']),np.min(AIC['model 4, all data'])])
-maxAIC = np.max([np.max(AIC['model 1, all data']),np.max(AIC['model 4, all data'])])
+aicKeys = ['model 1, all data', 'model 4, all data']
+minAIC = min(AIC[k].min() for k in aicKeys)
+maxAIC = max(AIC[k].max() for k in aicKeys)
 bins = np.linspace(minAIC,maxAIC,25)
 
-plt.hist(AIC['model 1, all data'],bins,color='b',alpha=0.33,label='model 1')
-plt.hist(AIC['model 4, all data'],bins,color='m',alpha=0.33,label='model 4')
+for key, c, lab in [('model 1, all data','b','model 1'),
+                     ('model 4, all data','m','model 4')]:
+    h, _ = np.histogram(AIC[key], bins)
+    plt.bar(bins[:-1], h, width=np.diff(bins), color=c, alpha=0.33, align='edge', label=lab)
 plt.ylim((0,50))
 plt.yticks([0,25,50])
 plt.legend(['model 1', 'model 4'])
@@ -1322,6 +1294,7 @@ plt.tight_layout()
 if saveFigs == True:
     print("figure AIC_m1m4.svg saved")
     plt.savefig(os.path.join(path_figures,'AIC_m1m4.svg'), bbox_inches = "tight")
+    plt.close()
 
 print('Distribution measures of AIC values')
 print('Model 1:\n', 'mean: ', np.mean(AIC['model 1, all data']), ' SD: ', np.std(AIC['model 1, all data']), ' variance: ', np.var(AIC['model 1, all data']))
@@ -1350,13 +1323,6 @@ paramsHJ = np.load(os.path.join(path_paramsets,'resultsPE_model1_tQSSA_HJ.npy'))
 paramsGA = fun.reconkK2225(paramsGA)
 paramsHJ = fun.reconkK2225(paramsHJ)
 
-# Time setting for simulations
-t0 = 0
-tend = 3600
-h = 1
-npts = int(tend/h)
-time = np.linspace(t0,tend,npts+1)        
-
 simDat = []      
 simDat_rel_fracs = []
 nr_paramsets = paramsHJ.shape[0]
@@ -1372,7 +1338,7 @@ if loadData == False:
             k = paramsHJ[p,2:32]
             K = paramsHJ[p,32:62]
             
-            params = [k,K,c_enzymes_exp[n]]
+            params = (k,K,c_enzymes_exp[n])
             output = fun.odeRK4(mod.cMyBPC_model1_tQSSA,ICs,params,t0,tend+1,h)
             simDat.append(output)
             simDat_rel_fracs.append([
@@ -1384,19 +1350,24 @@ if loadData == False:
                 ])
             
     simDat = np.reshape(simDat, (nr_paramsets,12,8,npts+1))        
-    simDat_rel_fracs = np.reshape(simDat_rel_fracs, (nr_paramsets,12,5,npts+1))
+    simDat_rel_fracs = np.reshape(simDat_rel_fracs, (nr_paramsets,12,5,npts+1)).astype(np.float32)
     
     if saveData:
-        np.save(os.path.join(path_simdat,'simDat_rel_fracs_m1_tQSSA.npy'),simDat_rel_fracs)
-        np.save(os.path.join(path_simdat,'simDat_m1_tQSSA.npy'),simDat)
+        saveSimData('simDat_rel_fracs_m1_tQSSA.npy',simDat_rel_fracs)
+        saveSimData('simDat_m1_tQSSA.npy',simDat)
+    else:
+        simDat_cache['simDat_rel_fracs_m1_tQSSA.npy'] = simDat_rel_fracs
+        simDat_cache['simDat_m1_tQSSA.npy'] = simDat
 else:
-    simDat_rel_fracs = np.load(os.path.join(path_simdat,'simDat_rel_fracs_m1_tQSSA.npy'))
-    simDat = np.load(os.path.join(path_simdat,'simDat_m1_tQSSA.npy'))
+    # memory-map the cached arrays so only the slices that are actually
+    # touched downstream get paged in
+    simDat_rel_fracs = loadSimData('simDat_rel_fracs_m1_tQSSA.npy', mmap_mode='r')
+    simDat = loadSimData('simDat_m1_tQSSA.npy', mmap_mode='r')
 
 # Mean squared errors between interpolated data
 # and simulations for each experiment and each parameter set
 
-mse_m1_tQSSA = fun.meanSqrtErr(expDat_interpol, simDat_rel_fracs, range(12))
+mse_m1_tQSSA, mse_avg = fun.meanSqrtErr(expDat_interpol, simDat_rel_fracs, range(12), return_avg=True)
 
 # Exclude parametersets for which MSE for any of the PP1 experiments 
 # exceeds the mean by more than X std devs (cutoff). 
@@ -1416,12 +1387,7 @@ plot_MSEdistr('model 1 tQSSA, all experiments', range(12), mse_m1_tQSSA, cutoffs
 
 # calculate the AIC values for included parametersets of model 1
 
-mse_avg = np.mean(mse_m1_tQSSA,axis=1)
-
-AICs = []
-for i in range(len(mse_avg)):
-    AICs.append(fun.AIC(mse_avg[i], paramsHJ.shape[1], sum(n_obs)))
-AICs = np.asarray(AICs)
+AICs = fun.AIC(mse_avg, paramsHJ.shape[1], N_obs).astype(aic_dtype)
 AIC['model 1 tQSSA, all data'] = AICs[idx_incl_m1_tQSSA]
 
 if plotFigures:
@@ -1457,13 +1423,6 @@ paramsHJ[:len(idx_incl_m1_PKA_tQSSA),params_PKA] = x
 paramsHJ[len(idx_incl_m1_PKA_tQSSA):,params_PKA] = x[paramsHJ[len(idx_incl_m1_PKA_tQSSA):,params_PKA].shape[0],:]
 
 
-# Time setting for simulations
-t0 = 0
-tend = 3600
-h = 1
-npts = int(tend/h)
-time = np.linspace(t0,tend,npts+1)        
-
 simDat = []      
 simDat_rel_fracs = []
 nr_paramsets = paramsHJ.shape[0]
@@ -1474,38 +1433,27 @@ if loadData == False:
         print("paramset ", str(int(paramsHJ[p,0])))
         for n in range(12):
             
-            #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
-            ICs = [exp_ICs[n,0],exp_ICs[n,1],0,exp_ICs[n,2],exp_ICs[n,3],exp_ICs[n,4],exp_ICs[n,5],exp_ICs[n,6],exp_ICs[n,7]]
+            ICs = exp_ICs_9[n] #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
             
             # parameters
             k = paramsHJ[p,2:32]
             K = paramsHJ[p,32:62]
             additionalParams = paramsHJ[p,62:]
-            params = [k,K,additionalParams,c_enzymes_exp[n]]
+            params = (k,K,additionalParams,c_enzymes_exp[n])
             
-            output = np.array([])
-            try:
-                output = fun.odeRK4(mod.cMyBPC_model4_full,ICs,params,t0,tend+1,h)
-                if output[np.where(output<0)].shape[0] > 0:
-                    print("Numerical issue occured: negative values\n retrying with reduced stepsize...")
-                    h2 = 0.1
-                    output = fun.odeRK4(mod.cMyBPC_model4_full_tQSSA,ICs,params,t0,tend+1,h2)
-                    output = output[:,::10]
-                    if output[np.where(output<0)].shape[0] == 0:
-                        print("succeeded!")
-                    else:
-                        print("failed!")                    
-            except RuntimeWarning:
-                try:
-                    print("Numerical issue occured: runtime warning\n retrying with reduced stepsize: 0.1")
-                    h2 = 0.1
+            output = fun.odeRK4(mod.cMyBPC_model4_full,ICs,params,t0,tend+1,h,stopOnFailure = True)
+            if np.any(output<0) or np.any(~np.isfinite(output)):
+                print("Numerical issue occured: negative or non-finite values\n retrying with reduced stepsize: 0.1")
+                h2 = 0.1
+                output = fun.odeRK4(mod.cMyBPC_model4_full_tQSSA,ICs,params,t0,tend+1,h2,stopOnFailure = True)
+                if np.any(output<0) or np.any(~np.isfinite(output)): # checked before decimating so an aborted run cannot slip through
+                    print("Numerical issue occured: negative or non-finite values\n retrying with reduced stepsize: 0.01")
+                    h2 = 0.01
                     output = fun.odeRK4(mod.cMyBPC_model4_full_tQSSA,ICs,params,t0,tend+1,h2)
+                    output = output[:,::100]
+                else:
                     output = output[:,::10]
-                except: 
-                      print("Numerical issue occured: runtime warning\n retrying with reduced stepsize: 0.01")
-                      h2 = 0.01
-                      output = fun.odeRK4(mod.cMyBPC_model4_full_tQSSA,ICs,params,t0,tend+1,h2)
-                      output = output[:,::100]   
+                    print("succeeded!")
                 
             simDat.append(output)
             simDat_rel_fracs.append([
@@ -1517,20 +1465,25 @@ if loadData == False:
                 ])
             
     simDat = np.reshape(simDat, (nr_paramsets,12,9,npts+1))        
-    simDat_rel_fracs = np.reshape(simDat_rel_fracs, (nr_paramsets,12,5,npts+1))
+    simDat_rel_fracs = np.reshape(simDat_rel_fracs, (nr_paramsets,12,5,npts+1)).astype(np.float32)
     
     if saveData:
-        np.save(os.path.join(path_simdat,'simDat_rel_fracs_m4_tQSSA_pp1,pp2a.npy'),simDat_rel_fracs)
-        np.save(os.path.join(path_simdat,'simDat_m4_tQSSA_pp1,pp2a.npy'),simDat)
-else:    
-    simDat_rel_fracs = np.load(os.path.join(path_simdat,'simDat_rel_fracs_m4_tQSSA_pp1,pp2a.npy'))
-    simDat = np.load(os.path.join(path_simdat,'simDat_m4_tQSSA_pp1,pp2a.npy'))
+        saveSimData('simDat_rel_fracs_m4_tQSSA_pp1,pp2a.npy',simDat_rel_fracs)
+        saveSimData('simDat_m4_tQSSA_pp1,pp2a.npy',simDat)
+    else:
+        simDat_cache['simDat_rel_fracs_m4_tQSSA_pp1,pp2a.npy'] = simDat_rel_fracs
+        simDat_cache['simDat_m4_tQSSA_pp1,pp2a.npy'] = simDat
+else:
+    # memory-map the cached arrays so only the slices that are actually
+    # touched downstream get paged in
+    simDat_rel_fracs = loadSimData('simDat_rel_fracs_m4_tQSSA_pp1,pp2a.npy', mmap_mode='r')
+    simDat = loadSimData('simDat_m4_tQSSA_pp1,pp2a.npy', mmap_mode='r')
 
     
 # Mean squared errors between interpolated data
 # and simulations for each experiment and each parameter set
 
-mse = fun.meanSqrtErr(expDat_interpol, simDat_rel_fracs, range(12))
+mse, mse_avg = fun.meanSqrtErr(expDat_interpol, simDat_rel_fracs, range(12), return_avg=True)
 
 # Exclude parametersets for which MSE for any of the PP1 experiments 
 # exceeds the mean by more than X std devs (cutoff). 
@@ -1539,16 +1492,21 @@ cutoffs = [0,0.75,0.75, 0.5,1,0, 1.5,1.5,1.5, 1.5,5,5]
 
 
 #convert interpolated experimental data into numpy array
-npar_expDatInterp = np.zeros([12,5,3601])
-for i in range(12):
-    npar_expDatInterp[i,:,:] = expDat_interpol[i] 
+npar_expDatInterp = np.asarray(expDat_interpol)
 
 idx_incl_m4_tQSSA, idx_excl_m4_tQSSA  = fun.filterParamSets(mse, cutoffs, 
                                           npar_expDatInterp, simDat_rel_fracs, 
                                           [0,1,2,5,9], [0.2,0.2,0.15,0.15,0.18]) 
 
 #save final parameter set
-paramset_final_tQSSA = paramsHJ[idx_incl_m4_tQSSA,:]
+# dense selections are more cache-friendly through a boolean mask than
+# through integer fancy indexing; fall back to the latter for sparse ones
+mask_incl = np.zeros(nr_paramsets, dtype=bool)
+mask_incl[idx_incl_m4_tQSSA] = True
+if mask_incl.mean() > 0.1:
+    paramset_final_tQSSA = paramsHJ[mask_incl]
+else:
+    paramset_final_tQSSA = paramsHJ[idx_incl_m4_tQSSA,:]
 np.save(os.path.join(path_paramsets,'paramset_final_tQSSA.npy'),paramset_final_tQSSA)
 
 # Plot MSE distributions and cutoff values for parametersets
@@ -1557,12 +1515,7 @@ plot_MSEdistr('model 4 tQSSA, all experiments', range(12), mse, cutoffs)
 
 # calculate the AIC values for included parametersets of model 4
 
-mse_avg = np.mean(mse,axis=1)
-
-AICs = []
-for i in range(len(mse_avg)):
-    AICs.append(fun.AIC(mse_avg[i], paramsHJ.shape[1], sum(n_obs)))
-AICs = np.asarray(AICs)
+AICs = fun.AIC(mse_avg, paramsHJ.shape[1], N_obs).astype(aic_dtype)
 AIC['model 4 tQSSA, all data'] = AICs[idx_incl_m4_tQSSA]
 
 if plotFigures:
@@ -1572,63 +1525,30 @@ if plotFigures:
     plot_paramDistr('model 4 tQSSA', idx_incl_m4_tQSSA)
     
     # plot distribution of model specific parameters
-    plt.figure(666,figsize=(7.5,4))
-    plt.figure(666).suptitle('model 4 tQSSA, all experiments, additional parameters')
-    
-    plt.subplot(1,6,1)
-    for i in idx_incl_m4_tQSSA:
-        plt.plot(paramsHJ[i,62].T, 'ok',alpha=0.15,ms=5)
-    ax = plt.gca()
-    ax.set_xticks([0])
-    ax.set_xticklabels(['k$_{2, fast}$'])
-    plt.ylabel("parameter value ($s^{-1}$)")
-    
-    plt.subplot(1,6,2)
-    for i in idx_incl_m4_tQSSA:
-        plt.plot(paramsHJ[i,63].T, 'ok',alpha=0.15,ms=5)
-    ax = plt.gca()
-    ax.set_xticks([0])
-    ax.set_xticklabels(['K$_{2, fast}$'])
-    plt.ylabel("parameter value ($M$)")
-    
-    plt.subplot(1,6,3)
-    for i in idx_incl_m4_tQSSA:
-        plt.plot(paramsHJ[i,66].T, 'ok',alpha=0.15,ms=5)
-    ax = plt.gca()
-    ax.set_xticks([0])
-    ax.set_xticklabels(['k$_{3, fast}$'])
-    plt.ylabel("parameter value ($s^{-1}$)")
-    
-    plt.subplot(1,6,4)
-    for i in idx_incl_m4_tQSSA:
-        plt.plot(paramsHJ[i,67].T, 'ok',alpha=0.15,ms=5)
-    ax = plt.gca()
-    ax.set_xticks([0])
-    ax.set_xticklabels(['K$_{3, fast}$'])
-    plt.ylabel("parameter value ($M$)")
-    
-    plt.subplot(1,6,5)
-    for i in idx_incl_m4_tQSSA:
-        plt.plot(paramsHJ[i,64].T, 'ok',alpha=0.15,ms=5)
-    ax = plt.gca()
-    ax.set_xticks([0])
-    ax.set_xticklabels(['$k_{iso,F}$'])
-    plt.ylabel("parameter value ($s^{-1}$)")
-    
-    plt.subplot(1,6,6)
-    for i in idx_incl_m4_tQSSA:
-        plt.plot(paramsHJ[i,65].T, 'ok',alpha=0.15,ms=5)
-    ax = plt.gca()
-    ax.set_xticks([0])
-    ax.set_xticklabels(['$k_{iso,R}$'])
-    plt.ylabel("parameter value ($s^{-1}$)")
-    
+    addParams = [(62,'k$_{2, fast}$','parameter value ($s^{-1}$)'),
+                 (63,'K$_{2, fast}$','parameter value ($M$)'),
+                 (66,'k$_{3, fast}$','parameter value ($s^{-1}$)'),
+                 (67,'K$_{3, fast}$','parameter value ($M$)'),
+                 (64,'$k_{iso,F}$','parameter value ($s^{-1}$)'),
+                 (65,'$k_{iso,R}$','parameter value ($s^{-1}$)')]
+    vals = paramsHJ[np.ix_(idx_incl_m4_tQSSA,[col for col,_,_ in addParams])]
+
+    fig, axes = plt.subplots(1,6,figsize=(7.5,4),num=666,clear=True)
+    fig.suptitle('model 4 tQSSA, all experiments, additional parameters')
+    for ax, (col, lab, unit), v in zip(axes, addParams, vals.T):
+        ax.scatter(np.zeros(v.size), v, c='k', alpha=0.15, s=25)
+        ax.set_xticks([0])
+        ax.set_xticklabels([lab])
+        ax.set_ylabel(unit)
+
     plt.tight_layout()
     
     if saveFigs == True:
-        plt.figure(666,figsize=(3,4))
+        fig = plt.figure(666)
+        fig.set_size_inches(3,4)
         print("figure model4_tQSSA_distrAdditionalParams.svg saved")
-        plt.savefig(os.path.join(path_figures,'model4_tQSSA_distrAdditionalParams.svg'), bbox_inches = "tight")
+        fig.savefig(os.path.join(path_figures,'model4_tQSSA_distrAdditionalParams.svg'), bbox_inches = "tight")
+        plt.close(fig)
 
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -1642,14 +1562,17 @@ print ('\n \n Calculate statistics for AIC:  model 1 and 4, Michaelis Menten vs
 
 #plot AIC distribution for models 1 and 4
 plt.figure(figsize=(4,3))
-minAIC = np.min([np.min(AIC['model 1, all data']), np.min(AIC['model 1 tQSSA, all data']), np.min(AIC['model 4 tQSSA, all data']), np.min(AIC['model 4, all data'])])
-maxAIC = np.max([np.max(AIC['model 1, all data']), np.max(AIC['model 1 tQSSA, all data']), np.max(AIC['model 4 tQSSA, all data']), np.max(AIC['model 4, all data'])])
+aicKeys = ['model 1, all data', 'model 1 tQSSA, all data', 'model 4 tQSSA, all data', 'model 4, all data']
+minAIC = min(AIC[k].min() for k in aicKeys)
+maxAIC = max(AIC[k].max() for k in aicKeys)
 bins = np.linspace(minAIC,maxAIC,25)
 
-plt.hist(AIC['model 1, all data'],bins,color='b',alpha=0.33,label='model 1')
-plt.hist(AIC['model 1 tQSSA, all data'],bins,color='purple',alpha=0.33,label='model 1, tQSSA')
-plt.hist(AIC['model 4, all data'],bins,color='m',alpha=0.33,label='model 4')
-plt.hist(AIC['model 4 tQSSA, all data'],bins,color='r',alpha=0.33,label='model 4,tQSSA')
+for key, c, lab in [('model 1, all data','b','model 1'),
+                     ('model 1 tQSSA, all data','purple','model 1, tQSSA'),
+                     ('model 4, all data','m','model 4'),
+                     ('model 4 tQSSA, all data','r','model 4,tQSSA')]:
+    h, _ = np.histogram(AIC[key], bins)
+    plt.bar(bins[:-1], h, width=np.diff(bins), color=c, alpha=0.33, align='edge', label=lab)
 plt.ylim((0,50))
 plt.yticks([0,25,50])
 plt.legend(['model 1', 'model 1, tQSSA', 'model 4', 'model 4, tQSSA'])
@@ -1660,6 +1583,7 @@ plt.tight_layout()
 if saveFigs == True:
     print("figure AIC_m1m4.svg saved")
     plt.savefig(os.path.join(path_figures,'AIC_m1m4.svg'), bbox_inches = "tight")
+    plt.close()
 
 print('Distribution measures of AIC values')
 print('Model 1:\n', 'mean: ', np.mean(AIC['model 1, all data']), ' SD: ', np.std(AIC['model 1, all data']), ' variance: ', np.var(AIC['model 1, all data']))
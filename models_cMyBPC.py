@@ -21,9 +21,11 @@ This file contains the model codes used for the simulations and analyses in the
 @author: Daniel Koch
 """
 import numpy as np
+from numba import njit
 
 #%% Models used for fitting and comparison to experimental data
 
+@njit(cache=True)
 def cMyBPC_model1(t,ICs,params): 
     
     # Michaelis-Menten type rate laws only
@@ -34,53 +36,93 @@ def cMyBPC_model1(t,ICs,params):
     # parameters
     k = params[0]
     K = params[1]
+    Kinv = 1/K # reciprocals hoisted: the rate laws below multiply instead of divide
+
+    # substrate/K ratios shared by the competition sums and the rate laws
+    P0_K0 = P0*Kinv[0]
+    A_K1 = A*Kinv[1]
+    A_K2 = A*Kinv[2]
+    A_K3 = A*Kinv[3]
+    AB_K4 = AB*Kinv[4]
+    AB_K5 = AB*Kinv[5]
+    AB_K6 = AB*Kinv[6]
+    ABG_K7 = ABG*Kinv[7]
+    ABG_K8 = ABG*Kinv[8]
+    P0_K9 = P0*Kinv[9]
+    D_K10 = D*Kinv[10]
+    D_K11 = D*Kinv[11]
+    A_K12 = A*Kinv[12]
+    AD_K13 = AD*Kinv[13]
+    AD_K14 = AD*Kinv[14]
+    AB_K15 = AB*Kinv[15]
+    ABD_K16 = ABD*Kinv[16]
+    ABD_K17 = ABD*Kinv[17]
+    ABG_K18 = ABG*Kinv[18]
+    ABGD_K19 = ABGD*Kinv[19]
+    ABGD_K20 = ABGD*Kinv[20]
+    D_K21 = D*Kinv[21]
+    AD_K22 = AD*Kinv[22]
+    AD_K23 = AD*Kinv[23]
+    AD_K24 = AD*Kinv[24]
+    ABD_K25 = ABD*Kinv[25]
+    ABD_K26 = ABD*Kinv[26]
+    ABD_K27 = ABD*Kinv[27]
+    ABGD_K28 = ABGD*Kinv[28]
+    ABGD_K29 = ABGD*Kinv[29]
     PKA, PKC, PP1, PP2A = params[2]
     
     # competition terms Kappa
-    K_pka = P0/K[0]+A/K[3]+AB/K[6]+D/K[21]+AD/K[24]+ABD/K[27]
-    K_pkc = P0/K[9]+A/K[12]+AB/K[15]+ABG/K[18]
-    K_pp1 = A/K[1]+AB/K[4]+ABG/K[7]+D/K[10]+AD/K[13]+AD/K[22]+ABD/K[16]+ABD/K[25]+ABGD/K[19]+ABGD/K[28]
-    K_pp2a = A/K[2]+AB/K[5]+ABG/K[8]+D/K[11]+AD/K[14]+AD/K[23]+ABD/K[17]+ABD/K[26]+ABGD/K[20]+ABGD/K[29]
+    K_pka = P0_K0+A_K3+AB_K6+D_K21+AD_K24+ABD_K27
+    K_pkc = P0_K9+A_K12+AB_K15+ABG_K18
+    K_pp1 = A_K1+AB_K4+ABG_K7+D_K10+AD_K13+AD_K22+ABD_K16+ABD_K25+ABGD_K19+ABGD_K28
+    K_pp2a = A_K2+AB_K5+ABG_K8+D_K11+AD_K14+AD_K23+ABD_K17+ABD_K26+ABGD_K20+ABGD_K29
+
+    # each MM denominator K[i]*(1+Kappa-X*Kinv[i])+X collapses to K[i]*(1+Kappa),
+    # so the enzyme/(1+Kappa) factor of each rate family is shared and computed once
+    PKA_eff = PKA/(1+K_pka)
+    PKC_eff = PKC/(1+K_pkc)
+    PP1_eff = PP1/(1+K_pp1)
+    PP2A_eff = PP2A/(1+K_pp2a)
 
     # reaction rates
 
     #PKA
-    v1 = k[0]*PKA*P0/(K[0]*(1+K_pka-P0/K[0])+P0)
-    v4 = k[3]*PKA*A/(K[3]*(1+K_pka-A/K[3])+A)
-    v7 = k[6]*PKA*AB/(K[6]*(1+K_pka-AB/K[6])+AB)
-    v22  = k[21]*PKA*D/(K[21]*(1+K_pka-D/K[21])+D)
-    v25  = k[24]*PKA*AD/(K[24]*(1+K_pka-AD/K[24])+AD)
-    v28  = k[27]*PKA*ABD/(K[27]*(1+K_pka-ABD/K[27])+ABD)
+    v1 = k[0]*P0_K0*PKA_eff
+    v4 = k[3]*A_K3*PKA_eff
+    v7 = k[6]*AB_K6*PKA_eff
+    v22  = k[21]*D_K21*PKA_eff
+    v25  = k[24]*AD_K24*PKA_eff
+    v28  = k[27]*ABD_K27*PKA_eff
      
     #PKC
-    v10  = k[9]*PKC*P0/(K[9]*(1+K_pkc-P0/K[9])+P0)
-    v13  = k[12]*PKC*A/(K[12]*(1+K_pkc-A/K[12])+A)
-    v16  = k[15]*PKC*AB/(K[15]*(1+K_pkc-AB/K[15])+AB)
-    v19  = k[18]*PKC*ABG/(K[18]*(1+K_pkc-ABG/K[18])+ABG)
+    v10  = k[9]*P0_K9*PKC_eff
+    v13  = k[12]*A_K12*PKC_eff
+    v16  = k[15]*AB_K15*PKC_eff
+    v19  = k[18]*ABG_K18*PKC_eff
      
     #PP1
-    v2 = k[1]*PP1*A/(K[1]*(1+K_pp1-A/K[1])+A)
-    v5 = k[4]*PP1*AB/(K[4]*(1+K_pp1-AB/K[4])+AB)
-    v8 = k[7]*PP1*ABG/(K[7]*(1+K_pp1-ABG/K[7])+ABG)
-    v11  = k[10]*PP1*D/(K[10]*(1+K_pp1-D/K[10])+D)
-    v14  = k[13]*PP1*AD/(K[13]*(1+K_pp1-AD/K[13])+AD)
-    v17  = k[16]*PP1*ABD/(K[16]*(1+K_pp1-ABD/K[16])+ABD)
-    v20  = k[19]*PP1*ABGD/(K[19]*(1+K_pp1-ABGD/K[19])+ABGD)
-    v23  = k[22]*PP1*AD/(K[22]*(1+K_pp1-AD/K[22])+AD)
-    v26  = k[25]*PP1*ABD/(K[25]*(1+K_pp1-ABD/K[25])+ABD)
-    v29  = k[28]*PP1*ABGD/(K[28]*(1+K_pp1-ABGD/K[28])+ABGD)
+    v2 = k[1]*A_K1*PP1_eff
+    v5 = k[4]*AB_K4*PP1_eff
+    v8 = k[7]*ABG_K7*PP1_eff
+    v11  = k[10]*D_K10*PP1_eff
+    v14  = k[13]*AD_K13*PP1_eff
+    v17  = k[16]*ABD_K16*PP1_eff
+    v20  = k[19]*ABGD_K19*PP1_eff
+    v23  = k[22]*AD_K22*PP1_eff
+    v26  = k[25]*ABD_K25*PP1_eff
+    v29  = k[28]*ABGD_K28*PP1_eff
      
     #PP2A
-    v3 = k[2]*PP2A*A/(K[2]*(1+K_pp2a-A/K[2])+A)
-    v6 = k[5]*PP2A*AB/(K[5]*(1+K_pp2a-AB/K[5])+AB)
-    v9 = k[8]*PP2A*ABG/(K[8]*(1+K_pp2a-ABG/K[8])+ABG)
-    v12  = k[11]*PP2A*D/(K[11]*(1+K_pp2a-D/K[11])+D)
-    v15  = k[14]*PP2A*AD/(K[14]*(1+K_pp2a-AD/K[14])+AD)
-    v18  = k[17]*PP2A*ABD/(K[17]*(1+K_pp2a-ABD/K[17])+ABD)
-    v21  = k[20]*PP2A*ABGD/(K[20]*(1+K_pp2a-ABGD/K[20])+ABGD)
-    v24  = k[23]*PP2A*AD/(K[23]*(1+K_pp2a-AD/K[23])+AD)
-    v27  = k[26]*PP2A*ABD/(K[26]*(1+K_pp2a-ABD/K[26])+ABD)
-    v30  = k[29]*PP2A*ABGD/(K[29]*(1+K_pp2a-ABGD/K[29])+ABGD)
+    v3 = k[2]*A_K2*PP2A_eff
+    v6 = k[5]*AB_K5*PP2A_eff
+    v9 = k[8]*ABG_K8*PP2A_eff
+    v12  = k[11]*D_K11*PP2A_eff
+    v15  = k[14]*AD_K14*PP2A_eff
+    v18  = k[17]*ABD_K17*PP2A_eff
+    v21  = k[20]*ABGD_K20*PP2A_eff
+    v24  = k[23]*AD_K23*PP2A_eff
+    v27  = k[26]*ABD_K26*PP2A_eff
+    v30  = k[29]*ABGD_K29*PP2A_eff
  
     # ODEs
     dP0dt = v2 + v3 + v11  + v12  - v1 - v10 
@@ -95,8 +137,18 @@ def cMyBPC_model1(t,ICs,params):
     # print('dABDG new: ', dABGDdt, ' v29 ', v29, 'K29: ', K[29], 'Kappa_PP1 ', K_pp1)
 
 
-    return np.array([dP0dt, dAdt, dABdt, dABGdt, dDdt, dADdt, dABDdt, dABGDdt])
+    dx = np.empty(8) # filled in place: avoids the list->array construction per call
+    dx[0] = dP0dt
+    dx[1] = dAdt
+    dx[2] = dABdt
+    dx[3] = dABGdt
+    dx[4] = dDdt
+    dx[5] = dADdt
+    dx[6] = dABDdt
+    dx[7] = dABGDdt
+    return dx
 
+@njit(cache=True)
 def cMyBPC_model1_tQSSA(t,ICs,params): 
     
     # tQSSA type rate laws only
@@ -108,52 +160,90 @@ def cMyBPC_model1_tQSSA(t,ICs,params):
     k = params[0]
     K = params[1]
     PKA, PKC, PP1, PP2A = params[2]
+
+    # substrate/(K+enzyme) ratios shared by the competition sums and the rate laws
+    P0_K0 = P0/(K[0]+PKA)
+    A_K1 = A/(K[1]+PP1)
+    A_K2 = A/(K[2]+PP2A)
+    A_K3 = A/(K[3]+PKA)
+    AB_K4 = AB/(K[4]+PP1)
+    AB_K5 = AB/(K[5]+PP2A)
+    AB_K6 = AB/(K[6]+PKA)
+    ABG_K7 = ABG/(K[7]+PP1)
+    ABG_K8 = ABG/(K[8]+PP2A)
+    P0_K9 = P0/(K[9]+PKC)
+    D_K10 = D/(K[10]+PP1)
+    D_K11 = D/(K[11]+PP2A)
+    A_K12 = A/(K[12]+PKC)
+    AD_K13 = AD/(K[13]+PP1)
+    AD_K14 = AD/(K[14]+PP2A)
+    AB_K15 = AB/(K[15]+PKC)
+    ABD_K16 = ABD/(K[16]+PP1)
+    ABD_K17 = ABD/(K[17]+PP2A)
+    ABG_K18 = ABG/(K[18]+PKC)
+    ABGD_K19 = ABGD/(K[19]+PP1)
+    ABGD_K20 = ABGD/(K[20]+PP2A)
+    D_K21 = D/(K[21]+PKA)
+    AD_K22 = AD/(K[22]+PP1)
+    AD_K23 = AD/(K[23]+PP2A)
+    AD_K24 = AD/(K[24]+PKA)
+    ABD_K25 = ABD/(K[25]+PP1)
+    ABD_K26 = ABD/(K[26]+PP2A)
+    ABD_K27 = ABD/(K[27]+PKA)
+    ABGD_K28 = ABGD/(K[28]+PP1)
+    ABGD_K29 = ABGD/(K[29]+PP2A)
     
     # competition terms Kappa
-    K_pka = P0/(K[0]+PKA)+A/(K[3]+PKA)+AB/(K[6]+PKA)+D/(K[21]+PKA)+AD/(K[24]+PKA)+ABD/(K[27]+PKA)
-    K_pkc = P0/(K[9]+PKC)+A/(K[12]+PKC)+AB/(K[15]+PKC)+ABG/(K[18]+PKC)
-    K_pp1 = A/(K[1]+PP1)+AB/(K[4]+PP1)+ABG/(K[7]+PP1)+D/(K[10]+PP1)+AD/(K[13]+PP1)+AD/(K[22]+PP1)+ABD/(K[16]+PP1)+ABD/(K[25]+PP1)+ABGD/(K[19]+PP1)+ABGD/(K[28]+PP1)
-    K_pp2a = A/(K[2]+PP2A)+AB/(K[5]+PP2A)+ABG/(K[8]+PP2A)+D/(K[11]+PP2A)+AD/(K[14]+PP2A)+AD/(K[23]+PP2A)+ABD/(K[17]+PP2A)+ABD/(K[26]+PP2A)+ABGD/(K[20]+PP2A)+ABGD/(K[29]+PP2A)
+    K_pka = P0_K0+A_K3+AB_K6+D_K21+AD_K24+ABD_K27
+    K_pkc = P0_K9+A_K12+AB_K15+ABG_K18
+    K_pp1 = A_K1+AB_K4+ABG_K7+D_K10+AD_K13+AD_K22+ABD_K16+ABD_K25+ABGD_K19+ABGD_K28
+    K_pp2a = A_K2+AB_K5+ABG_K8+D_K11+AD_K14+AD_K23+ABD_K17+ABD_K26+ABGD_K20+ABGD_K29
+
+    # the enzyme/(1+Kappa) factor of each rate family is shared and computed once
+    PKA_eff = PKA/(1+K_pka)
+    PKC_eff = PKC/(1+K_pkc)
+    PP1_eff = PP1/(1+K_pp1)
+    PP2A_eff = PP2A/(1+K_pp2a)
 
     # reaction rates
 
     #PKA
-    v1 = k[0]*PKA*P0/((K[0]+PKA)*(1+K_pka))
-    v4 = k[3]*PKA*A/((K[3]+PKA)*(1+K_pka))
-    v7 = k[6]*PKA*AB/((K[6]+PKA)*(1+K_pka))
-    v22  = k[21]*PKA*D/((K[21]+PKA)*(1+K_pka))
-    v25  = k[24]*PKA*AD/((K[24]+PKA)*(1+K_pka))
-    v28  = k[27]*PKA*ABD/((K[27]+PKA)*(1+K_pka))
+    v1 = k[0]*P0_K0*PKA_eff
+    v4 = k[3]*A_K3*PKA_eff
+    v7 = k[6]*AB_K6*PKA_eff
+    v22  = k[21]*D_K21*PKA_eff
+    v25  = k[24]*AD_K24*PKA_eff
+    v28  = k[27]*ABD_K27*PKA_eff
      
     #PKC
-    v10  = k[9]*PKC*P0/((K[9]+PKC)*(1+K_pkc))
-    v13  = k[12]*PKC*A/((K[12]+PKC)*(1+K_pkc))
-    v16  = k[15]*PKC*AB/((K[15]+PKC)*(1+K_pkc))
-    v19  = k[18]*PKC*ABG/((K[18]+PKC)*(1+K_pkc))
+    v10  = k[9]*P0_K9*PKC_eff
+    v13  = k[12]*A_K12*PKC_eff
+    v16  = k[15]*AB_K15*PKC_eff
+    v19  = k[18]*ABG_K18*PKC_eff
      
     #PP1
-    v2 = k[1]*PP1*A/((K[1]+PP1)*(1+K_pp1))
-    v5 = k[4]*PP1*AB/((K[4]+PP1)*(1+K_pp1))
-    v8 = k[7]*PP1*ABG/((K[7]+PP1)*(1+K_pp1))
-    v11  = k[10]*PP1*D/((K[10]+PP1)*(1+K_pp1))
-    v14  = k[13]*PP1*AD/((K[13]+PP1)*(1+K_pp1))
-    v17  = k[16]*PP1*ABD/((K[16]+PP1)*(1+K_pp1))
-    v20  = k[19]*PP1*ABGD/((K[19]+PP1)*(1+K_pp1))
-    v23  = k[22]*PP1*AD/((K[22]+PP1)*(1+K_pp1))
-    v26  = k[25]*PP1*ABD/((K[25]+PP1)*(1+K_pp1))
-    v29  = k[28]*PP1*ABGD/((K[28]+PP1)*(1+K_pp1))
+    v2 = k[1]*A_K1*PP1_eff
+    v5 = k[4]*AB_K4*PP1_eff
+    v8 = k[7]*ABG_K7*PP1_eff
+    v11  = k[10]*D_K10*PP1_eff
+    v14  = k[13]*AD_K13*PP1_eff
+    v17  = k[16]*ABD_K16*PP1_eff
+    v20  = k[19]*ABGD_K19*PP1_eff
+    v23  = k[22]*AD_K22*PP1_eff
+    v26  = k[25]*ABD_K25*PP1_eff
+    v29  = k[28]*ABGD_K28*PP1_eff
     
     #PP2A
-    v3 = k[2]*PP2A*A/((K[2]+PP2A)*(1+K_pp2a))
-    v6 = k[5]*PP2A*AB/((K[5]+PP2A)*(1+K_pp2a))
-    v9 = k[8]*PP2A*ABG/((K[8]+PP2A)*(1+K_pp2a))
-    v12  = k[11]*PP2A*D/((K[11]+PP2A)*(1+K_pp2a))
-    v15  = k[14]*PP2A*AD/((K[14]+PP2A)*(1+K_pp2a))
-    v18  = k[17]*PP2A*ABD/((K[17]+PP2A)*(1+K_pp2a))
-    v21  = k[20]*PP2A*ABGD/((K[20]+PP2A)*(1+K_pp2a))
-    v24  = k[23]*PP2A*AD/((K[23]+PP2A)*(1+K_pp2a))
-    v27  = k[26]*PP2A*ABD/((K[26]+PP2A)*(1+K_pp2a))
-    v30  = k[29]*PP2A*ABGD/((K[29]+PP2A)*(1+K_pp2a))
+    v3 = k[2]*A_K2*PP2A_eff
+    v6 = k[5]*AB_K5*PP2A_eff
+    v9 = k[8]*ABG_K8*PP2A_eff
+    v12  = k[11]*D_K11*PP2A_eff
+    v15  = k[14]*AD_K14*PP2A_eff
+    v18  = k[17]*ABD_K17*PP2A_eff
+    v21  = k[20]*ABGD_K20*PP2A_eff
+    v24  = k[23]*AD_K23*PP2A_eff
+    v27  = k[26]*ABD_K26*PP2A_eff
+    v30  = k[29]*ABGD_K29*PP2A_eff
  
     # ODEs
     dP0dt = v2 + v3 + v11  + v12  - v1 - v10 
@@ -168,8 +258,18 @@ def cMyBPC_model1_tQSSA(t,ICs,params):
     # print('dABDG new: ', dABGDdt, ' v29 ', v29, 'K29: ', K[29], 'Kappa_PP1 ', K_pp1)
 
 
-    return np.array([dP0dt, dAdt, dABdt, dABGdt, dDdt, dADdt, dABDdt, dABGDdt])
+    dx = np.empty(8) # filled in place: avoids the list->array construction per call
+    dx[0] = dP0dt
+    dx[1] = dAdt
+    dx[2] = dABdt
+    dx[3] = dABGdt
+    dx[4] = dDdt
+    dx[5] = dADdt
+    dx[6] = dABDdt
+    dx[7] = dABGDdt
+    return dx
 
+@njit(cache=True)
 def cMyBPC_model2(t,ICs,params): 
     
     # Phenomenological model featuring activation of r2
@@ -180,59 +280,100 @@ def cMyBPC_model2(t,ICs,params):
     # parameters
     k = params[0]
     K = params[1]
+    Kinv = 1/K # reciprocals hoisted: the rate laws below multiply instead of divide
+
+    # substrate/K ratios shared by the competition sums and the rate laws
+    P0_K0 = P0*Kinv[0]
+    A_K1 = A*Kinv[1]
+    A_K2 = A*Kinv[2]
+    A_K3 = A*Kinv[3]
+    AB_K4 = AB*Kinv[4]
+    AB_K5 = AB*Kinv[5]
+    AB_K6 = AB*Kinv[6]
+    ABG_K7 = ABG*Kinv[7]
+    ABG_K8 = ABG*Kinv[8]
+    P0_K9 = P0*Kinv[9]
+    D_K10 = D*Kinv[10]
+    D_K11 = D*Kinv[11]
+    A_K12 = A*Kinv[12]
+    AD_K13 = AD*Kinv[13]
+    AD_K14 = AD*Kinv[14]
+    AB_K15 = AB*Kinv[15]
+    ABD_K16 = ABD*Kinv[16]
+    ABD_K17 = ABD*Kinv[17]
+    ABG_K18 = ABG*Kinv[18]
+    ABGD_K19 = ABGD*Kinv[19]
+    ABGD_K20 = ABGD*Kinv[20]
+    D_K21 = D*Kinv[21]
+    AD_K22 = AD*Kinv[22]
+    AD_K23 = AD*Kinv[23]
+    AD_K24 = AD*Kinv[24]
+    ABD_K25 = ABD*Kinv[25]
+    ABD_K26 = ABD*Kinv[26]
+    ABD_K27 = ABD*Kinv[27]
+    ABGD_K28 = ABGD*Kinv[28]
+    ABGD_K29 = ABGD*Kinv[29]
     r2_actF, r2_Ka = params[2]
     PKA, PKC, PP1, PP2A = params[3]
     
     # competition terms Kappa
-    K_pka = P0/K[0]+A/K[3]+AB/K[6]+D/K[21]+AD/K[24]+ABD/K[27]
-    K_pkc = P0/K[9]+A/K[12]+AB/K[15]+ABG/K[18]
-    K_pp1 = A/K[1]+AB/K[4]+ABG/K[7]+D/K[10]+AD/K[13]+AD/K[22]+ABD/K[16]+ABD/K[25]+ABGD/K[19]+ABGD/K[28]
-    K_pp2a = A/K[2]+AB/K[5]+ABG/K[8]+D/K[11]+AD/K[14]+AD/K[23]+ABD/K[17]+ABD/K[26]+ABGD/K[20]+ABGD/K[29]
+    K_pka = P0_K0+A_K3+AB_K6+D_K21+AD_K24+ABD_K27
+    K_pkc = P0_K9+A_K12+AB_K15+ABG_K18
+    K_pp1 = A_K1+AB_K4+ABG_K7+D_K10+AD_K13+AD_K22+ABD_K16+ABD_K25+ABGD_K19+ABGD_K28
+    K_pp2a = A_K2+AB_K5+ABG_K8+D_K11+AD_K14+AD_K23+ABD_K17+ABD_K26+ABGD_K20+ABGD_K29
+
+    # each MM denominator K[i]*(1+Kappa-X*Kinv[i])+X collapses to K[i]*(1+Kappa),
+    # so the enzyme/(1+Kappa) factor of each rate family is shared and computed once
+    PKA_eff = PKA/(1+K_pka)
+    PKC_eff = PKC/(1+K_pkc)
+    PP1_eff = PP1/(1+K_pp1)
+    PP2A_eff = PP2A/(1+K_pp2a)
 
     # reaction rates
 
     #PKA
-    v1 = k[0]*PKA*P0/(K[0]*(1+K_pka-P0/K[0])+P0)
-    v4 = k[3]*PKA*A/(K[3]*(1+K_pka-A/K[3])+A)
-    v7 = k[6]*PKA*AB/(K[6]*(1+K_pka-AB/K[6])+AB)
-    v22  = k[21]*PKA*D/(K[21]*(1+K_pka-D/K[21])+D)
-    v25  = k[24]*PKA*AD/(K[24]*(1+K_pka-AD/K[24])+AD)
-    v28  = k[27]*PKA*ABD/(K[27]*(1+K_pka-ABD/K[27])+ABD)
+    v1 = k[0]*P0_K0*PKA_eff
+    v4 = k[3]*A_K3*PKA_eff
+    v7 = k[6]*AB_K6*PKA_eff
+    v22  = k[21]*D_K21*PKA_eff
+    v25  = k[24]*AD_K24*PKA_eff
+    v28  = k[27]*ABD_K27*PKA_eff
      
     #PKC
-    v10  = k[9]*PKC*P0/(K[9]*(1+K_pkc-P0/K[9])+P0)
-    v13  = k[12]*PKC*A/(K[12]*(1+K_pkc-A/K[12])+A)
-    v16  = k[15]*PKC*AB/(K[15]*(1+K_pkc-AB/K[15])+AB)
-    v19  = k[18]*PKC*ABG/(K[18]*(1+K_pkc-ABG/K[18])+ABG)
+    v10  = k[9]*P0_K9*PKC_eff
+    v13  = k[12]*A_K12*PKC_eff
+    v16  = k[15]*AB_K15*PKC_eff
+    v19  = k[18]*ABG_K18*PKC_eff
      
-    #PP1
-    v2 = k[1]*PP1*A/(K[1]*(1+K_pp1-A/K[1])+A)
-    v5 = k[4]*PP1*AB/(K[4]*(1+K_pp1-AB/K[4])+AB)
-    v8 = k[7]*PP1*ABG/(K[7]*(1+K_pp1-ABG/K[7])+ABG)
-    v11  = k[10]*PP1*D/(K[10]*(1+K_pp1-D/K[10])+D)
-    v14  = k[13]*PP1*AD/(K[13]*(1+K_pp1-AD/K[13])+AD)
-    v17  = k[16]*PP1*ABD/(K[16]*(1+K_pp1-ABD/K[16])+ABD)
-    v20  = k[19]*PP1*ABGD/(K[19]*(1+K_pp1-ABGD/K[19])+ABGD)
-    v23  = k[22]*PP1*AD/(K[22]*(1+K_pp1-AD/K[22])+AD)
-    v26  = k[25]*PP1*ABD/(K[25]*(1+K_pp1-ABD/K[25])+ABD)
-    v29  = k[28]*PP1*ABGD/(K[28]*(1+K_pp1-ABGD/K[28])+ABGD)
-    
-    #activation of r2
-    frac_2P_3P = (AB+ABG+AD+ABD)/(P0+A+AB+ABG+D+AD+ABD+ABGD)
+    #activation of r2, folded into v2 below: one reciprocal for the fraction,
+    # no intermediate v2 to overwrite
+    total_inv = 1/(P0+A+AB+ABG+D+AD+ABD+ABGD)
+    frac_2P_3P = (AB+ABG+AD+ABD)*total_inv
     activationFactor = 1 + r2_actF*frac_2P_3P/(r2_Ka + frac_2P_3P)
-    v2 = v2*activationFactor
+
+    #PP1
+    v2 = activationFactor*k[1]*A_K1*PP1_eff
+    v5 = k[4]*AB_K4*PP1_eff
+    v8 = k[7]*ABG_K7*PP1_eff
+    v11  = k[10]*D_K10*PP1_eff
+    v14  = k[13]*AD_K13*PP1_eff
+    v17  = k[16]*ABD_K16*PP1_eff
+    v20  = k[19]*ABGD_K19*PP1_eff
+    v23  = k[22]*AD_K22*PP1_eff
+    v26  = k[25]*ABD_K25*PP1_eff
+    v29  = k[28]*ABGD_K28*PP1_eff
     
     #PP2A
-    v3 = k[2]*PP2A*A/(K[2]*(1+K_pp2a-A/K[2])+A)
-    v6 = k[5]*PP2A*AB/(K[5]*(1+K_pp2a-AB/K[5])+AB)
-    v9 = k[8]*PP2A*ABG/(K[8]*(1+K_pp2a-ABG/K[8])+ABG)
-    v12  = k[11]*PP2A*D/(K[11]*(1+K_pp2a-D/K[11])+D)
-    v15  = k[14]*PP2A*AD/(K[14]*(1+K_pp2a-AD/K[14])+AD)
-    v18  = k[17]*PP2A*ABD/(K[17]*(1+K_pp2a-ABD/K[17])+ABD)
-    v21  = k[20]*PP2A*ABGD/(K[20]*(1+K_pp2a-ABGD/K[20])+ABGD)
-    v24  = k[23]*PP2A*AD/(K[23]*(1+K_pp2a-AD/K[23])+AD)
-    v27  = k[26]*PP2A*ABD/(K[26]*(1+K_pp2a-ABD/K[26])+ABD)
-    v30  = k[29]*PP2A*ABGD/(K[29]*(1+K_pp2a-ABGD/K[29])+ABGD)
+    v3 = k[2]*A_K2*PP2A_eff
+    v6 = k[5]*AB_K5*PP2A_eff
+    v9 = k[8]*ABG_K8*PP2A_eff
+    v12  = k[11]*D_K11*PP2A_eff
+    v15  = k[14]*AD_K14*PP2A_eff
+    v18  = k[17]*ABD_K17*PP2A_eff
+    v21  = k[20]*ABGD_K20*PP2A_eff
+    v24  = k[23]*AD_K23*PP2A_eff
+    v27  = k[26]*ABD_K26*PP2A_eff
+    v30  = k[29]*ABGD_K29*PP2A_eff
  
     # ODEs
     dP0dt = v2 + v3 + v11  + v12  - v1  - v10 
@@ -244,8 +385,18 @@ def cMyBPC_model2(t,ICs,params):
     dABDdt = v16  + v25  + v29  + v30  - v17  - v18  - v26  - v27  - v28 
     dABGDdt = v19  + v28  - v20  - v21  - v29  - v30 
 
-    return np.array([dP0dt, dAdt, dABdt, dABGdt, dDdt, dADdt, dABDdt, dABGDdt])
+    dx = np.empty(8) # filled in place: avoids the list->array construction per call
+    dx[0] = dP0dt
+    dx[1] = dAdt
+    dx[2] = dABdt
+    dx[3] = dABGdt
+    dx[4] = dDdt
+    dx[5] = dADdt
+    dx[6] = dABDdt
+    dx[7] = dABGDdt
+    return dx
 
+@njit(cache=True)
 def cMyBPC_model3(t,ICs,params): 
     
     # Model featuring allosteric activation of r2
@@ -256,54 +407,94 @@ def cMyBPC_model3(t,ICs,params):
     # parameters
     k = params[0]
     K = params[1]
+    Kinv = 1/K # reciprocals hoisted: the rate laws below multiply instead of divide
+
+    # substrate/K ratios shared by the competition sums and the rate laws
+    P0_K0 = P0*Kinv[0]
+    A_K1 = A*Kinv[1]
+    A_K2 = A*Kinv[2]
+    A_K3 = A*Kinv[3]
+    AB_K4 = AB*Kinv[4]
+    AB_K5 = AB*Kinv[5]
+    AB_K6 = AB*Kinv[6]
+    ABG_K7 = ABG*Kinv[7]
+    ABG_K8 = ABG*Kinv[8]
+    P0_K9 = P0*Kinv[9]
+    D_K10 = D*Kinv[10]
+    D_K11 = D*Kinv[11]
+    A_K12 = A*Kinv[12]
+    AD_K13 = AD*Kinv[13]
+    AD_K14 = AD*Kinv[14]
+    AB_K15 = AB*Kinv[15]
+    ABD_K16 = ABD*Kinv[16]
+    ABD_K17 = ABD*Kinv[17]
+    ABG_K18 = ABG*Kinv[18]
+    ABGD_K19 = ABGD*Kinv[19]
+    ABGD_K20 = ABGD*Kinv[20]
+    D_K21 = D*Kinv[21]
+    AD_K22 = AD*Kinv[22]
+    AD_K23 = AD*Kinv[23]
+    AD_K24 = AD*Kinv[24]
+    ABD_K25 = ABD*Kinv[25]
+    ABD_K26 = ABD*Kinv[26]
+    ABD_K27 = ABD*Kinv[27]
+    ABGD_K28 = ABGD*Kinv[28]
+    ABGD_K29 = ABGD*Kinv[29]
     lambda_r2, kcat_A, Ka = params[2]
     PKA, PKC, PP1, PP2A = params[3]
     
     # competition terms Kappa
-    K_pka = P0/K[0]+A/K[3]+AB/K[6]+D/K[21]+AD/K[24]+ABD/K[27]
-    K_pkc = P0/K[9]+A/K[12]+AB/K[15]+ABG/K[18]
-    K_pp1 = A/K[1]+AB/K[4]+ABG/K[7]+D/K[10]+AD/K[13]+AD/K[22]+ABD/K[16]+ABD/K[25]+ABGD/K[19]+ABGD/K[28]
-    K_pp2a = A/K[2]+AB/K[5]+ABG/K[8]+D/K[11]+AD/K[14]+AD/K[23]+ABD/K[17]+ABD/K[26]+ABGD/K[20]+ABGD/K[29]
+    K_pka = P0_K0+A_K3+AB_K6+D_K21+AD_K24+ABD_K27
+    K_pkc = P0_K9+A_K12+AB_K15+ABG_K18
+    K_pp1 = A_K1+AB_K4+ABG_K7+D_K10+AD_K13+AD_K22+ABD_K16+ABD_K25+ABGD_K19+ABGD_K28
+    K_pp2a = A_K2+AB_K5+ABG_K8+D_K11+AD_K14+AD_K23+ABD_K17+ABD_K26+ABGD_K20+ABGD_K29
+
+    # each MM denominator K[i]*(1+Kappa-X*Kinv[i])+X collapses to K[i]*(1+Kappa),
+    # so the enzyme/(1+Kappa) factor of each rate family is shared and computed once
+    PKA_eff = PKA/(1+K_pka)
+    PKC_eff = PKC/(1+K_pkc)
+    PP1_eff = PP1/(1+K_pp1)
+    PP2A_eff = PP2A/(1+K_pp2a)
 
     # reaction rates
 
     #PKA and RSK2
-    v1 = k[0]*PKA*P0/(K[0]*(1+K_pka-P0/K[0])+P0)
-    v4 = k[3]*PKA*A/(K[3]*(1+K_pka-A/K[3])+A)
-    v7 = k[6]*PKA*AB/(K[6]*(1+K_pka-AB/K[6])+AB)
-    v22  = k[21]*PKA*D/(K[21]*(1+K_pka-D/K[21])+D)
-    v25  = k[24]*PKA*AD/(K[24]*(1+K_pka-AD/K[24])+AD)
-    v28  = k[27]*PKA*ABD/(K[27]*(1+K_pka-ABD/K[27])+ABD)
+    v1 = k[0]*P0_K0*PKA_eff
+    v4 = k[3]*A_K3*PKA_eff
+    v7 = k[6]*AB_K6*PKA_eff
+    v22  = k[21]*D_K21*PKA_eff
+    v25  = k[24]*AD_K24*PKA_eff
+    v28  = k[27]*ABD_K27*PKA_eff
      
     #PKC
-    v10  = k[9]*PKC*P0/(K[9]*(1+K_pkc-P0/K[9])+P0)
-    v13  = k[12]*PKC*A/(K[12]*(1+K_pkc-A/K[12])+A)
-    v16  = k[15]*PKC*AB/(K[15]*(1+K_pkc-AB/K[15])+AB)
-    v19  = k[18]*PKC*ABG/(K[18]*(1+K_pkc-ABG/K[18])+ABG)
+    v10  = k[9]*P0_K9*PKC_eff
+    v13  = k[12]*A_K12*PKC_eff
+    v16  = k[15]*AB_K15*PKC_eff
+    v19  = k[18]*ABG_K18*PKC_eff
      
     #PP1
-    v2 = (k[1]*PP1*A+kcat_A*PP1*A*(AD+AB)/(lambda_r2*Ka))/((K[1] + (AD+AB)*K[1]/Ka + A*(AD+AB)/(lambda_r2*Ka)+K[1]*(K_pp1-(A/K[1]))+A))
-    v5 = k[4]*PP1*AB/(K[4]*(1+K_pp1-AB/K[4])+AB)
-    v8 = k[7]*PP1*ABG/(K[7]*(1+K_pp1-ABG/K[7])+ABG)
-    v11  = k[10]*PP1*D/(K[10]*(1+K_pp1-D/K[10])+D)
-    v14  = k[13]*PP1*AD/(K[13]*(1+K_pp1-AD/K[13])+AD)
-    v17  = k[16]*PP1*ABD/(K[16]*(1+K_pp1-ABD/K[16])+ABD)
-    v20  = k[19]*PP1*ABGD/(K[19]*(1+K_pp1-ABGD/K[19])+ABGD)
-    v23  = k[22]*PP1*AD/(K[22]*(1+K_pp1-AD/K[22])+AD)
-    v26  = k[25]*PP1*ABD/(K[25]*(1+K_pp1-ABD/K[25])+ABD)
-    v29  = k[28]*PP1*ABGD/(K[28]*(1+K_pp1-ABGD/K[28])+ABGD)
+    v2 = (k[1]*PP1*A+kcat_A*PP1*A*(AD+AB)/(lambda_r2*Ka))/((K[1] + (AD+AB)*K[1]/Ka + A*(AD+AB)/(lambda_r2*Ka)+K[1]*(K_pp1-(A_K1))+A))
+    v5 = k[4]*AB_K4*PP1_eff
+    v8 = k[7]*ABG_K7*PP1_eff
+    v11  = k[10]*D_K10*PP1_eff
+    v14  = k[13]*AD_K13*PP1_eff
+    v17  = k[16]*ABD_K16*PP1_eff
+    v20  = k[19]*ABGD_K19*PP1_eff
+    v23  = k[22]*AD_K22*PP1_eff
+    v26  = k[25]*ABD_K25*PP1_eff
+    v29  = k[28]*ABGD_K28*PP1_eff
      
     #PP2A
-    v3 = k[2]*PP2A*A/(K[2]*(1+K_pp2a-A/K[2])+A)
-    v6 = k[5]*PP2A*AB/(K[5]*(1+K_pp2a-AB/K[5])+AB)
-    v9 = k[8]*PP2A*ABG/(K[8]*(1+K_pp2a-ABG/K[8])+ABG)
-    v12  = k[11]*PP2A*D/(K[11]*(1+K_pp2a-D/K[11])+D)
-    v15  = k[14]*PP2A*AD/(K[14]*(1+K_pp2a-AD/K[14])+AD)
-    v18  = k[17]*PP2A*ABD/(K[17]*(1+K_pp2a-ABD/K[17])+ABD)
-    v21  = k[20]*PP2A*ABGD/(K[20]*(1+K_pp2a-ABGD/K[20])+ABGD)
-    v24  = k[23]*PP2A*AD/(K[23]*(1+K_pp2a-AD/K[23])+AD)
-    v27  = k[26]*PP2A*ABD/(K[26]*(1+K_pp2a-ABD/K[26])+ABD)
-    v30  = k[29]*PP2A*ABGD/(K[29]*(1+K_pp2a-ABGD/K[29])+ABGD)
+    v3 = k[2]*A_K2*PP2A_eff
+    v6 = k[5]*AB_K5*PP2A_eff
+    v9 = k[8]*ABG_K8*PP2A_eff
+    v12  = k[11]*D_K11*PP2A_eff
+    v15  = k[14]*AD_K14*PP2A_eff
+    v18  = k[17]*ABD_K17*PP2A_eff
+    v21  = k[20]*ABGD_K20*PP2A_eff
+    v24  = k[23]*AD_K23*PP2A_eff
+    v27  = k[26]*ABD_K26*PP2A_eff
+    v30  = k[29]*ABGD_K29*PP2A_eff
  
     # ODEs
     dP0dt = v2 + v3 + v11  + v12  - v1 - v10 
@@ -315,8 +506,18 @@ def cMyBPC_model3(t,ICs,params):
     dABDdt = v16  + v25  + v29  + v30  - v17  - v18  - v26  - v27  - v28 
     dABGDdt = v19  + v28  - v20  - v21  - v29  - v30 
 
-    return np.array([dP0dt, dAdt, dABdt, dABGdt, dDdt, dADdt, dABDdt, dABGDdt])
+    dx = np.empty(8) # filled in place: avoids the list->array construction per call
+    dx[0] = dP0dt
+    dx[1] = dAdt
+    dx[2] = dABdt
+    dx[3] = dABGdt
+    dx[4] = dDdt
+    dx[5] = dADdt
+    dx[6] = dABDdt
+    dx[7] = dABGDdt
+    return dx
 
+@njit(cache=True)
 def cMyBPC_model4(t,ICs,params): 
     
     # Structural transition model for alpha species during PP1 dephosphorylation
@@ -327,55 +528,95 @@ def cMyBPC_model4(t,ICs,params):
     # parameters
     k = params[0]
     K = params[1]
+    Kinv = 1/K # reciprocals hoisted: the rate laws below multiply instead of divide
+
+    # substrate/K ratios shared by the competition sums and the rate laws
+    P0_K0 = P0*Kinv[0]
+    A_K1 = A*Kinv[1]
+    A_K2 = A*Kinv[2]
+    A_K3 = A*Kinv[3]
+    AB_K4 = AB*Kinv[4]
+    AB_K5 = AB*Kinv[5]
+    AB_K6 = AB*Kinv[6]
+    ABG_K7 = ABG*Kinv[7]
+    ABG_K8 = ABG*Kinv[8]
+    P0_K9 = P0*Kinv[9]
+    D_K10 = D*Kinv[10]
+    D_K11 = D*Kinv[11]
+    A_K12 = A*Kinv[12]
+    AD_K13 = AD*Kinv[13]
+    AD_K14 = AD*Kinv[14]
+    AB_K15 = AB*Kinv[15]
+    ABD_K16 = ABD*Kinv[16]
+    ABD_K17 = ABD*Kinv[17]
+    ABG_K18 = ABG*Kinv[18]
+    ABGD_K19 = ABGD*Kinv[19]
+    ABGD_K20 = ABGD*Kinv[20]
+    D_K21 = D*Kinv[21]
+    AD_K22 = AD*Kinv[22]
+    AD_K23 = AD*Kinv[23]
+    AD_K24 = AD*Kinv[24]
+    ABD_K25 = ABD*Kinv[25]
+    ABD_K26 = ABD*Kinv[26]
+    ABD_K27 = ABD*Kinv[27]
+    ABGD_K28 = ABGD*Kinv[28]
+    ABGD_K29 = ABGD*Kinv[29]
     k2_fast, K2_fast, k_isoF, k_isoR = params[2]
     PKA, PKC, PP1, PP2A = params[3]
        
     # competition terms Kappa
-    K_pka = P0/K[0]+A/K[3]+AB/K[6]+D/K[21]+AD/K[24]+ABD/K[27]
-    K_pkc = P0/K[9]+A/K[12]+AB/K[15]+ABG/K[18]
-    K_pp1 = A/K[1]+AB/K[4]+ABG/K[7]+D/K[10]+AD/K[13]+AD/K[22]+ABD/K[16]+ABD/K[25]+ABGD/K[19]+ABGD/K[28]+Atr/K2_fast
-    K_pp2a = A/K[2]+AB/K[5]+ABG/K[8]+D/K[11]+AD/K[14]+AD/K[23]+ABD/K[17]+ABD/K[26]+ABGD/K[20]+ABGD/K[29]
+    K_pka = P0_K0+A_K3+AB_K6+D_K21+AD_K24+ABD_K27
+    K_pkc = P0_K9+A_K12+AB_K15+ABG_K18
+    K_pp1 = A_K1+AB_K4+ABG_K7+D_K10+AD_K13+AD_K22+ABD_K16+ABD_K25+ABGD_K19+ABGD_K28+Atr/K2_fast
+    K_pp2a = A_K2+AB_K5+ABG_K8+D_K11+AD_K14+AD_K23+ABD_K17+ABD_K26+ABGD_K20+ABGD_K29
+
+    # each MM denominator K[i]*(1+Kappa-X*Kinv[i])+X collapses to K[i]*(1+Kappa),
+    # so the enzyme/(1+Kappa) factor of each rate family is shared and computed once
+    PKA_eff = PKA/(1+K_pka)
+    PKC_eff = PKC/(1+K_pkc)
+    PP1_eff = PP1/(1+K_pp1)
+    PP2A_eff = PP2A/(1+K_pp2a)
 
     # reaction rates
 
     #PKA
-    v1 = k[0]*PKA*P0/(K[0]*(1+K_pka-P0/K[0])+P0)
-    v4 = k[3]*PKA*A/(K[3]*(1+K_pka-A/K[3])+A)
-    v7 = k[6]*PKA*AB/(K[6]*(1+K_pka-AB/K[6])+AB)
-    v22  = k[21]*PKA*D/(K[21]*(1+K_pka-D/K[21])+D)
-    v25  = k[24]*PKA*AD/(K[24]*(1+K_pka-AD/K[24])+AD)
-    v28  = k[27]*PKA*ABD/(K[27]*(1+K_pka-ABD/K[27])+ABD)
+    v1 = k[0]*P0_K0*PKA_eff
+    v4 = k[3]*A_K3*PKA_eff
+    v7 = k[6]*AB_K6*PKA_eff
+    v22  = k[21]*D_K21*PKA_eff
+    v25  = k[24]*AD_K24*PKA_eff
+    v28  = k[27]*ABD_K27*PKA_eff
      
     #PKC
-    v10  = k[9]*PKC*P0/(K[9]*(1+K_pkc-P0/K[9])+P0)
-    v13  = k[12]*PKC*A/(K[12]*(1+K_pkc-A/K[12])+A)
-    v16  = k[15]*PKC*AB/(K[15]*(1+K_pkc-AB/K[15])+AB)
-    v19  = k[18]*PKC*ABG/(K[18]*(1+K_pkc-ABG/K[18])+ABG)
+    v10  = k[9]*P0_K9*PKC_eff
+    v13  = k[12]*A_K12*PKC_eff
+    v16  = k[15]*AB_K15*PKC_eff
+    v19  = k[18]*ABG_K18*PKC_eff
      
     #PP1
-    v2 = k[1]*PP1*A/(K[1]*(1+K_pp1-A/K[1])+A)
-    v2_fast = k2_fast*PP1*Atr/(K2_fast*(1+K_pp1-Atr/K2_fast)+Atr)
-    v5 = k[4]*PP1*AB/(K[4]*(1+K_pp1-AB/K[4])+AB)
-    v8 = k[7]*PP1*ABG/(K[7]*(1+K_pp1-ABG/K[7])+ABG)
-    v11  = k[10]*PP1*D/(K[10]*(1+K_pp1-D/K[10])+D)
-    v14  = k[13]*PP1*AD/(K[13]*(1+K_pp1-AD/K[13])+AD)
-    v17  = k[16]*PP1*ABD/(K[16]*(1+K_pp1-ABD/K[16])+ABD)
-    v20  = k[19]*PP1*ABGD/(K[19]*(1+K_pp1-ABGD/K[19])+ABGD)
-    v23  = k[22]*PP1*AD/(K[22]*(1+K_pp1-AD/K[22])+AD)
-    v26  = k[25]*PP1*ABD/(K[25]*(1+K_pp1-ABD/K[25])+ABD)
-    v29  = k[28]*PP1*ABGD/(K[28]*(1+K_pp1-ABGD/K[28])+ABGD)
+    v2 = k[1]*A_K1*PP1_eff
+    v2_fast = k2_fast*Atr*PP1_eff/K2_fast
+    v5 = k[4]*AB_K4*PP1_eff
+    v8 = k[7]*ABG_K7*PP1_eff
+    v11  = k[10]*D_K10*PP1_eff
+    v14  = k[13]*AD_K13*PP1_eff
+    v17  = k[16]*ABD_K16*PP1_eff
+    v20  = k[19]*ABGD_K19*PP1_eff
+    v23  = k[22]*AD_K22*PP1_eff
+    v26  = k[25]*ABD_K25*PP1_eff
+    v29  = k[28]*ABGD_K28*PP1_eff
      
     #PP2A
-    v3 = k[2]*PP2A*A/(K[2]*(1+K_pp2a-A/K[2])+A)
-    v6 = k[5]*PP2A*AB/(K[5]*(1+K_pp2a-AB/K[5])+AB)
-    v9 = k[8]*PP2A*ABG/(K[8]*(1+K_pp2a-ABG/K[8])+ABG)
-    v12  = k[11]*PP2A*D/(K[11]*(1+K_pp2a-D/K[11])+D)
-    v15  = k[14]*PP2A*AD/(K[14]*(1+K_pp2a-AD/K[14])+AD)
-    v18  = k[17]*PP2A*ABD/(K[17]*(1+K_pp2a-ABD/K[17])+ABD)
-    v21  = k[20]*PP2A*ABGD/(K[20]*(1+K_pp2a-ABGD/K[20])+ABGD)
-    v24  = k[23]*PP2A*AD/(K[23]*(1+K_pp2a-AD/K[23])+AD)
-    v27  = k[26]*PP2A*ABD/(K[26]*(1+K_pp2a-ABD/K[26])+ABD)
-    v30  = k[29]*PP2A*ABGD/(K[29]*(1+K_pp2a-ABGD/K[29])+ABGD)
+    v3 = k[2]*A_K2*PP2A_eff
+    v6 = k[5]*AB_K5*PP2A_eff
+    v9 = k[8]*ABG_K8*PP2A_eff
+    v12  = k[11]*D_K11*PP2A_eff
+    v15  = k[14]*AD_K14*PP2A_eff
+    v18  = k[17]*ABD_K17*PP2A_eff
+    v21  = k[20]*ABGD_K20*PP2A_eff
+    v24  = k[23]*AD_K23*PP2A_eff
+    v27  = k[26]*ABD_K26*PP2A_eff
+    v30  = k[29]*ABGD_K29*PP2A_eff
     
     #isomerization
     v_isoF = k_isoF*Atr
@@ -392,8 +633,19 @@ def cMyBPC_model4(t,ICs,params):
     dABDdt = v16  + v25  + v29  + v30  - v17  - v18  - v26  - v27  - v28 
     dABGDdt = v19  + v28  - v20  - v21  - v29  - v30 
     
-    return np.array([dP0dt, dAdt, dAtr, dABdt, dABGdt, dDdt, dADdt, dABDdt, dABGDdt])
+    dx = np.empty(9) # filled in place: avoids the list->array construction per call
+    dx[0] = dP0dt
+    dx[1] = dAdt
+    dx[2] = dAtr
+    dx[3] = dABdt
+    dx[4] = dABGdt
+    dx[5] = dDdt
+    dx[6] = dADdt
+    dx[7] = dABDdt
+    dx[8] = dABGDdt
+    return dx
 
+@njit(cache=True)
 def cMyBPC_model4_full(t,ICs,params): 
     
     # Structural transition model for alpha species during PP1 and PP2A dephosphorylation
@@ -404,57 +656,97 @@ def cMyBPC_model4_full(t,ICs,params):
     # parameters
     k = params[0]
     K = params[1]
+    Kinv = 1/K # reciprocals hoisted: the rate laws below multiply instead of divide
+
+    # substrate/K ratios shared by the competition sums and the rate laws
+    P0_K0 = P0*Kinv[0]
+    A_K1 = A*Kinv[1]
+    A_K2 = A*Kinv[2]
+    A_K3 = A*Kinv[3]
+    AB_K4 = AB*Kinv[4]
+    AB_K5 = AB*Kinv[5]
+    AB_K6 = AB*Kinv[6]
+    ABG_K7 = ABG*Kinv[7]
+    ABG_K8 = ABG*Kinv[8]
+    P0_K9 = P0*Kinv[9]
+    D_K10 = D*Kinv[10]
+    D_K11 = D*Kinv[11]
+    A_K12 = A*Kinv[12]
+    AD_K13 = AD*Kinv[13]
+    AD_K14 = AD*Kinv[14]
+    AB_K15 = AB*Kinv[15]
+    ABD_K16 = ABD*Kinv[16]
+    ABD_K17 = ABD*Kinv[17]
+    ABG_K18 = ABG*Kinv[18]
+    ABGD_K19 = ABGD*Kinv[19]
+    ABGD_K20 = ABGD*Kinv[20]
+    D_K21 = D*Kinv[21]
+    AD_K22 = AD*Kinv[22]
+    AD_K23 = AD*Kinv[23]
+    AD_K24 = AD*Kinv[24]
+    ABD_K25 = ABD*Kinv[25]
+    ABD_K26 = ABD*Kinv[26]
+    ABD_K27 = ABD*Kinv[27]
+    ABGD_K28 = ABGD*Kinv[28]
+    ABGD_K29 = ABGD*Kinv[29]
     k2_fast, K2_fast, k_isoF, k_isoR, k3_fast, K3_fast = params[2]
    
     PKA, PKC, PP1, PP2A = params[3]
        
     # competition terms Kappa
-    K_pka = P0/K[0]+A/K[3]+AB/K[6]+D/K[21]+AD/K[24]+ABD/K[27]
-    K_pkc = P0/K[9]+A/K[12]+AB/K[15]+ABG/K[18]
-    K_pp1 = A/K[1]+AB/K[4]+ABG/K[7]+D/K[10]+AD/K[13]+AD/K[22]+ABD/K[16]+ABD/K[25]+ABGD/K[19]+ABGD/K[28]+Atr/K2_fast
-    K_pp2a = A/K[2]+AB/K[5]+ABG/K[8]+D/K[11]+AD/K[14]+AD/K[23]+ABD/K[17]+ABD/K[26]+ABGD/K[20]+ABGD/K[29]+Atr/K3_fast
+    K_pka = P0_K0+A_K3+AB_K6+D_K21+AD_K24+ABD_K27
+    K_pkc = P0_K9+A_K12+AB_K15+ABG_K18
+    K_pp1 = A_K1+AB_K4+ABG_K7+D_K10+AD_K13+AD_K22+ABD_K16+ABD_K25+ABGD_K19+ABGD_K28+Atr/K2_fast
+    K_pp2a = A_K2+AB_K5+ABG_K8+D_K11+AD_K14+AD_K23+ABD_K17+ABD_K26+ABGD_K20+ABGD_K29+Atr/K3_fast
+
+    # each MM denominator K[i]*(1+Kappa-X*Kinv[i])+X collapses to K[i]*(1+Kappa),
+    # so the enzyme/(1+Kappa) factor of each rate family is shared and computed once
+    PKA_eff = PKA/(1+K_pka)
+    PKC_eff = PKC/(1+K_pkc)
+    PP1_eff = PP1/(1+K_pp1)
+    PP2A_eff = PP2A/(1+K_pp2a)
 
     # reaction rates
 
     #PKA
-    v1 = k[0]*PKA*P0/(K[0]*(1+K_pka-P0/K[0])+P0)
-    v4 = k[3]*PKA*A/(K[3]*(1+K_pka-A/K[3])+A)
-    v7 = k[6]*PKA*AB/(K[6]*(1+K_pka-AB/K[6])+AB)
-    v22  = k[21]*PKA*D/(K[21]*(1+K_pka-D/K[21])+D)
-    v25  = k[24]*PKA*AD/(K[24]*(1+K_pka-AD/K[24])+AD)
-    v28  = k[27]*PKA*ABD/(K[27]*(1+K_pka-ABD/K[27])+ABD)
+    v1 = k[0]*P0_K0*PKA_eff
+    v4 = k[3]*A_K3*PKA_eff
+    v7 = k[6]*AB_K6*PKA_eff
+    v22  = k[21]*D_K21*PKA_eff
+    v25  = k[24]*AD_K24*PKA_eff
+    v28  = k[27]*ABD_K27*PKA_eff
      
     #PKC
-    v10  = k[9]*PKC*P0/(K[9]*(1+K_pkc-P0/K[9])+P0)
-    v13  = k[12]*PKC*A/(K[12]*(1+K_pkc-A/K[12])+A)
-    v16  = k[15]*PKC*AB/(K[15]*(1+K_pkc-AB/K[15])+AB)
-    v19  = k[18]*PKC*ABG/(K[18]*(1+K_pkc-ABG/K[18])+ABG)
+    v10  = k[9]*P0_K9*PKC_eff
+    v13  = k[12]*A_K12*PKC_eff
+    v16  = k[15]*AB_K15*PKC_eff
+    v19  = k[18]*ABG_K18*PKC_eff
      
     #PP1
-    v2 = k[1]*PP1*A/(K[1]*(1+K_pp1-A/K[1])+A)
-    v2_fast = k2_fast*PP1*Atr/(K2_fast*(1+K_pp1-Atr/K2_fast)+Atr)
-    v5 = k[4]*PP1*AB/(K[4]*(1+K_pp1-AB/K[4])+AB)
-    v8 = k[7]*PP1*ABG/(K[7]*(1+K_pp1-ABG/K[7])+ABG)
-    v11  = k[10]*PP1*D/(K[10]*(1+K_pp1-D/K[10])+D)
-    v14  = k[13]*PP1*AD/(K[13]*(1+K_pp1-AD/K[13])+AD)
-    v17  = k[16]*PP1*ABD/(K[16]*(1+K_pp1-ABD/K[16])+ABD)
-    v20  = k[19]*PP1*ABGD/(K[19]*(1+K_pp1-ABGD/K[19])+ABGD)
-    v23  = k[22]*PP1*AD/(K[22]*(1+K_pp1-AD/K[22])+AD)
-    v26  = k[25]*PP1*ABD/(K[25]*(1+K_pp1-ABD/K[25])+ABD)
-    v29  = k[28]*PP1*ABGD/(K[28]*(1+K_pp1-ABGD/K[28])+ABGD)
+    v2 = k[1]*A_K1*PP1_eff
+    v2_fast = k2_fast*Atr*PP1_eff/K2_fast
+    v5 = k[4]*AB_K4*PP1_eff
+    v8 = k[7]*ABG_K7*PP1_eff
+    v11  = k[10]*D_K10*PP1_eff
+    v14  = k[13]*AD_K13*PP1_eff
+    v17  = k[16]*ABD_K16*PP1_eff
+    v20  = k[19]*ABGD_K19*PP1_eff
+    v23  = k[22]*AD_K22*PP1_eff
+    v26  = k[25]*ABD_K25*PP1_eff
+    v29  = k[28]*ABGD_K28*PP1_eff
      
     #PP2A
-    v3 = k[2]*PP2A*A/(K[2]*(1+K_pp2a-A/K[2])+A)
-    v3_fast = k3_fast*PP2A*Atr/(K3_fast*(1+K_pp2a-Atr/K3_fast)+Atr)
-    v6 = k[5]*PP2A*AB/(K[5]*(1+K_pp2a-AB/K[5])+AB)
-    v9 = k[8]*PP2A*ABG/(K[8]*(1+K_pp2a-ABG/K[8])+ABG)
-    v12  = k[11]*PP2A*D/(K[11]*(1+K_pp2a-D/K[11])+D)
-    v15  = k[14]*PP2A*AD/(K[14]*(1+K_pp2a-AD/K[14])+AD)
-    v18  = k[17]*PP2A*ABD/(K[17]*(1+K_pp2a-ABD/K[17])+ABD)
-    v21  = k[20]*PP2A*ABGD/(K[20]*(1+K_pp2a-ABGD/K[20])+ABGD)
-    v24  = k[23]*PP2A*AD/(K[23]*(1+K_pp2a-AD/K[23])+AD)
-    v27  = k[26]*PP2A*ABD/(K[26]*(1+K_pp2a-ABD/K[26])+ABD)
-    v30  = k[29]*PP2A*ABGD/(K[29]*(1+K_pp2a-ABGD/K[29])+ABGD)
+    v3 = k[2]*A_K2*PP2A_eff
+    v3_fast = k3_fast*Atr*PP2A_eff/K3_fast
+    v6 = k[5]*AB_K5*PP2A_eff
+    v9 = k[8]*ABG_K8*PP2A_eff
+    v12  = k[11]*D_K11*PP2A_eff
+    v15  = k[14]*AD_K14*PP2A_eff
+    v18  = k[17]*ABD_K17*PP2A_eff
+    v21  = k[20]*ABGD_K20*PP2A_eff
+    v24  = k[23]*AD_K23*PP2A_eff
+    v27  = k[26]*ABD_K26*PP2A_eff
+    v30  = k[29]*ABGD_K29*PP2A_eff
     
     #isomerization
     v_isoF = k_isoF*Atr
@@ -471,8 +763,19 @@ def cMyBPC_model4_full(t,ICs,params):
     dABDdt = v16  + v25  + v29  + v30  - v17  - v18  - v26  - v27  - v28 
     dABGDdt = v19  + v28  - v20  - v21  - v29  - v30 
 
-    return np.array([dP0dt, dAdt, dAtr, dABdt, dABGdt, dDdt, dADdt, dABDdt, dABGDdt])
+    dx = np.empty(9) # filled in place: avoids the list->array construction per call
+    dx[0] = dP0dt
+    dx[1] = dAdt
+    dx[2] = dAtr
+    dx[3] = dABdt
+    dx[4] = dABGdt
+    dx[5] = dDdt
+    dx[6] = dADdt
+    dx[7] = dABDdt
+    dx[8] = dABGDdt
+    return dx
 
+@njit(cache=True)
 def cMyBPC_model4_full_tQSSA(t,ICs,params): 
     
     # Structural transition model for alpha species during PP1 and PP2A dephosphorylation
@@ -486,55 +789,97 @@ def cMyBPC_model4_full_tQSSA(t,ICs,params):
     k2_fast, K2_fast, k_isoF, k_isoR, k3_fast, K3_fast = params[2]
    
     PKA, PKC, PP1, PP2A = params[3]
+
+    # substrate/(K+enzyme) ratios shared by the competition sums and the rate laws
+    P0_K0 = P0/(K[0]+PKA)
+    A_K1 = A/(K[1]+PP1)
+    A_K2 = A/(K[2]+PP2A)
+    A_K3 = A/(K[3]+PKA)
+    A_Atr_K3 = (A+Atr)/(K[3]+PKA)
+    AB_K4 = AB/(K[4]+PP1)
+    AB_K5 = AB/(K[5]+PP2A)
+    AB_K6 = AB/(K[6]+PKA)
+    ABG_K7 = ABG/(K[7]+PP1)
+    ABG_K8 = ABG/(K[8]+PP2A)
+    P0_K9 = P0/(K[9]+PKC)
+    D_K10 = D/(K[10]+PP1)
+    D_K11 = D/(K[11]+PP2A)
+    A_K12 = A/(K[12]+PKC)
+    A_Atr_K12 = (A+Atr)/(K[12]+PKC)
+    AD_K13 = AD/(K[13]+PP1)
+    AD_K14 = AD/(K[14]+PP2A)
+    AB_K15 = AB/(K[15]+PKC)
+    ABD_K16 = ABD/(K[16]+PP1)
+    ABD_K17 = ABD/(K[17]+PP2A)
+    ABG_K18 = ABG/(K[18]+PKC)
+    ABGD_K19 = ABGD/(K[19]+PP1)
+    ABGD_K20 = ABGD/(K[20]+PP2A)
+    D_K21 = D/(K[21]+PKA)
+    AD_K22 = AD/(K[22]+PP1)
+    AD_K23 = AD/(K[23]+PP2A)
+    AD_K24 = AD/(K[24]+PKA)
+    ABD_K25 = ABD/(K[25]+PP1)
+    ABD_K26 = ABD/(K[26]+PP2A)
+    ABD_K27 = ABD/(K[27]+PKA)
+    ABGD_K28 = ABGD/(K[28]+PP1)
+    ABGD_K29 = ABGD/(K[29]+PP2A)
+    Atr_K2f = Atr/(K2_fast+PP1)
+    Atr_K3f = Atr/(K3_fast+PP2A)
        
     # competition terms Kappa
-    K_pka = P0/(K[0]+PKA)+(A+Atr)/(K[3]+PKA)+AB/(K[6]+PKA)+D/(K[21]+PKA)+AD/(K[24]+PKA)+ABD/(K[27]+PKA)
-    K_pkc = P0/(K[9]+PKC)+(A+Atr)/(K[12]+PKC)+AB/(K[15]+PKC)+ABG/(K[18]+PKC)
-    K_pp1 = A/(K[1]+PP1)+AB/(K[4]+PP1)+ABG/(K[7]+PP1)+D/(K[10]+PP1)+AD/(K[13]+PP1)+AD/(K[22]+PP1)+ABD/(K[16]+PP1)+ABD/(K[25]+PP1)+ABGD/(K[19]+PP1)+ABGD/(K[28]+PP1)+Atr/(K2_fast+PP1)
-    K_pp2a = A/(K[2]+PP2A)+AB/(K[5]+PP2A)+ABG/(K[8]+PP2A)+D/(K[11]+PP2A)+AD/(K[14]+PP2A)+AD/(K[23]+PP2A)+ABD/(K[17]+PP2A)+ABD/(K[26]+PP2A)+ABGD/(K[20]+PP2A)+ABGD/(K[29]+PP2A)+Atr/(K3_fast+PP2A)
+    K_pka = P0_K0+A_Atr_K3+AB_K6+D_K21+AD_K24+ABD_K27
+    K_pkc = P0_K9+A_Atr_K12+AB_K15+ABG_K18
+    K_pp1 = A_K1+AB_K4+ABG_K7+D_K10+AD_K13+AD_K22+ABD_K16+ABD_K25+ABGD_K19+ABGD_K28+Atr_K2f
+    K_pp2a = A_K2+AB_K5+ABG_K8+D_K11+AD_K14+AD_K23+ABD_K17+ABD_K26+ABGD_K20+ABGD_K29+Atr_K3f
+
 
+    # the enzyme/(1+Kappa) factor of each rate family is shared and computed once
+    PKA_eff = PKA/(1+K_pka)
+    PKC_eff = PKC/(1+K_pkc)
+    PP1_eff = PP1/(1+K_pp1)
+    PP2A_eff = PP2A/(1+K_pp2a)
 
     # reaction rates
 
     #PKA   
-    v1 = k[0]*PKA*P0/((K[0]+PKA)*(1+K_pka))
-    v4 = k[3]*PKA*A/((K[3]+PKA)*(1+K_pka))
-    v7 = k[6]*PKA*AB/((K[6]+PKA)*(1+K_pka))
-    v22  = k[21]*PKA*D/((K[21]+PKA)*(1+K_pka))
-    v25  = k[24]*PKA*AD/((K[24]+PKA)*(1+K_pka))
-    v28  = k[27]*PKA*ABD/((K[27]+PKA)*(1+K_pka))
+    v1 = k[0]*P0_K0*PKA_eff
+    v4 = k[3]*A_K3*PKA_eff
+    v7 = k[6]*AB_K6*PKA_eff
+    v22  = k[21]*D_K21*PKA_eff
+    v25  = k[24]*AD_K24*PKA_eff
+    v28  = k[27]*ABD_K27*PKA_eff
      
     #PKC   
-    v10  = k[9]*PKC*P0/((K[9]+PKC)*(1+K_pkc))
-    v13  = k[12]*PKC*A/((K[12]+PKC)*(1+K_pkc))
-    v16  = k[15]*PKC*AB/((K[15]+PKC)*(1+K_pkc))
-    v19  = k[18]*PKC*ABG/((K[18]+PKC)*(1+K_pkc))
+    v10  = k[9]*P0_K9*PKC_eff
+    v13  = k[12]*A_K12*PKC_eff
+    v16  = k[15]*AB_K15*PKC_eff
+    v19  = k[18]*ABG_K18*PKC_eff
      
     #PP1
-    v2 = k[1]*PP1*A/((K[1]+PP1)*(1+K_pp1))
-    v2_fast = k2_fast*PP1*Atr/((K2_fast+PP1)*(1+K_pp1))
-    v5 = k[4]*PP1*AB/((K[4]+PP1)*(1+K_pp1))
-    v8 = k[7]*PP1*ABG/((K[7]+PP1)*(1+K_pp1))
-    v11  = k[10]*PP1*D/((K[10]+PP1)*(1+K_pp1))
-    v14  = k[13]*PP1*AD/((K[13]+PP1)*(1+K_pp1))
-    v17  = k[16]*PP1*ABD/((K[16]+PP1)*(1+K_pp1))
-    v20  = k[19]*PP1*ABGD/((K[19]+PP1)*(1+K_pp1))
-    v23  = k[22]*PP1*AD/((K[22]+PP1)*(1+K_pp1))
-    v26  = k[25]*PP1*ABD/((K[25]+PP1)*(1+K_pp1))
-    v29  = k[28]*PP1*ABGD/((K[28]+PP1)*(1+K_pp1))
+    v2 = k[1]*A_K1*PP1_eff
+    v2_fast = k2_fast*Atr_K2f*PP1_eff
+    v5 = k[4]*AB_K4*PP1_eff
+    v8 = k[7]*ABG_K7*PP1_eff
+    v11  = k[10]*D_K10*PP1_eff
+    v14  = k[13]*AD_K13*PP1_eff
+    v17  = k[16]*ABD_K16*PP1_eff
+    v20  = k[19]*ABGD_K19*PP1_eff
+    v23  = k[22]*AD_K22*PP1_eff
+    v26  = k[25]*ABD_K25*PP1_eff
+    v29  = k[28]*ABGD_K28*PP1_eff
      
     #PP2A
-    v3 = k[2]*PP2A*A/((K[2]+PP2A)*(1+K_pp2a))
-    v3_fast = k3_fast*PP2A*Atr/((K2_fast+PP2A)*(1+K_pp2a))
-    v6 = k[5]*PP2A*AB/((K[5]+PP2A)*(1+K_pp2a))
-    v9 = k[8]*PP2A*ABG/((K[8]+PP2A)*(1+K_pp2a))
-    v12  = k[11]*PP2A*D/((K[11]+PP2A)*(1+K_pp2a))
-    v15  = k[14]*PP2A*AD/((K[14]+PP2A)*(1+K_pp2a))
-    v18  = k[17]*PP2A*ABD/((K[17]+PP2A)*(1+K_pp2a))
-    v21  = k[20]*PP2A*ABGD/((K[20]+PP2A)*(1+K_pp2a))
-    v24  = k[23]*PP2A*AD/((K[23]+PP2A)*(1+K_pp2a))
-    v27  = k[26]*PP2A*ABD/((K[26]+PP2A)*(1+K_pp2a))
-    v30  = k[29]*PP2A*ABGD/((K[29]+PP2A)*(1+K_pp2a))
+    v3 = k[2]*A_K2*PP2A_eff
+    v3_fast = k3_fast*Atr/(K2_fast+PP2A)*PP2A_eff
+    v6 = k[5]*AB_K5*PP2A_eff
+    v9 = k[8]*ABG_K8*PP2A_eff
+    v12  = k[11]*D_K11*PP2A_eff
+    v15  = k[14]*AD_K14*PP2A_eff
+    v18  = k[17]*ABD_K17*PP2A_eff
+    v21  = k[20]*ABGD_K20*PP2A_eff
+    v24  = k[23]*AD_K23*PP2A_eff
+    v27  = k[26]*ABD_K26*PP2A_eff
+    v30  = k[29]*ABGD_K29*PP2A_eff
     
     #isomerization
     v_isoF = k_isoF*Atr
@@ -551,10 +896,21 @@ def cMyBPC_model4_full_tQSSA(t,ICs,params):
     dABDdt = v16  + v25  + v29  + v30  - v17  - v18  - v26  - v27  - v28 
     dABGDdt = v19  + v28  - v20  - v21  - v29  - v30 
 
-    return np.array([dP0dt, dAdt, dAtr, dABdt, dABGdt, dDdt, dADdt, dABDdt, dABGDdt])
+    dx = np.empty(9) # filled in place: avoids the list->array construction per call
+    dx[0] = dP0dt
+    dx[1] = dAdt
+    dx[2] = dAtr
+    dx[3] = dABdt
+    dx[4] = dABGdt
+    dx[5] = dDdt
+    dx[6] = dADdt
+    dx[7] = dABDdt
+    dx[8] = dABGDdt
+    return dx
 
 #%% Final models used for simulation 
 
+@njit(cache=True)
 def cMyBPC_model_final(t,ICs,params,naFun,naFunParams): 
     
     # Structural transition model for alpha species during PP1 and PP2A dephosphorylation. 
@@ -566,138 +922,106 @@ def cMyBPC_model_final(t,ICs,params,naFun,naFunParams):
     # parameters
     k = params[0]
     K = params[1]
+    Kinv = 1/K # reciprocals hoisted: the rate laws below multiply instead of divide
+
+    # substrate/K ratios shared by the competition sums and the rate laws
+    P0_K0 = P0*Kinv[0]
+    A_K1 = A*Kinv[1]
+    A_K2 = A*Kinv[2]
+    A_K3 = A*Kinv[3]
+    A_Atr_K3 = (A+Atr)*Kinv[3]
+    Atr_K3 = Atr*Kinv[3]
+    AB_K4 = AB*Kinv[4]
+    AB_K5 = AB*Kinv[5]
+    AB_K6 = AB*Kinv[6]
+    ABG_K7 = ABG*Kinv[7]
+    ABG_K8 = ABG*Kinv[8]
+    P0_K9 = P0*Kinv[9]
+    D_K10 = D*Kinv[10]
+    D_K11 = D*Kinv[11]
+    A_K12 = A*Kinv[12]
+    A_Atr_K12 = (A+Atr)*Kinv[12]
+    Atr_K12 = Atr*Kinv[12]
+    AD_K13 = AD*Kinv[13]
+    AD_K14 = AD*Kinv[14]
+    AB_K15 = AB*Kinv[15]
+    ABD_K16 = ABD*Kinv[16]
+    ABD_K17 = ABD*Kinv[17]
+    ABG_K18 = ABG*Kinv[18]
+    ABGD_K19 = ABGD*Kinv[19]
+    ABGD_K20 = ABGD*Kinv[20]
+    D_K21 = D*Kinv[21]
+    AD_K22 = AD*Kinv[22]
+    AD_K23 = AD*Kinv[23]
+    AD_K24 = AD*Kinv[24]
+    ABD_K25 = ABD*Kinv[25]
+    ABD_K26 = ABD*Kinv[26]
+    ABD_K27 = ABD*Kinv[27]
+    ABGD_K28 = ABGD*Kinv[28]
+    ABGD_K29 = ABGD*Kinv[29]
     k2_fast, K2_fast, k_isoF, k_isoR, k3_fast, K3_fast = params[2]
    
     PKA, PKC, PP1, PP2A = params[3]
        
-    # competition terms Kappa
-    K_pka = P0/K[0]+A/K[3]+AB/K[6]+D/K[21]+AD/K[24]+ABD/K[27]
-    K_pkc = P0/K[9]+A/K[12]+AB/K[15]+ABG/K[18]
-    K_pp1 = A/K[1]+AB/K[4]+ABG/K[7]+D/K[10]+AD/K[13]+AD/K[22]+ABD/K[16]+ABD/K[25]+ABGD/K[19]+ABGD/K[28]+Atr/K2_fast
-    K_pp2a = A/K[2]+AB/K[5]+ABG/K[8]+D/K[11]+AD/K[14]+AD/K[23]+ABD/K[17]+ABD/K[26]+ABGD/K[20]+ABGD/K[29]+Atr/K3_fast
-
-    # reaction rates
-
-    #PKA
-    v1 = k[0]*PKA*P0/(K[0]*(1+K_pka-P0/K[0])+P0)
-    v4 = k[3]*PKA*A/(K[3]*(1+K_pka-A/K[3])+A)
-    v7 = k[6]*PKA*AB/(K[6]*(1+K_pka-AB/K[6])+AB)
-    v22  = k[21]*PKA*D/(K[21]*(1+K_pka-D/K[21])+D)
-    v25  = k[24]*PKA*AD/(K[24]*(1+K_pka-AD/K[24])+AD)
-    v28  = k[27]*PKA*ABD/(K[27]*(1+K_pka-ABD/K[27])+ABD)
-     
-    #PKC
-    v10  = k[9]*PKC*P0/(K[9]*(1+K_pkc-P0/K[9])+P0)
-    v13  = k[12]*PKC*A/(K[12]*(1+K_pkc-A/K[12])+A)
-    v16  = k[15]*PKC*AB/(K[15]*(1+K_pkc-AB/K[15])+AB)
-    v19  = k[18]*PKC*ABG/(K[18]*(1+K_pkc-ABG/K[18])+ABG)
-     
-    #PP1
-    v2 = k[1]*PP1*A/(K[1]*(1+K_pp1-A/K[1])+A)
-    v2_fast = k2_fast*PP1*Atr/(K2_fast*(1+K_pp1-Atr/K2_fast)+Atr)
-    v5 = k[4]*PP1*AB/(K[4]*(1+K_pp1-AB/K[4])+AB)
-    v8 = k[7]*PP1*ABG/(K[7]*(1+K_pp1-ABG/K[7])+ABG)
-    v11  = k[10]*PP1*D/(K[10]*(1+K_pp1-D/K[10])+D)
-    v14  = k[13]*PP1*AD/(K[13]*(1+K_pp1-AD/K[13])+AD)
-    v17  = k[16]*PP1*ABD/(K[16]*(1+K_pp1-ABD/K[16])+ABD)
-    v20  = k[19]*PP1*ABGD/(K[19]*(1+K_pp1-ABGD/K[19])+ABGD)
-    v23  = k[22]*PP1*AD/(K[22]*(1+K_pp1-AD/K[22])+AD)
-    v26  = k[25]*PP1*ABD/(K[25]*(1+K_pp1-ABD/K[25])+ABD)
-    v29  = k[28]*PP1*ABGD/(K[28]*(1+K_pp1-ABGD/K[28])+ABGD)
-     
-    #PP2A
-    v3 = k[2]*PP2A*A/(K[2]*(1+K_pp2a-A/K[2])+A)
-    v3_fast = k3_fast*PP2A*Atr/(K3_fast*(1+K_pp2a-Atr/K3_fast)+Atr)
-    v6 = k[5]*PP2A*AB/(K[5]*(1+K_pp2a-AB/K[5])+AB)
-    v9 = k[8]*PP2A*ABG/(K[8]*(1+K_pp2a-ABG/K[8])+ABG)
-    v12  = k[11]*PP2A*D/(K[11]*(1+K_pp2a-D/K[11])+D)
-    v15  = k[14]*PP2A*AD/(K[14]*(1+K_pp2a-AD/K[14])+AD)
-    v18  = k[17]*PP2A*ABD/(K[17]*(1+K_pp2a-ABD/K[17])+ABD)
-    v21  = k[20]*PP2A*ABGD/(K[20]*(1+K_pp2a-ABGD/K[20])+ABGD)
-    v24  = k[23]*PP2A*AD/(K[23]*(1+K_pp2a-AD/K[23])+AD)
-    v27  = k[26]*PP2A*ABD/(K[26]*(1+K_pp2a-ABD/K[26])+ABD)
-    v30  = k[29]*PP2A*ABGD/(K[29]*(1+K_pp2a-ABGD/K[29])+ABGD)
-    
-    #isomerization
-    v_isoF = k_isoF*Atr
-    v_isoR = k_isoR*A
-     
-    # ODEs
-    dP0dt = v2 + v2_fast + v3 + v3_fast + v11  + v12  - v1 - v10 
-    dAdt = v1 - v2 - v3 - v4 - v13  + v_isoF - v_isoR
-    dAtr = v5 + v6 + v14  + v15  - v_isoF + v_isoR - v2_fast - v3_fast
-    dABdt = v4 + v8 + v9 + v17  + v18  - v5 - v6 - v7 - v16 
-    dABGdt = v7 + v20  + v21  - v8 - v9 - v19 
-    dDdt = v10  + v23  + v24  - v11  - v12  - v22 
-    dADdt = v13  + v22  + v26  + v27  - v14  - v15  - v23  - v24  - v25 
-    dABDdt = v16  + v25  + v29  + v30  - v17  - v18  - v26  - v27  - v28 
-    dABGDdt = v19  + v28  - v20  - v21  - v29  - v30 
-
-    return np.array([dP0dt, dAdt, dAtr, dABdt, dABGdt, dDdt, dADdt, dABDdt, dABGDdt])
-
-    
-    # assignment of initial conditions for state variables   
-    P0,A,Atr,AB,ABG,D,AD,ABD,ABGD = ICs
-      
-    # parameters
-    k = params[0]
-    K = params[1]
-    k2_fast, K2_fast, k_isoF, k_isoR, k3_fast, K3_fast = params[2]
-
-    PKA, PKC, PP1, PP2A = params[3]
-
     # non-autonomous variables
     PKA = PKA*naFun(t,naFunParams)     
        
     # competition terms Kappa
-    K_pka = P0/K[0]+(A+Atr)/K[3]+AB/K[6]+D/K[21]+AD/K[24]+ABD/K[27]
-    K_pkc = P0/K[9]+(A+Atr)/K[12]+AB/K[15]+ABG/K[18]
-    K_pp1 = A/K[1]+AB/K[4]+ABG/K[7]+D/K[10]+AD/K[13]+AD/K[22]+ABD/K[16]+ABD/K[25]+ABGD/K[19]+ABGD/K[28]+Atr/K2_fast
-    K_pp2a = A/K[2]+AB/K[5]+ABG/K[8]+D/K[11]+AD/K[14]+AD/K[23]+ABD/K[17]+ABD/K[26]+ABGD/K[20]+ABGD/K[29]+Atr/K3_fast
+    K_pka = P0_K0+A_Atr_K3+AB_K6+D_K21+AD_K24+ABD_K27
+    K_pkc = P0_K9+A_Atr_K12+AB_K15+ABG_K18
+    K_pp1 = A_K1+AB_K4+ABG_K7+D_K10+AD_K13+AD_K22+ABD_K16+ABD_K25+ABGD_K19+ABGD_K28+Atr/K2_fast
+    K_pp2a = A_K2+AB_K5+ABG_K8+D_K11+AD_K14+AD_K23+ABD_K17+ABD_K26+ABGD_K20+ABGD_K29+Atr/K3_fast
+
+    # each MM denominator K[i]*(1+Kappa-X*Kinv[i])+X collapses to K[i]*(1+Kappa),
+    # so the enzyme/(1+Kappa) factor of each rate family is shared and computed once
+    PKA_eff = PKA/(1+K_pka)
+    PKC_eff = PKC/(1+K_pkc)
+    PP1_eff = PP1/(1+K_pp1)
+    PP2A_eff = PP2A/(1+K_pp2a)
 
     # reaction rates
 
     #PKA
-    v1 = k[0]*PKA*P0/(K[0]*(1+K_pka-P0/K[0])+P0)
-    v4 = k[3]*PKA*A/(K[3]*(1+K_pka-A/K[3])+A)
-    v4_2 = k[3]*PKA*Atr/(K[3]*(1+K_pka-Atr/K[3])+Atr)
-    v7 = k[6]*PKA*AB/(K[6]*(1+K_pka-AB/K[6])+AB)
-    v22  = k[21]*PKA*D/(K[21]*(1+K_pka-D/K[21])+D)
-    v25  = k[24]*PKA*AD/(K[24]*(1+K_pka-AD/K[24])+AD)
-    v28  = k[27]*PKA*ABD/(K[27]*(1+K_pka-ABD/K[27])+ABD)
+    v1 = k[0]*P0_K0*PKA_eff
+    v4 = k[3]*A_K3*PKA_eff
+    v4_2 = k[3]*Atr_K3*PKA_eff
+    v7 = k[6]*AB_K6*PKA_eff
+    v22  = k[21]*D_K21*PKA_eff
+    v25  = k[24]*AD_K24*PKA_eff
+    v28  = k[27]*ABD_K27*PKA_eff
      
     #PKC
-    v10  = k[9]*PKC*P0/(K[9]*(1+K_pkc-P0/K[9])+P0)
-    v13  = k[12]*PKC*A/(K[12]*(1+K_pkc-A/K[12])+A)
-    v13_2  = k[12]*PKC*Atr/(K[12]*(1+K_pkc-Atr/K[12])+Atr)
-    v16  = k[15]*PKC*AB/(K[15]*(1+K_pkc-AB/K[15])+AB)
-    v19  = k[18]*PKC*ABG/(K[18]*(1+K_pkc-ABG/K[18])+ABG)
+    v10  = k[9]*P0_K9*PKC_eff
+    v13  = k[12]*A_K12*PKC_eff
+    v13_2  = k[12]*Atr_K12*PKC_eff
+    v16  = k[15]*AB_K15*PKC_eff
+    v19  = k[18]*ABG_K18*PKC_eff
      
     #PP1
-    v2 = k[1]*PP1*A/(K[1]*(1+K_pp1-A/K[1])+A)
-    v2_fast = k2_fast*PP1*Atr/(K2_fast*(1+K_pp1-Atr/K2_fast)+Atr)
-    v5 = k[4]*PP1*AB/(K[4]*(1+K_pp1-AB/K[4])+AB)
-    v8 = k[7]*PP1*ABG/(K[7]*(1+K_pp1-ABG/K[7])+ABG)
-    v11  = k[10]*PP1*D/(K[10]*(1+K_pp1-D/K[10])+D)
-    v14  = k[13]*PP1*AD/(K[13]*(1+K_pp1-AD/K[13])+AD)
-    v17  = k[16]*PP1*ABD/(K[16]*(1+K_pp1-ABD/K[16])+ABD)
-    v20  = k[19]*PP1*ABGD/(K[19]*(1+K_pp1-ABGD/K[19])+ABGD)
-    v23  = k[22]*PP1*AD/(K[22]*(1+K_pp1-AD/K[22])+AD)
-    v26  = k[25]*PP1*ABD/(K[25]*(1+K_pp1-ABD/K[25])+ABD)
-    v29  = k[28]*PP1*ABGD/(K[28]*(1+K_pp1-ABGD/K[28])+ABGD)
+    v2 = k[1]*A_K1*PP1_eff
+    v2_fast = k2_fast*Atr*PP1_eff/K2_fast
+    v5 = k[4]*AB_K4*PP1_eff
+    v8 = k[7]*ABG_K7*PP1_eff
+    v11  = k[10]*D_K10*PP1_eff
+    v14  = k[13]*AD_K13*PP1_eff
+    v17  = k[16]*ABD_K16*PP1_eff
+    v20  = k[19]*ABGD_K19*PP1_eff
+    v23  = k[22]*AD_K22*PP1_eff
+    v26  = k[25]*ABD_K25*PP1_eff
+    v29  = k[28]*ABGD_K28*PP1_eff
      
     #PP2A
-    v3 = k[2]*PP2A*A/(K[2]*(1+K_pp2a-A/K[2])+A)
-    v3_fast = k3_fast*PP2A*Atr/(K3_fast*(1+K_pp2a-Atr/K3_fast)+Atr)
-    v6 = k[5]*PP2A*AB/(K[5]*(1+K_pp2a-AB/K[5])+AB)
-    v9 = k[8]*PP2A*ABG/(K[8]*(1+K_pp2a-ABG/K[8])+ABG)
-    v12  = k[11]*PP2A*D/(K[11]*(1+K_pp2a-D/K[11])+D)
-    v15  = k[14]*PP2A*AD/(K[14]*(1+K_pp2a-AD/K[14])+AD)
-    v18  = k[17]*PP2A*ABD/(K[17]*(1+K_pp2a-ABD/K[17])+ABD)
-    v21  = k[20]*PP2A*ABGD/(K[20]*(1+K_pp2a-ABGD/K[20])+ABGD)
-    v24  = k[23]*PP2A*AD/(K[23]*(1+K_pp2a-AD/K[23])+AD)
-    v27  = k[26]*PP2A*ABD/(K[26]*(1+K_pp2a-ABD/K[26])+ABD)
-    v30  = k[29]*PP2A*ABGD/(K[29]*(1+K_pp2a-ABGD/K[29])+ABGD)
+    v3 = k[2]*A_K2*PP2A_eff
+    v3_fast = k3_fast*Atr*PP2A_eff/K3_fast
+    v6 = k[5]*AB_K5*PP2A_eff
+    v9 = k[8]*ABG_K8*PP2A_eff
+    v12  = k[11]*D_K11*PP2A_eff
+    v15  = k[14]*AD_K14*PP2A_eff
+    v18  = k[17]*ABD_K17*PP2A_eff
+    v21  = k[20]*ABGD_K20*PP2A_eff
+    v24  = k[23]*AD_K23*PP2A_eff
+    v27  = k[26]*ABD_K26*PP2A_eff
+    v30  = k[29]*ABGD_K29*PP2A_eff
     
     #isomerization
     v_isoF = k_isoF*Atr
@@ -714,8 +1038,19 @@ def cMyBPC_model_final(t,ICs,params,naFun,naFunParams):
     dABDdt = v16  + v25  + v29  + v30  - v17  - v18  - v26  - v27  - v28 
     dABGDdt = v19  + v28  - v20  - v21  - v29  - v30 
 
-    return np.array([dP0dt, dAdt, dAtr, dABdt, dABGdt, dDdt, dADdt, dABDdt, dABGDdt])
+    dx = np.empty(9) # filled in place: avoids the list->array construction per call
+    dx[0] = dP0dt
+    dx[1] = dAdt
+    dx[2] = dAtr
+    dx[3] = dABdt
+    dx[4] = dABGdt
+    dx[5] = dDdt
+    dx[6] = dADdt
+    dx[7] = dABDdt
+    dx[8] = dABGDdt
+    return dx
 
+@njit(cache=True)
 def cMyBPC_model_final_RSK2(t,ICs,params,naFun,naFunParams):
     
     # Extended version of cMyBPC_model_final which also includes RSK2 reactions. 
@@ -726,10 +1061,46 @@ def cMyBPC_model_final_RSK2(t,ICs,params,naFun,naFunParams):
     # parameters
     k = params[0]
     K = params[1]
-    k = np.append(k, params[4][0]) #kcat RSK2 reaction 31
-    k = np.append(k, params[4][1]) #kcat RSK2 reaction 32
-    K = np.append(K, params[4][2]) # Km RSK2 reaction 31
-    K = np.append(K, params[4][3]) # Km RSK2 reaction 32
+    Kinv = 1/K # reciprocals hoisted: the rate laws below multiply instead of divide
+
+    # substrate/K ratios shared by the competition sums and the rate laws
+    P0_K0 = P0*Kinv[0]
+    A_K1 = A*Kinv[1]
+    A_K2 = A*Kinv[2]
+    A_Atr_K3 = (A+Atr)*Kinv[3]
+    A_K3 = A*Kinv[3]
+    Atr_K3 = Atr*Kinv[3]
+    AB_K4 = AB*Kinv[4]
+    AB_K5 = AB*Kinv[5]
+    AB_K6 = AB*Kinv[6]
+    ABG_K7 = ABG*Kinv[7]
+    ABG_K8 = ABG*Kinv[8]
+    P0_K9 = P0*Kinv[9]
+    D_K10 = D*Kinv[10]
+    D_K11 = D*Kinv[11]
+    A_Atr_K12 = (A+Atr)*Kinv[12]
+    A_K12 = A*Kinv[12]
+    Atr_K12 = Atr*Kinv[12]
+    AD_K13 = AD*Kinv[13]
+    AD_K14 = AD*Kinv[14]
+    AB_K15 = AB*Kinv[15]
+    ABD_K16 = ABD*Kinv[16]
+    ABD_K17 = ABD*Kinv[17]
+    ABG_K18 = ABG*Kinv[18]
+    ABGD_K19 = ABGD*Kinv[19]
+    ABGD_K20 = ABGD*Kinv[20]
+    D_K21 = D*Kinv[21]
+    AD_K22 = AD*Kinv[22]
+    AD_K23 = AD*Kinv[23]
+    AD_K24 = AD*Kinv[24]
+    ABD_K25 = ABD*Kinv[25]
+    ABD_K26 = ABD*Kinv[26]
+    ABD_K27 = ABD*Kinv[27]
+    ABGD_K28 = ABGD*Kinv[28]
+    ABGD_K29 = ABGD*Kinv[29]
+    # RSK2 kcat/Km constants used as scalars: np.append would copy the whole
+    # k/K arrays four times per call just to attach them
+    k31, k32, K31, K32 = params[4]
     
     k2_fast, K2_fast, k_isoF, k_isoR, k3_fast, K3_fast = params[2]
 
@@ -739,58 +1110,67 @@ def cMyBPC_model_final_RSK2(t,ICs,params,naFun,naFunParams):
     PKA = PKA*naFun(t,naFunParams)
     
     # competition terms Kappa
-    K_pka = P0/K[0]+(A+Atr)/K[3]+AB/K[6]+D/K[21]+AD/K[24]+ABD/K[27]
-    K_pkc = P0/K[9]+(A+Atr)/K[12]+AB/K[15]+ABG/K[18]
-    K_pp1 = A/K[1]+AB/K[4]+ABG/K[7]+D/K[10]+AD/K[13]+AD/K[22]+ABD/K[16]+ABD/K[25]+ABGD/K[19]+ABGD/K[28]+Atr/K2_fast
-    K_pp2a = A/K[2]+AB/K[5]+ABG/K[8]+D/K[11]+AD/K[14]+AD/K[23]+ABD/K[17]+ABD/K[26]+ABGD/K[20]+ABGD/K[29]+Atr/K3_fast
+    K_pka = P0_K0+A_Atr_K3+AB_K6+D_K21+AD_K24+ABD_K27
+    K_pkc = P0_K9+A_Atr_K12+AB_K15+ABG_K18
+    K_pp1 = A_K1+AB_K4+ABG_K7+D_K10+AD_K13+AD_K22+ABD_K16+ABD_K25+ABGD_K19+ABGD_K28+Atr/K2_fast
+    K_pp2a = A_K2+AB_K5+ABG_K8+D_K11+AD_K14+AD_K23+ABD_K17+ABD_K26+ABGD_K20+ABGD_K29+Atr/K3_fast
+
+    # each MM denominator K[i]*(1+Kappa-X*Kinv[i])+X collapses to K[i]*(1+Kappa),
+    # so the enzyme/(1+Kappa) factor of each rate family is shared and computed once
+    PKA_eff = PKA/(1+K_pka)
+    PKC_eff = PKC/(1+K_pkc)
+    PP1_eff = PP1/(1+K_pp1)
+    PP2A_eff = PP2A/(1+K_pp2a)
 
     # reaction rates
     
     #PKA
-    v1 = k[0]*PKA*P0/(K[0]*(1+K_pka-P0/K[0])+P0)
-    v4 = k[3]*PKA*A/(K[3]*(1+K_pka-A/K[3])+A)
-    v4_2 = k[3]*PKA*Atr/(K[3]*(1+K_pka-Atr/K[3])+Atr)
-    v7 = k[6]*PKA*AB/(K[6]*(1+K_pka-AB/K[6])+AB)
-    v22  = k[21]*PKA*D/(K[21]*(1+K_pka-D/K[21])+D)
-    v25  = k[24]*PKA*AD/(K[24]*(1+K_pka-AD/K[24])+AD)
-    v28  = k[27]*PKA*ABD/(K[27]*(1+K_pka-ABD/K[27])+ABD)
+    v1 = k[0]*P0_K0*PKA_eff
+    v4 = k[3]*A_K3*PKA_eff
+    v4_2 = k[3]*Atr_K3*PKA_eff
+    v7 = k[6]*AB_K6*PKA_eff
+    v22  = k[21]*D_K21*PKA_eff
+    v25  = k[24]*AD_K24*PKA_eff
+    v28  = k[27]*ABD_K27*PKA_eff
      
     #PKC
-    v10  = k[9]*PKC*P0/(K[9]*(1+K_pkc-P0/K[9])+P0)
-    v13  = k[12]*PKC*A/(K[12]*(1+K_pkc-A/K[12])+A)
-    v13_2  = k[12]*PKC*Atr/(K[12]*(1+K_pkc-Atr/K[12])+Atr)
-    v16  = k[15]*PKC*AB/(K[15]*(1+K_pkc-AB/K[15])+AB)
-    v19  = k[18]*PKC*ABG/(K[18]*(1+K_pkc-ABG/K[18])+ABG)
+    v10  = k[9]*P0_K9*PKC_eff
+    v13  = k[12]*A_K12*PKC_eff
+    v13_2  = k[12]*Atr_K12*PKC_eff
+    v16  = k[15]*AB_K15*PKC_eff
+    v19  = k[18]*ABG_K18*PKC_eff
      
-    #RSK2
-    v31  = k[30]*RSK2*P0/(K[30]+D/K[31]+P0)
-    v32  = k[31]*RSK2*D/(K[31]+P0/K[30]+D)
+    #RSK2: P0 and D compete for the kinase, each appears in the other's denominator
+    P0_K31 = P0/K31
+    D_K32 = D/K32
+    v31  = k31*RSK2*P0/(K31+D_K32+P0)
+    v32  = k32*RSK2*D/(K32+P0_K31+D)
     
     #PP1
-    v2 = k[1]*PP1*A/(K[1]*(1+K_pp1-A/K[1])+A)
-    v2_fast = k2_fast*PP1*Atr/(K2_fast*(1+K_pp1-Atr/K2_fast)+Atr)
-    v5 = k[4]*PP1*AB/(K[4]*(1+K_pp1-AB/K[4])+AB)
-    v8 = k[7]*PP1*ABG/(K[7]*(1+K_pp1-ABG/K[7])+ABG)
-    v11  = k[10]*PP1*D/(K[10]*(1+K_pp1-D/K[10])+D)
-    v14  = k[13]*PP1*AD/(K[13]*(1+K_pp1-AD/K[13])+AD)
-    v17  = k[16]*PP1*ABD/(K[16]*(1+K_pp1-ABD/K[16])+ABD)
-    v20  = k[19]*PP1*ABGD/(K[19]*(1+K_pp1-ABGD/K[19])+ABGD)
-    v23  = k[22]*PP1*AD/(K[22]*(1+K_pp1-AD/K[22])+AD)
-    v26  = k[25]*PP1*ABD/(K[25]*(1+K_pp1-ABD/K[25])+ABD)
-    v29  = k[28]*PP1*ABGD/(K[28]*(1+K_pp1-ABGD/K[28])+ABGD)
+    v2 = k[1]*A_K1*PP1_eff
+    v2_fast = k2_fast*Atr*PP1_eff/K2_fast
+    v5 = k[4]*AB_K4*PP1_eff
+    v8 = k[7]*ABG_K7*PP1_eff
+    v11  = k[10]*D_K10*PP1_eff
+    v14  = k[13]*AD_K13*PP1_eff
+    v17  = k[16]*ABD_K16*PP1_eff
+    v20  = k[19]*ABGD_K19*PP1_eff
+    v23  = k[22]*AD_K22*PP1_eff
+    v26  = k[25]*ABD_K25*PP1_eff
+    v29  = k[28]*ABGD_K28*PP1_eff
      
     #PP2A
-    v3 = k[2]*PP2A*A/(K[2]*(1+K_pp2a-A/K[2])+A)
-    v3_fast = k3_fast*PP2A*Atr/(K3_fast*(1+K_pp2a-Atr/K3_fast)+Atr)
-    v6 = k[5]*PP2A*AB/(K[5]*(1+K_pp2a-AB/K[5])+AB)
-    v9 = k[8]*PP2A*ABG/(K[8]*(1+K_pp2a-ABG/K[8])+ABG)
-    v12  = k[11]*PP2A*D/(K[11]*(1+K_pp2a-D/K[11])+D)
-    v15  = k[14]*PP2A*AD/(K[14]*(1+K_pp2a-AD/K[14])+AD)
-    v18  = k[17]*PP2A*ABD/(K[17]*(1+K_pp2a-ABD/K[17])+ABD)
-    v21  = k[20]*PP2A*ABGD/(K[20]*(1+K_pp2a-ABGD/K[20])+ABGD)
-    v24  = k[23]*PP2A*AD/(K[23]*(1+K_pp2a-AD/K[23])+AD)
-    v27  = k[26]*PP2A*ABD/(K[26]*(1+K_pp2a-ABD/K[26])+ABD)
-    v30  = k[29]*PP2A*ABGD/(K[29]*(1+K_pp2a-ABGD/K[29])+ABGD)
+    v3 = k[2]*A_K2*PP2A_eff
+    v3_fast = k3_fast*Atr*PP2A_eff/K3_fast
+    v6 = k[5]*AB_K5*PP2A_eff
+    v9 = k[8]*ABG_K8*PP2A_eff
+    v12  = k[11]*D_K11*PP2A_eff
+    v15  = k[14]*AD_K14*PP2A_eff
+    v18  = k[17]*ABD_K17*PP2A_eff
+    v21  = k[20]*ABGD_K20*PP2A_eff
+    v24  = k[23]*AD_K23*PP2A_eff
+    v27  = k[26]*ABD_K26*PP2A_eff
+    v30  = k[29]*ABGD_K29*PP2A_eff
     
     #isomerization
     v_isoF = k_isoF*Atr
@@ -807,7 +1187,547 @@ def cMyBPC_model_final_RSK2(t,ICs,params,naFun,naFunParams):
     dABDdt = v16  + v25  + v29  + v30  - v17  - v18  - v26  - v27  - v28 
     dABGDdt = v19  + v28  - v20  - v21  - v29  - v30 
 
-    return np.array([dP0dt, dAdt, dAtr, dABdt, dABGdt, dDdt, dADdt, dABDdt, dABGDdt])
+    dx = np.empty(9) # filled in place: avoids the list->array construction per call
+    dx[0] = dP0dt
+    dx[1] = dAdt
+    dx[2] = dAtr
+    dx[3] = dABdt
+    dx[4] = dABGdt
+    dx[5] = dDdt
+    dx[6] = dADdt
+    dx[7] = dABDdt
+    dx[8] = dABGDdt
+    return dx
+
+
+def cMyBPC_model_final_RSK2_jac(t,ICs,params,naFun,naFunParams):
+    
+    # Analytic 9x9 Jacobian of cMyBPC_model_final_RSK2 with respect to the state
+    # variables. Generated symbolically with SymPy (Matrix(rhs).jacobian followed by
+    # common subexpression elimination); do not edit by hand. Passing this to
+    # solve_ivp's stiff solvers (LSODA/BDF/Radau) avoids the 9 extra RHS
+    # evaluations per step otherwise spent on finite-difference Jacobians.
+    
+    # assignment of initial conditions for state variables   
+    P0,A,Atr,AB,ABG,D,AD,ABD,ABGD = ICs
+         
+    # parameters
+    k = params[0]
+    K = params[1]
+    k2_fast, K2_fast, k_isoF, k_isoR, k3_fast, K3_fast = params[2]
+    PKA, PKC, PP1, PP2A, RSK2 = params[3]
+    
+    # non-autonomous variables
+    naScale = naFun(t,naFunParams)
+
+    x0 = 1/params[4][3]
+    x1 = D*x0 + P0 + params[4][2]
+    x2 = RSK2*params[4][0]
+    x3 = x2/x1
+    x4 = P0*x2/x1**2
+    x5 = 1/K[15]
+    x6 = AB*x5
+    x7 = 1/K[18]
+    x8 = 1/K[12]
+    x9 = A + Atr
+    x10 = x8*x9
+    x11 = ABG*x7 + x10 + 1
+    x12 = x11 + x6
+    x13 = K[9]*x12 + P0
+    x14 = PKC*k[9]
+    x15 = x14/x13
+    x16 = P0*x14/x13**2
+    x17 = 1/K[6]
+    x18 = AB*x17
+    x19 = 1/K[27]
+    x20 = ABD*x19
+    x21 = 1/K[24]
+    x22 = AD*x21
+    x23 = 1/K[21]
+    x24 = D*x23
+    x25 = 1/K[3]
+    x26 = x25*x9
+    x27 = x20 + x22 + x24 + x26 + 1
+    x28 = x18 + x27
+    x29 = K[0]*x28 + P0
+    x30 = PKA*naScale
+    x31 = k[0]*x30
+    x32 = x31/x29
+    x33 = P0*x31/x29**2
+    x34 = K[0]*x33
+    x35 = x25*x34
+    x36 = -x35
+    x37 = 1/K2_fast
+    x38 = Atr*x37
+    x39 = 1/K[4]
+    x40 = AB*x39
+    x41 = 1/K[16]
+    x42 = ABD*x41
+    x43 = 1/K[25]
+    x44 = ABD*x43
+    x45 = 1/K[7]
+    x46 = ABG*x45
+    x47 = 1/K[19]
+    x48 = ABGD*x47
+    x49 = 1/K[28]
+    x50 = ABGD*x49
+    x51 = 1/K[13]
+    x52 = AD*x51
+    x53 = 1/K[22]
+    x54 = AD*x53
+    x55 = 1/K[10]
+    x56 = D*x55
+    x57 = x40 + x42 + x44 + x46 + x48 + x50 + x52 + x54 + x56 + 1
+    x58 = A + K[1]*(x38 + x57)
+    x59 = PP1*k[1]
+    x60 = x59/x58
+    x61 = 1/K3_fast
+    x62 = Atr*x61
+    x63 = 1/K[5]
+    x64 = AB*x63
+    x65 = 1/K[17]
+    x66 = ABD*x65
+    x67 = 1/K[26]
+    x68 = ABD*x67
+    x69 = 1/K[8]
+    x70 = ABG*x69
+    x71 = 1/K[20]
+    x72 = ABGD*x71
+    x73 = 1/K[29]
+    x74 = ABGD*x73
+    x75 = 1/K[14]
+    x76 = AD*x75
+    x77 = 1/K[23]
+    x78 = AD*x77
+    x79 = 1/K[11]
+    x80 = D*x79
+    x81 = x64 + x66 + x68 + x70 + x72 + x74 + x76 + x78 + x80 + 1
+    x82 = A + K[2]*(x62 + x81)
+    x83 = PP2A*k[2]
+    x84 = x83/x82
+    x85 = x59/x58**2
+    x86 = A*x85
+    x87 = x83/x82**2
+    x88 = A*x87
+    x89 = 1/K[1]
+    x90 = A*x89
+    x91 = x38 + x42 + x44 + x46 + x48 + x50 + x52 + x54 + x90 + 1
+    x92 = D + K[10]*(x40 + x91)
+    x93 = x92**(-2)
+    x94 = PP1*k[10]
+    x95 = D*x93*x94
+    x96 = K[10]*x95
+    x97 = x89*x96
+    x98 = 1/K[2]
+    x99 = A*x98
+    x100 = x62 + x66 + x68 + x70 + x72 + x74 + x76 + x78 + x99 + 1
+    x101 = D + K[11]*(x100 + x64)
+    x102 = x101**(-2)
+    x103 = PP2A*k[11]
+    x104 = D*x102*x103
+    x105 = K[11]*x104
+    x106 = x105*x98
+    x107 = K[9]*x16
+    x108 = x107*x8
+    x109 = -x108
+    x110 = Atr + K2_fast*(x57 + x90)
+    x111 = x110**(-2)
+    x112 = PP1*k2_fast
+    x113 = Atr*x111*x112
+    x114 = K2_fast*x113
+    x115 = Atr + K3_fast*(x81 + x99)
+    x116 = x115**(-2)
+    x117 = PP2A*k3_fast
+    x118 = Atr*x116*x117
+    x119 = K3_fast*x118
+    x120 = x114*x89 + x119*x98
+    x121 = x112/x110
+    x122 = x117/x115
+    x123 = x37*x96
+    x124 = x105*x61
+    x125 = K[1]*x86
+    x126 = K[2]*x88
+    x127 = x125*x37 + x126*x61 + x36
+    x128 = x39*x96
+    x129 = x105*x63
+    x130 = x107*x5
+    x131 = x125*x39 + x126*x63 - x17*x34
+    x132 = x114*x39 + x119*x63
+    x133 = x107*x7
+    x134 = x114*x45
+    x135 = x119*x69
+    x136 = x45*x96
+    x137 = x105*x69
+    x138 = x94/x92
+    x139 = x103/x101
+    x140 = x114*x55
+    x141 = x119*x79
+    x142 = -x0*x4 + x125*x55 + x126*x79 - x23*x34
+    x143 = x51 + x53
+    x144 = x75 + x77
+    x145 = x125*x143 + x126*x144 - x21*x34
+    x146 = x105*x144 + x143*x96
+    x147 = x114*x143 + x119*x144
+    x148 = x41 + x43
+    x149 = x114*x148
+    x150 = x65 + x67
+    x151 = x119*x150
+    x152 = x125*x148 + x126*x150 - x19*x34
+    x153 = x105*x150 + x148*x96
+    x154 = x47 + x49
+    x155 = x71 + x73
+    x156 = 1/K[9]
+    x157 = P0*x156
+    x158 = x12 + x157
+    x159 = A + K[12]*(-A*x8 + x158)
+    x160 = PKC*k[12]
+    x161 = x160/x159**2
+    x162 = A*x161
+    x163 = K[12]*x156
+    x164 = x162*x163
+    x165 = 1/K[0]
+    x166 = P0*x165
+    x167 = x166 + x28
+    x168 = A + K[3]*(-A*x25 + x167)
+    x169 = k[3]*x30
+    x170 = A*x169/x168**2
+    x171 = K[3]*x165
+    x172 = x170*x171
+    x173 = x169/x168
+    x174 = -x162
+    x175 = x174 + x160/x159
+    x176 = K[12]*x5
+    x177 = x162*x176
+    x178 = K[3]*x170
+    x179 = x17*x178
+    x180 = K[12]*x7
+    x181 = K[1]*x85
+    x182 = K[2]*x87
+    x183 = x178*x23
+    x184 = x178*x21
+    x185 = x178*x19
+    x186 = Atr + K[12]*(-Atr*x8 + x158)
+    x187 = x160/x186**2
+    x188 = Atr + K[3]*(-Atr*x25 + x167)
+    x189 = x169/x188**2
+    x190 = Atr*x187
+    x191 = x38 + x40 + x44 + x46 + x48 + x50 + x54 + x56 + x90 + 1
+    x192 = AD + K[13]*(x191 + x42)
+    x193 = PP1*k[13]
+    x194 = AD*x193/x192**2
+    x195 = K[13]*x194
+    x196 = x195*x89
+    x197 = x62 + x64 + x68 + x70 + x72 + x74 + x78 + x80 + x99 + 1
+    x198 = AD + K[14]*(x197 + x66)
+    x199 = PP2A*k[14]
+    x200 = AD*x199/x198**2
+    x201 = K[14]*x200
+    x202 = x201*x98
+    x203 = Atr*x189
+    x204 = AB + K[4]*(x56 + x91)
+    x205 = PP1*k[4]
+    x206 = AB*x205/x204**2
+    x207 = K[4]*x206
+    x208 = AB + K[5]*(x100 + x80)
+    x209 = PP2A*k[5]
+    x210 = AB*x209/x208**2
+    x211 = K[5]*x210
+    x212 = x203 - x207*x89 - x211*x98
+    x213 = -x190
+    x214 = x169/x188
+    x215 = x207*x37
+    x216 = x211*x61
+    x217 = x160/x186 + x195*x37 + x201*x61
+    x218 = x176*x190 - x195*x39 - x201*x63
+    x219 = K[3]*x203
+    x220 = x17*x219 - x206 - x210 + x209/x208 + x205/x204
+    x221 = x195*x45
+    x222 = x201*x69
+    x223 = x180*x190
+    x224 = x207*x45 + x211*x69
+    x225 = x207*x55
+    x226 = x211*x79
+    x227 = x219*x23
+    x228 = x195*x55 + x201*x79
+    x229 = -x143*x207 - x144*x211 + x21*x219
+    x230 = -x194*(K[13]*x53 + 1) - x200*(K[14]*x77 + 1) + x199/x198 + x193/x192
+    x231 = x148*x207
+    x232 = x150*x211
+    x233 = x19*x219
+    x234 = x148*x195 + x150*x201
+    x235 = x154*x207
+    x236 = x155*x211
+    x237 = x154*x195 + x155*x201
+    x238 = AB + K[15]*(x11 + x157)
+    x239 = PKC*k[15]
+    x240 = AB*x239/x238**2
+    x241 = K[15]*x240
+    x242 = x156*x241
+    x243 = AB + K[6]*(x166 + x27)
+    x244 = k[6]*x30
+    x245 = AB*x244/x243**2
+    x246 = K[6]*x245
+    x247 = x165*x246
+    x248 = x38 + x40 + x42 + x44 + x50 + x52 + x54 + x56 + x90 + 1
+    x249 = ABG + K[7]*(x248 + x48)
+    x250 = PP1*k[7]
+    x251 = ABG*x250/x249**2
+    x252 = K[7]*x251
+    x253 = x252*x89
+    x254 = x62 + x64 + x66 + x68 + x74 + x76 + x78 + x80 + x99 + 1
+    x255 = ABG + K[8]*(x254 + x72)
+    x256 = PP2A*k[8]
+    x257 = ABG*x256/x255**2
+    x258 = K[8]*x257
+    x259 = x258*x98
+    x260 = ABD + K[16]*(x191 + x52)
+    x261 = PP1*k[16]
+    x262 = ABD*x261/x260**2
+    x263 = K[16]*x262
+    x264 = ABD + K[17]*(x197 + x76)
+    x265 = PP2A*k[17]
+    x266 = ABD*x265/x264**2
+    x267 = K[17]*x266
+    x268 = x263*x89 + x267*x98
+    x269 = -x241*x8
+    x270 = x246*x25
+    x271 = x170 + x269 - x270
+    x272 = x252*x37
+    x273 = x258*x61
+    x274 = x263*x37 + x267*x61
+    x275 = -x245 + x252*x39 + x258*x63 + x244/x243
+    x276 = -x240 + x263*x39 + x267*x63 + x239/x238
+    x277 = x241*x7
+    x278 = x263*x45
+    x279 = x267*x69
+    x280 = -x251 - x257 + x256/x255 + x250/x249
+    x281 = x252*x55
+    x282 = x258*x79
+    x283 = x23*x246
+    x284 = x263*x55 + x267*x79
+    x285 = x143*x252
+    x286 = x144*x258
+    x287 = x21*x246
+    x288 = x143*x263 + x144*x267
+    x289 = x19*x246
+    x290 = x261/x260
+    x291 = x265/x264
+    x292 = x262*(K[16]*x43 + 1)
+    x293 = x266*(K[17]*x67 + 1)
+    x294 = x148*x252
+    x295 = x150*x258
+    x296 = x154*x252 + x155*x258
+    x297 = x154*x263 + x155*x267
+    x298 = ABG + K[18]*(x10 + x157 + x6 + 1)
+    x299 = x298**(-2)
+    x300 = PKC*k[18]
+    x301 = ABG*x299*x300
+    x302 = K[18]*x301
+    x303 = -x302*x8
+    x304 = x270 + x303
+    x305 = ABGD + K[19]*(x248 + x46)
+    x306 = PP1*k[19]
+    x307 = ABGD*x306/x305**2
+    x308 = K[19]*x307
+    x309 = ABGD + K[20]*(x254 + x70)
+    x310 = PP2A*k[20]
+    x311 = ABGD*x310/x309**2
+    x312 = K[20]*x311
+    x313 = x308*x89 + x312*x98
+    x314 = x308*x37 + x312*x61
+    x315 = x302*x5
+    x316 = x308*x39
+    x317 = x312*x63
+    x318 = -x301 + x308*x45 + x312*x69 + x300/x298
+    x319 = x308*x55 + x312*x79
+    x320 = x143*x308 + x144*x312
+    x321 = x148*x308 + x150*x312
+    x322 = x306/x305
+    x323 = x310/x309
+    x324 = x307*(K[19]*x49 + 1)
+    x325 = x311*(K[20]*x73 + 1)
+    x326 = 1/params[4][2]
+    x327 = D + P0*x326 + params[4][3]
+    x328 = RSK2*params[4][1]
+    x329 = D*x328/x327**2
+    x330 = x166 + x18 + x20 + x26 + 1
+    x331 = D + K[21]*(x22 + x330)
+    x332 = k[21]*x30
+    x333 = D*x332/x331**2
+    x334 = K[21]*x333
+    x335 = x165*x334 + x326*x329
+    x336 = -x25*x334
+    x337 = x108 + x336
+    x338 = x38 + x40 + x42 + x46 + x48 + x50 + x52 + x56 + x90 + 1
+    x339 = AD + K[22]*(x338 + x44)
+    x340 = PP1*k[22]
+    x341 = AD*x340/x339**2
+    x342 = K[22]*x341
+    x343 = x62 + x64 + x66 + x70 + x72 + x74 + x76 + x80 + x99 + 1
+    x344 = AD + K[23]*(x343 + x68)
+    x345 = PP2A*k[23]
+    x346 = AD*x345/x344**2
+    x347 = K[23]*x346
+    x348 = x342*x89 + x347*x98
+    x349 = x342*x37 + x347*x61
+    x350 = x17*x334
+    x351 = x342*x39
+    x352 = x347*x63
+    x353 = x342*x45
+    x354 = x347*x69
+    x355 = -x329 - x333 + x342*x55 + x347*x79 + x332/x331 + x328/x327
+    x356 = x21*x334 - x341*(K[22]*x51 + 1) - x346*(K[23]*x75 + 1) + x345/x344 + x340/x339
+    x357 = x148*x342
+    x358 = x150*x347
+    x359 = x19*x334
+    x360 = x154*x342 + x155*x347
+    x361 = AD + K[24]*(x24 + x330)
+    x362 = k[24]*x30
+    x363 = AD*x362/x361**2
+    x364 = K[24]*x363
+    x365 = x165*x364
+    x366 = ABD + K[25]*(x338 + x54)
+    x367 = PP1*k[25]
+    x368 = ABD*x367/x366**2
+    x369 = K[25]*x368
+    x370 = x369*x89
+    x371 = ABD + K[26]*(x343 + x78)
+    x372 = PP2A*k[26]
+    x373 = ABD*x372/x371**2
+    x374 = K[26]*x373
+    x375 = x374*x98
+    x376 = x25*x364
+    x377 = x213 + x336 + x376
+    x378 = x369*x37
+    x379 = x374*x61
+    x380 = -x17*x364 + x369*x39 + x374*x63
+    x381 = x369*x45 + x374*x69
+    x382 = x369*x55
+    x383 = x374*x79
+    x384 = x23*x364
+    x385 = x143*x369 + x144*x374 - x363 + x362/x361
+    x386 = x19*x364 - x368*(K[25]*x41 + 1) - x373*(K[26]*x65 + 1) + x372/x371 + x367/x366
+    x387 = x154*x369
+    x388 = x155*x374
+    x389 = ABD + K[27]*(x166 + x18 + x22 + x24 + x26 + 1)
+    x390 = x389**(-2)
+    x391 = ABGD + K[28]*(x38 + x40 + x42 + x44 + x46 + x48 + x52 + x54 + x56 + x90 + 1)
+    x392 = PP1*k[28]
+    x393 = ABGD*x392/x391**2
+    x394 = K[28]*x393
+    x395 = x394*x89
+    x396 = ABGD + K[29]*(x62 + x64 + x66 + x68 + x70 + x72 + x76 + x78 + x80 + x99 + 1)
+    x397 = PP2A*k[29]
+    x398 = ABGD*x397/x396**2
+    x399 = K[29]*x398
+    x400 = x399*x98
+    x401 = k[27]*x30
+    x402 = ABD*x390*x401
+    x403 = K[27]*x402
+    x404 = x25*x403
+    x405 = x269 - x376 + x404
+    x406 = x37*x394
+    x407 = x399*x61
+    x408 = x39*x394
+    x409 = x399*x63
+    x410 = x17*x403
+    x411 = x394*x45
+    x412 = x399*x69
+    x413 = x394*x55
+    x414 = x399*x79
+    x415 = x23*x403
+    x416 = x143*x394
+    x417 = x144*x399
+    x418 = x21*x403
+    x419 = x148*x394 + x150*x399 - x402 + x401/x389
+    x420 = x392/x391
+    x421 = x397/x396
+    x422 = x393*(K[28]*x47 + 1)
+    x423 = x398*(K[29]*x71 + 1)
+    x424 = x303 - x404
+    J = np.zeros((9,9))
+    J[0,0] = -x15 + x16 - x3 - x32 + x33 + x4
+    J[0,1] = -x106 - x109 - x120 - x36 + x60 + x84 - x86 - x88 - x97
+    J[0,2] = -x109 - x113 - x118 + x121 + x122 - x123 - x124 - x127
+    J[0,3] = -x128 - x129 + x130 - x131 - x132
+    J[0,4] = -x125*x45 - x126*x69 + x133 - x134 - x135 - x136 - x137
+    J[0,5] = -x104 + x138 + x139 - x140 - x141 - x142 - x95
+    J[0,6] = -x145 - x146 - x147
+    J[0,7] = -x149 - x151 - x152 - x153
+    J[0,8] = -x105*x155 - x114*x154 - x119*x155 - x125*x154 - x126*x155 - x154*x96
+    J[1,0] = x164 + x172 + x3 + x32 - x33 - x4
+    J[1,1] = -k_isoR + x170 - x173 - x175 - x35 - x60 - x84 + x86 + x88
+    J[1,2] = k_isoF + x127 + x162 + x170
+    J[1,3] = x131 + x177 + x179
+    J[1,4] = A*(x161*x180 + x181*x45 + x182*x69)
+    J[1,5] = x142 + x183
+    J[1,6] = x145 + x184
+    J[1,7] = x152 + x185
+    J[1,8] = A*(x154*x181 + x155*x182)
+    J[2,0] = Atr*(x163*x187 + x171*x189)
+    J[2,1] = k_isoR + x120 + x190 - x196 - x202 + x212
+    J[2,2] = -k_isoF + x113 + x118 - x121 - x122 + x203 - x213 - x214 - x215 - x216 - x217
+    J[2,3] = x132 + x218 + x220
+    J[2,4] = x134 + x135 - x221 - x222 + x223 - x224
+    J[2,5] = x140 + x141 - x225 - x226 + x227 - x228
+    J[2,6] = x147 + x229 + x230
+    J[2,7] = x149 + x151 - x231 - x232 + x233 - x234
+    J[2,8] = Atr*K2_fast*PP1*k2_fast*x111*x154 + Atr*K3_fast*PP2A*k3_fast*x116*x155 - x235 - x236 - x237
+    J[3,0] = -x171*x203 - x172 + x242 + x247
+    J[3,1] = x173 - x212 - x253 - x259 - x268 - x271
+    J[3,2] = -x203 + x214 + x215 + x216 - x271 - x272 - x273 - x274
+    J[3,3] = -x179 - x220 - x275 - x276
+    J[3,4] = x224 + x277 - x278 - x279 + x280
+    J[3,5] = -x183 + x225 + x226 - x227 - x281 - x282 + x283 - x284
+    J[3,6] = -x184 - x229 - x285 - x286 + x287 - x288
+    J[3,7] = -x185 + x231 + x232 - x233 + x289 + x290 + x291 - x292 - x293 - x294 - x295
+    J[3,8] = x235 + x236 - x296 - x297
+    J[4,0] = ABG*K[18]*PKC*k[18]*x156*x299 - x247
+    J[4,1] = x253 + x259 - x304 - x313
+    J[4,2] = x272 + x273 - x304 - x314
+    J[4,3] = x275 + x315 - x316 - x317
+    J[4,4] = -x280 - x318
+    J[4,5] = x281 + x282 - x283 - x319
+    J[4,6] = x285 + x286 - x287 - x320
+    J[4,7] = -x289 + x294 + x295 - x321
+    J[4,8] = x296 + x322 + x323 - x324 - x325
+    J[5,0] = x15 - x16 + x335
+    J[5,1] = x106 - x337 - x348 + x97
+    J[5,2] = x123 + x124 - x337 - x349
+    J[5,3] = x128 + x129 - x130 + x350 - x351 - x352
+    J[5,4] = -x133 + x136 + x137 - x353 - x354
+    J[5,5] = x104 - x138 - x139 - x355 + x95
+    J[5,6] = x146 + x356
+    J[5,7] = x153 - x357 - x358 + x359
+    J[5,8] = D*K[10]*PP1*k[10]*x154*x93 + D*K[11]*PP2A*k[11]*x102*x155 - x360
+    J[6,0] = -x163*x190 - x164 - x335 + x365
+    J[6,1] = x175 + x196 + x202 + x348 - x370 - x375 + x377
+    J[6,2] = x174 + x217 + x349 + x377 - x378 - x379
+    J[6,3] = -x177 - x218 - x350 + x351 + x352 - x380
+    J[6,4] = -x162*x180 + x221 + x222 - x223 + x353 + x354 - x381
+    J[6,5] = x228 + x355 - x382 - x383 + x384
+    J[6,6] = -x230 - x356 - x385
+    J[6,7] = x234 + x357 + x358 - x359 + x386
+    J[6,8] = x237 + x360 - x387 - x388
+    J[7,0] = ABD*K[27]*PKA*k[27]*naScale*x165*x390 - x242 - x365
+    J[7,1] = x268 + x370 + x375 - x395 - x400 + x405
+    J[7,2] = x274 + x378 + x379 + x405 - x406 - x407
+    J[7,3] = x276 + x380 - x408 - x409 + x410
+    J[7,4] = -x277 + x278 + x279 + x381 - x411 - x412
+    J[7,5] = x284 + x382 + x383 - x384 - x413 - x414 + x415
+    J[7,6] = x288 + x385 - x416 - x417 + x418
+    J[7,7] = -x290 - x291 + x292 + x293 - x386 - x419
+    J[7,8] = x297 + x387 + x388 + x420 + x421 - x422 - x423
+    J[8,0] = -x156*x302 - x165*x403
+    J[8,1] = x313 + x395 + x400 + x424
+    J[8,2] = x314 + x406 + x407 + x424
+    J[8,3] = -x315 + x316 + x317 + x408 + x409 - x410
+    J[8,4] = x318 + x411 + x412
+    J[8,5] = x319 + x413 + x414 - x415
+    J[8,6] = x320 + x416 + x417 - x418
+    J[8,7] = x321 + x419
+    J[8,8] = -x322 - x323 + x324 + x325 - x420 - x421 + x422 + x423
+    return J
 
 # def cMyBPC_model_final_tQSSA(t,ICs,params,naFun,naFunParams): 
     
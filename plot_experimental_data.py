@@ -39,6 +39,7 @@ sys.path.append(fileDirectory)
 
 import functions_cMyBPC as fun
 import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 from scipy.optimize import curve_fit
 from matplotlib import cm
@@ -63,12 +64,16 @@ xPstr = ['4P','3P','2P','1P','0P']
 
 def plot_TC_exp(n,ttl='',flnm=''):
     plt.figure(figsize=(4.1,3.5))
+    # replicate statistics in one reduction over the trailing replicate axis
+    A = expDat[n].reshape(expDat[n].shape[0],-1,expReps[n])
+    means_all = A.mean(2)
+    SDs_all = A.std(2)
     for i in range(1,6):
         
-        plt.plot(np.asarray(time_intp)/60,expDat_interpol[n][i-1,:],'-',color=colV[i-1],lw=2.5)
-        means = np.mean(expDat[n][:,(i-1)*expReps[n]:(i-1)*expReps[n]+expReps[n]],1)
-        SDs = np.std(expDat[n][:,(i-1)*expReps[n]:(i-1)*expReps[n]+expReps[n]],1) 
-        plt.errorbar(time_exp[n]/60,means,yerr=SDs,fmt='o', mfc=colV[i-1], ecolor = 'k', mec ='k', capsize = 5, ms=9)
+        plt.plot(time_intp_min,expDat_interpol[n][i-1,:],'-',color=colV[i-1],lw=2.5)
+        means = means_all[:,i-1]
+        SDs = SDs_all[:,i-1] 
+        plt.errorbar(time_exp_min[n],means,yerr=SDs,fmt='o', mfc=colV[i-1], ecolor = 'k', mec ='k', capsize = 5, ms=9)
         plt.ylabel("fraction",fontsize=17)
         plt.ylim(0,1)
         plt.yticks([0,0.25,0.5,0.75,1],fontsize=14)
@@ -79,15 +84,20 @@ def plot_TC_exp(n,ttl='',flnm=''):
     if saveFigs == True:
         print("figure "+flnm+'.svg'+" saved")
         plt.savefig(os.path.join(path_figures, flnm+'.svg'), bbox_inches = "tight")
-
-    plt.show()
+        plt.close() # figure is on disk; close instead of drawing it a second time
+    else:
+        plt.show()
     
 def plot_SS_exp(n,figNr = 1, ttl='',flnm=''):
+    # replicate statistics in one reduction over the trailing replicate axis
+    A = expDat[n].reshape(expDat[n].shape[0],-1,expReps[n])
+    means_all = A.mean(2)
+    SDs_all = A.std(2)
     for i in range(1,5): #3:0P, 2:1P, 1: 2P, 0:3P4P
         
-        plt.plot(np.asarray(pka_intp),expDat_interpol[n][i-1,:],'-',color=colV[i],lw=2.5)
-        means = np.mean(expDat[n][:,(i-1)*expReps[n]:(i-1)*expReps[n]+expReps[n]],1)
-        SDs = np.std(expDat[n][:,(i-1)*expReps[n]:(i-1)*expReps[n]+expReps[n]],1) 
+        plt.plot(pka_intp,expDat_interpol[n][i-1,:],'-',color=colV[i],lw=2.5)
+        means = means_all[:,i-1]
+        SDs = SDs_all[:,i-1] 
         plt.errorbar(pka_exp,means,yerr=SDs,fmt='o', mfc=colV[i], ecolor = 'k', mec ='k', capsize = 5, ms=9)
         plt.ylabel("fraction",fontsize=17)
         plt.ylim(0,1)
@@ -113,33 +123,37 @@ expDat_interpol = []
 
 # define timepoints for which to interpolate experimental timecourse data
 time_exp = []
-time_intp = list(range(0,3601))
+time_intp = np.arange(0,3601,dtype=np.float64)
+time_intp_min = time_intp/60 # cached: replotted for every timecourse figure
+
+# parse each file once and reuse it (expSS_PKAvsPP1 was previously loaded twice)
+# read_csv uses the C tokenizer; loadtxt's str round-trip was the slow path
+datRaw = [pd.read_csv(p,sep='\t',dtype=np.float64).to_numpy() for p in datFlNm]
 
 # define PKA concentrations for which to interpolate experimental dose response data
-dataRaw = np.loadtxt(datFlNm[2],delimiter='\t',dtype=str)
-pka_exp = np.asarray(dataRaw[1:,0],dtype='float')
-pka_intp = np.geomspace(3.125e-9,8e-7,num=100,endpoint=True)
-pka_intp = np.append(pka_intp,pka_exp)
-pka_intp = np.unique(pka_intp)
-pka_intp = np.sort(pka_intp)
+pka_exp = datRaw[2][:,0]
+# union1d merges, dedups and sorts in one call
+pka_intp = np.union1d(np.geomspace(3.125e-9,8e-7,num=100,endpoint=True),pka_exp)
 
 # load and interpolate experimental data
 
 for n in range(len(datFlNm)):
-    dataRaw = np.loadtxt(datFlNm[n],delimiter='\t',dtype=str)
-    dataClean = np.asarray(dataRaw[1:,1:],dtype='float')
+    dataRaw = datRaw[n]
+    dataClean = dataRaw[:,1:]
     
     if n <=1: #
-        t_exp = np.asarray(dataRaw[1:,0],dtype='float')*60
+        t_exp = dataRaw[:,0]*60
         intpDat = fun.intpExpDat(t_exp,dataClean,time_intp,expReps[n])
         time_exp.append(t_exp)
     
     if n == 2:
-        pka_exp = np.asarray(dataRaw[1:,0],dtype='float')
+        pka_exp = dataRaw[:,0]
         intpDat = fun.intpExpDat(pka_exp,dataClean,pka_intp,expReps[n])
     
     expDat.append(dataClean)
     expDat_interpol.append(intpDat)
+
+time_exp_min = [t/60 for t in time_exp] # minute axes computed once, not per errorbar call
     
 
 # plot timecourse data (Figure 1B)
@@ -151,22 +165,20 @@ plot_TC_exp(1,'','exp_4PcMyBPCvsPP2A')
 
 plt.figure(1,figsize=(4.1,3.5))
 
-nHs_hill = []
-Ks_hill = []
+nHs_hill = np.empty(3)
+Ks_hill = np.empty(3)
 
 # fit experimental data to Hill-equation
 for i in range(3):
-    expDat[n][:,(i-1)*expReps[n]:(i-1)*expReps[n]+expReps[n]]
     par_opt, _ = curve_fit(fun.hillEQ, pka_exp, expDat[2][:,i], p0 = [1, 1e-9], bounds=(0,[10,1e-3]))
-    nHs_hill.append(par_opt[0])
-    Ks_hill.append(par_opt[1])
+    nHs_hill[i], Ks_hill[i] = par_opt
     plt.xscale('log')
         
 # plot experimental and interpolated data 
 plot_SS_exp(2,1,'')
 
 # plot Hill-curve 
-plt.plot(pka_intp, fun.hillEQ(pka_intp,np.average(nHs_hill),np.average(Ks_hill)), ':',color=colV[1], lw = 5)
+plt.plot(pka_intp, fun.hillEQ(pka_intp,nHs_hill.mean(),Ks_hill.mean()), ':',color=colV[1], lw = 5)
 
 if saveFigs == True:
     print("figure "+'exp_SS_PKAvsPP1'+'.svg'+" saved")
@@ -176,7 +188,7 @@ plt.show()
 # plot distribution of fitted Hill-exponents
 plt.figure(figsize=(0.7,1.5))
 plt.plot([1,1,1], nHs_hill, 'o',color=colV[1], mec ='k', alpha = 0.5)
-plt.plot([1], np.average(nHs_hill), '_k',ms=15)
+plt.plot([1], nHs_hill.mean(), '_k',ms=15)
 plt.xticks([]); plt.ylim([0,3])
 plt.title('n$_H$',weight='bold',fontsize=14)
 print("figure "+'exp_SS_PKAvsPP1_inset'+'.svg'+" saved")
@@ -188,8 +200,7 @@ plt.savefig(os.path.join(path_figures, 'exp_SS_PKAvsPP1_inset'+'.svg'), bbox_inc
 # paths to experimental data
 datFlNm = os.path.join(path_expdat, 'SYPRO_plotting.txt')
 
-dataRaw = np.loadtxt(datFlNm,delimiter='\t',dtype=str)
-SYPRO_exp = np.asarray(dataRaw[1:,:],dtype='float')
+SYPRO_exp = pd.read_csv(datFlNm,sep='\t',dtype=np.float64).to_numpy()
 
 plt.figure(figsize=(2.5,4))
 plt.plot(np.arange(1,5),np.mean(SYPRO_exp,axis = 0),'_k',ms=20)
@@ -209,10 +220,9 @@ plt.savefig(os.path.join(path_figures, 'SYPROdata.svg'),dpi=400, bbox_inches = "
 
 print('Analysis Sypro data')
 print('-------------------')
-pvals = []
-for i in range(3):
-    pvals.append(stats.ttest_ind(SYPRO_exp[:,0], SYPRO_exp[:,i+1], equal_var=True)[1])
-    # pvals.append(stats.ttest_1samp(a=SYPRO_exp[:,i+1], popmean=100)[1])
+# all three comparisons against 0P in one vectorized call
+pvals = stats.ttest_ind(SYPRO_exp[:,[0]], SYPRO_exp[:,1:4], equal_var=True, axis=0).pvalue
+# pvals = stats.ttest_1samp(a=SYPRO_exp[:,1:4], popmean=100, axis=0).pvalue
 stats_corrected = fdrcorrection(pvals)
 for i in range(3):
     print(['alpha','alpha,beta','alpha,beta,gamma'][i]+' significantly different from 0P? ', stats_corrected[0][i], ' p = ', stats_corrected[1][i])
@@ -221,26 +231,17 @@ for i in range(3):
 
 # paths to experimental data
 datFlNm = os.path.join(path_expdat, 'MST_unphos.txt')
-dataRaw = np.loadtxt(datFlNm,delimiter='\t',dtype=str)
-dataRaw[np.where(dataRaw == '')]=np.nan
-MST_unphos_exp = np.asarray(dataRaw[1:,:],dtype='float')
+MST_unphos_exp = pd.read_csv(datFlNm,sep='\t',dtype=np.float64).to_numpy() # empty fields become NaN
 datFlNm = os.path.join(path_expdat, 'MST_thiophos.txt')
-dataRaw = np.loadtxt(datFlNm,delimiter='\t',dtype=str)
-dataRaw[np.where(dataRaw == '')]=np.nan
-MST_thiophos_exp = np.asarray(dataRaw[1:,:],dtype='float')
+MST_thiophos_exp = pd.read_csv(datFlNm,sep='\t',dtype=np.float64).to_numpy()
 
 plt.figure(figsize=(4,4))
-for i in range(MST_unphos_exp.shape[0]-1):
-    m = MST_unphos_exp[i,1:]
-    idcs = np.where(np.invert(np.isnan(m)))[0]
-    m_n = m[idcs]
-    plt.errorbar(MST_unphos_exp[i,0]*1e-6, np.mean(m_n),yerr=np.std(m_n)/np.sqrt(len(m_n)),fmt='o',color=colV[4])
-    
-for i in range(MST_thiophos_exp.shape[0]-1):
-    m = MST_thiophos_exp[i,1:]
-    idcs = np.where(np.invert(np.isnan(m)))[0]
-    m_n = m[idcs]
-    plt.errorbar(MST_thiophos_exp[i,0]*1e-6, np.mean(m_n),yerr=np.std(m_n)/np.sqrt(len(m_n)),fmt='o',color=colV[0])
+# one errorbar call per condition: nan-aware reductions over the replicate axis
+for dat,col in [(MST_unphos_exp,colV[4]),(MST_thiophos_exp,colV[0])]:
+    reps = dat[:-1,1:]
+    nReps = np.count_nonzero(~np.isnan(reps),axis=1)
+    plt.errorbar(dat[:-1,0]*1e-6, np.nanmean(reps,axis=1),
+                 yerr=np.nanstd(reps,axis=1)/np.sqrt(nReps),fmt='o',color=col)
     
 par_unphos = []
 par_thiophos = []
@@ -249,9 +250,9 @@ par_thiophos = []
 for i in range(MST_unphos_exp.shape[1]-1):
 
     m = MST_unphos_exp[:,i+1]
-    idcs = np.where(np.invert(np.isnan(m)))[0]
-    m_n = m[idcs]
-    ligand = MST_unphos_exp[idcs,0]*1e-6
+    notNan = ~np.isnan(m)
+    m_n = m[notNan]
+    ligand = MST_unphos_exp[notNan,0]*1e-6
     
     par_opt, _ = curve_fit(fun.bindingEQ, ligand, m_n, p0 = [0.05*1e-6, 0.5, 0.5, 1e-6], bounds=([0.049*1e-6,0,0,0.01*1e-6],[0.05*1e-6,1,1,10*1e-6]))
     par_unphos.append(par_opt[:])
@@ -259,9 +260,9 @@ for i in range(MST_unphos_exp.shape[1]-1):
 for i in range(MST_thiophos_exp.shape[1]-1):
 
     m = MST_thiophos_exp[:,i+1]
-    idcs = np.where(np.invert(np.isnan(m)))[0]
-    m_n = m[idcs]
-    ligand = MST_thiophos_exp[idcs,0]*1e-6
+    notNan = ~np.isnan(m)
+    m_n = m[notNan]
+    ligand = MST_thiophos_exp[notNan,0]*1e-6
     
     par_opt, _ = curve_fit(fun.bindingEQ, ligand, m_n, p0 = [0.05*1e-6, 0.5, 0.5, 1e-6], bounds=([0.049*1e-6,0,0,0.01*1e-6],[0.05*1e-6,1,1,10*1e-6]))
     par_thiophos.append(par_opt[:])
@@ -311,8 +312,7 @@ print('Kd of thiophosphorylated lower than unphosphorylated? p=',stats.ttest_ind
 
 # paths to experimental data
 datFlNm = os.path.join(path_expdat, 'pNPP.txt')
-dataRaw = np.loadtxt(datFlNm,delimiter='\t',dtype=str)
-pNPP_exp = np.flipud(np.asarray(dataRaw[1:,:],dtype='float'))
+pNPP_exp = np.flipud(pd.read_csv(datFlNm,sep='\t',dtype=np.float64).to_numpy())
 
 
 # fit
@@ -362,13 +362,11 @@ print('Vmax/Km of pNPP assay different between conditions? p = '+str(anova_Vmax)
 # plot
 
 plt.figure(figsize=(4,4))
-for i in range(pNPP_exp.shape[0]-1):
-    pNPP_pp1 = pNPP_exp[i,1:4]
-    pNPP_pp1_c1mc2 = pNPP_exp[i,4:7]
-    pNPP_pp1_tpc1mc2 = pNPP_exp[i,7:]
-    plt.errorbar(pNPP_exp[i,0]*1e-3, np.mean(pNPP_pp1),yerr=np.std(pNPP_pp1)/np.sqrt(len(pNPP_pp1)),fmt='o',color='teal')
-    plt.errorbar(pNPP_exp[i,0]*1e-3, np.mean(pNPP_pp1_c1mc2),yerr=np.std(pNPP_pp1_c1mc2)/np.sqrt(len(pNPP_pp1_c1mc2)),fmt='o',color=colV[4])
-    plt.errorbar(pNPP_exp[i,0]*1e-3, np.mean(pNPP_pp1_tpc1mc2),yerr=np.std(pNPP_pp1_tpc1mc2)/np.sqrt(len(pNPP_pp1_tpc1mc2)),fmt='o',color=colV[0])
+# one errorbar call per condition instead of three artists per substrate row
+for cols,col in [(slice(1,4),'teal'),(slice(4,7),colV[4]),(slice(7,None),colV[0])]:
+    reps = pNPP_exp[:-1,cols]
+    plt.errorbar(pNPP_exp[:-1,0]*1e-3, np.mean(reps,axis=1),
+                 yerr=np.std(reps,axis=1)/np.sqrt(reps.shape[1]),fmt='o',color=col)
     
 
 x = np.linspace(0,0.045,100)
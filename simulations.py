@@ -66,14 +66,13 @@ import matplotlib.pyplot as plt
 from scipy import stats
 from scipy.integrate import solve_ivp 
 from scipy.optimize import curve_fit
+from joblib import Parallel, delayed
 from statsmodels.stats.multitest import fdrcorrection
-import warnings
 from matplotlib import cm
 
 
 #%% cell 1: Miscellaneous settings
 
-warnings.filterwarnings("error")
 plt.rcParams.update({'font.family':'Arial'})
 
 saveFigs = True # saves figures as files
@@ -108,15 +107,17 @@ paramsHJ[:,[12,15,18,21]] = pkc_kcat
 # Add experimentally measured RSK2 parameters to fitted parameterset
 paramsRSK2 = np.array([1.8,1.8,1.3e-6,1.3e-6]) # kcat reaction 31 and 32, Km reaction 31 and 32
 
+# per-parameterset views into paramsHJ (k, K, additionalParams), sliced once
+# here instead of once per sweep point
+paramSlices = [(paramsHJ[p,2:32],paramsHJ[p,32:62],paramsHJ[p,62:]) for p in range(nr_paramsets)]
+
 
 #%% cell 2: Function definitions 
 
 # define colors for plotting
 cmap = cm.get_cmap('gnuplot2',7)
-colV = []
-for i in [0,0.3,0.5,0.6,0.8]: colV.append(cmap(i)[:3])
+colV = [cmap(i)[:3] for i in [0,0.3,0.5,0.6,0.8]]
 c4P,c3P,c2P,c1P,c0P = colV
-xPstr = ['4P','3P','2P','1P','0P']
 
 
 
@@ -154,9 +155,12 @@ def plot_SS_3D(kinase_name, kinase_vector, PPase_name,PPase_vector,xtick_array =
     fig = plt.figure(figsize=(7.5,7.5))
     ax = plt.axes(projection='3d')
 
+    log_kinase = np.log(kinase_vector) # log-transformed once, reused for every phosphatase level
+
     for p in range(len(PPase_vector)):
         
         PPase = np.ones(len(kinase_vector))*PPase_vector[p]
+        log_PPase = np.log(PPase)
         
         avg_0P = np.average(simDat_rel_fracs_SS[:,p,:,4], axis = 0)
         avg_1P = np.average(simDat_rel_fracs_SS[:,p,:,3], axis = 0)
@@ -172,47 +176,50 @@ def plot_SS_3D(kinase_name, kinase_vector, PPase_name,PPase_vector,xtick_array =
         
         #plot averages
                             
-        plt.plot(np.log(kinase_vector),np.log(PPase),avg_0P,color=c0P, alpha=0.5, lw=2.75)
-        plt.plot(np.log(kinase_vector),np.log(PPase),avg_1P,color=c1P, alpha=0.5, lw=2.75)   
-        plt.plot(np.log(kinase_vector),np.log(PPase),avg_2P,color=c2P, alpha=0.5, lw=2.75) 
-        plt.plot(np.log(kinase_vector),np.log(PPase),avg_3P,color=c3P, alpha=0.5, lw=2.75) 
-        plt.plot(np.log(kinase_vector),np.log(PPase),avg_4P,color=c4P, alpha=0.5, lw=2.75)
+        plt.plot(log_kinase,log_PPase,avg_0P,color=c0P, alpha=0.5, lw=2.75)
+        plt.plot(log_kinase,log_PPase,avg_1P,color=c1P, alpha=0.5, lw=2.75)   
+        plt.plot(log_kinase,log_PPase,avg_2P,color=c2P, alpha=0.5, lw=2.75) 
+        plt.plot(log_kinase,log_PPase,avg_3P,color=c3P, alpha=0.5, lw=2.75) 
+        plt.plot(log_kinase,log_PPase,avg_4P,color=c4P, alpha=0.5, lw=2.75)
         
         #plot errors
         
-        fb3d.fill_between_3d(ax,np.log(kinase_vector),np.log(PPase),avg_0P-sd_0P, np.log(kinase_vector),np.log(PPase),avg_0P+sd_0P,  c=c0P, mode = 1,alpha=0.15)
-        fb3d.fill_between_3d(ax,np.log(kinase_vector),np.log(PPase),avg_1P-sd_1P, np.log(kinase_vector),np.log(PPase),avg_1P+sd_1P,  c=c1P, mode = 1,alpha=0.15)
-        fb3d.fill_between_3d(ax,np.log(kinase_vector),np.log(PPase),avg_2P-sd_2P, np.log(kinase_vector),np.log(PPase),avg_2P+sd_2P,  c=c2P, mode = 1,alpha=0.15)
-        fb3d.fill_between_3d(ax,np.log(kinase_vector),np.log(PPase),avg_3P-sd_3P, np.log(kinase_vector),np.log(PPase),avg_3P+sd_3P,  c=c3P, mode = 1,alpha=0.15)
-        fb3d.fill_between_3d(ax,np.log(kinase_vector),np.log(PPase),avg_4P-sd_4P, np.log(kinase_vector),np.log(PPase),avg_4P+sd_4P,  c=c4P, mode = 1,alpha=0.15)
-        
-        # logtransform tick labels
-        plot_xticks = np.log(xtick_array)      
-        ax.set_xticks(plot_xticks)
-        ax.set_xticklabels((str(x) for x in xtick_array),fontsize=14)
-        plt.xlabel('\n['+kinase_name+'] (mol/L)',fontsize=16)
-        
-        plot_yticks = np.log(PPase_vector)      
-        ax.set_yticks(plot_yticks)
-        ax.set_yticklabels((str(x) for x in PPase_vector),fontsize=14)
-        plt.ylabel('\n['+PPase_name+'] (mol/L)',fontsize=16)
+        fb3d.fill_between_3d(ax,log_kinase,log_PPase,avg_0P-sd_0P, log_kinase,log_PPase,avg_0P+sd_0P,  c=c0P, mode = 1,alpha=0.15)
+        fb3d.fill_between_3d(ax,log_kinase,log_PPase,avg_1P-sd_1P, log_kinase,log_PPase,avg_1P+sd_1P,  c=c1P, mode = 1,alpha=0.15)
+        fb3d.fill_between_3d(ax,log_kinase,log_PPase,avg_2P-sd_2P, log_kinase,log_PPase,avg_2P+sd_2P,  c=c2P, mode = 1,alpha=0.15)
+        fb3d.fill_between_3d(ax,log_kinase,log_PPase,avg_3P-sd_3P, log_kinase,log_PPase,avg_3P+sd_3P,  c=c3P, mode = 1,alpha=0.15)
+        fb3d.fill_between_3d(ax,log_kinase,log_PPase,avg_4P-sd_4P, log_kinase,log_PPase,avg_4P+sd_4P,  c=c4P, mode = 1,alpha=0.15)
         
-        ax.set_zlim([0,1])
-        ax.set_zlabel('\n fraction',fontsize=16)
-        ax.zaxis.set_tick_params(labelsize=14)
-        # ax.set_zticklabels([0,0.2,0.4,0.6,0.8,1],fontsize=14)
-     
-        ax.grid(False)
+    # logtransform tick labels
+    plot_xticks = np.log(xtick_array)      
+    ax.set_xticks(plot_xticks)
+    ax.set_xticklabels((str(x) for x in xtick_array),fontsize=14)
+    plt.xlabel('\n['+kinase_name+'] (mol/L)',fontsize=16)
+    
+    plot_yticks = np.log(PPase_vector)      
+    ax.set_yticks(plot_yticks)
+    ax.set_yticklabels((str(x) for x in PPase_vector),fontsize=14)
+    plt.ylabel('\n['+PPase_name+'] (mol/L)',fontsize=16)
+    
+    ax.set_zlim([0,1])
+    ax.set_zlabel('\n fraction',fontsize=16)
+    ax.zaxis.set_tick_params(labelsize=14)
+    # ax.set_zticklabels([0,0.2,0.4,0.6,0.8,1],fontsize=14)
      
-      
+    ax.grid(False)
+
+
 def plot_SS_3D_noD(kinase_name, kinase_vector, PPase_name,PPase_vector,xtick_array = np.array([1e-11,1e-10,1e-9,1e-8,1e-7,1e-6,1e-5])):
     
     fig = plt.figure(figsize=(7.5,7.5))
     ax = plt.axes(projection='3d')
 
+    log_kinase = np.log(kinase_vector) # log-transformed once, reused for every phosphatase level
+
     for p in range(len(PPase_vector)):
         
         PPase = np.ones(len(kinase_vector))*PPase_vector[p]
+        log_PPase = np.log(PPase)
         
         # 0 P0, 1 A, 2 At, 3 AB, 4 ABG, 5 D, 6 AD, 7 ABD, 8 ABGD
                 
@@ -229,65 +236,68 @@ def plot_SS_3D_noD(kinase_name, kinase_vector, PPase_name,PPase_vector,xtick_arr
         
         #plot averages
                             
-        plt.plot(np.log(kinase_vector),np.log(PPase),avg_0P,color=c0P, alpha=0.5, lw=2.5)
-        plt.plot(np.log(kinase_vector),np.log(PPase),avg_A,color=c1P, alpha=0.5, lw=2.5)   
-        plt.plot(np.log(kinase_vector),np.log(PPase),avg_AB,color=c2P, alpha=0.5, lw=2.5) 
-        plt.plot(np.log(kinase_vector),np.log(PPase),avg_ABG,color=c3P, alpha=0.5, lw=2.5) 
+        plt.plot(log_kinase,log_PPase,avg_0P,color=c0P, alpha=0.5, lw=2.5)
+        plt.plot(log_kinase,log_PPase,avg_A,color=c1P, alpha=0.5, lw=2.5)   
+        plt.plot(log_kinase,log_PPase,avg_AB,color=c2P, alpha=0.5, lw=2.5) 
+        plt.plot(log_kinase,log_PPase,avg_ABG,color=c3P, alpha=0.5, lw=2.5) 
         
         #plot errors
         
-        fb3d.fill_between_3d(ax,np.log(kinase_vector),np.log(PPase),avg_0P-sd_0P, np.log(kinase_vector),np.log(PPase),avg_0P+sd_0P,  c=c0P, mode = 1,alpha=0.15)
-        fb3d.fill_between_3d(ax,np.log(kinase_vector),np.log(PPase),avg_A-sd_A, np.log(kinase_vector),np.log(PPase),avg_A+sd_A,  c=c1P, mode = 1,alpha=0.15)
-        fb3d.fill_between_3d(ax,np.log(kinase_vector),np.log(PPase),avg_AB-sd_AB, np.log(kinase_vector),np.log(PPase),avg_AB+sd_AB,  c=c2P, mode = 1,alpha=0.15)
-        fb3d.fill_between_3d(ax,np.log(kinase_vector),np.log(PPase),avg_ABG-sd_ABG, np.log(kinase_vector),np.log(PPase),avg_ABG+sd_ABG,  c=c3P, mode = 1,alpha=0.15)
+        fb3d.fill_between_3d(ax,log_kinase,log_PPase,avg_0P-sd_0P, log_kinase,log_PPase,avg_0P+sd_0P,  c=c0P, mode = 1,alpha=0.15)
+        fb3d.fill_between_3d(ax,log_kinase,log_PPase,avg_A-sd_A, log_kinase,log_PPase,avg_A+sd_A,  c=c1P, mode = 1,alpha=0.15)
+        fb3d.fill_between_3d(ax,log_kinase,log_PPase,avg_AB-sd_AB, log_kinase,log_PPase,avg_AB+sd_AB,  c=c2P, mode = 1,alpha=0.15)
+        fb3d.fill_between_3d(ax,log_kinase,log_PPase,avg_ABG-sd_ABG, log_kinase,log_PPase,avg_ABG+sd_ABG,  c=c3P, mode = 1,alpha=0.15)
        
-        # logtransform tick labels
-        plot_xticks = np.log(xtick_array)      
-        ax.set_xticks(plot_xticks)
-        ax.set_xticklabels((str(x) for x in xtick_array),fontsize=14)
-        plt.xlabel('\n['+kinase_name+'] (mol/L)',fontsize=16)
-        
-        plot_yticks = np.log(PPase_vector)      
-        ax.set_yticks(plot_yticks)
-        ax.set_yticklabels((str(x) for x in PPase_vector),fontsize=14)
-        plt.ylabel('\n['+PPase_name+'] (mol/L)',fontsize=16)
-        
-        ax.set_zlim([0,1])
-        ax.set_zlabel('\n fraction',fontsize=16)
-        ax.zaxis.set_tick_params(labelsize=14)
+    # logtransform tick labels
+    plot_xticks = np.log(xtick_array)      
+    ax.set_xticks(plot_xticks)
+    ax.set_xticklabels((str(x) for x in xtick_array),fontsize=14)
+    plt.xlabel('\n['+kinase_name+'] (mol/L)',fontsize=16)
+    
+    plot_yticks = np.log(PPase_vector)      
+    ax.set_yticks(plot_yticks)
+    ax.set_yticklabels((str(x) for x in PPase_vector),fontsize=14)
+    plt.ylabel('\n['+PPase_name+'] (mol/L)',fontsize=16)
+    
+    ax.set_zlim([0,1])
+    ax.set_zlabel('\n fraction',fontsize=16)
+    ax.zaxis.set_tick_params(labelsize=14)
      
-        ax.grid(False)
-              
+    ax.grid(False)
+
+
 def run_simulation(ICs,params,t0,t_end,h,naFun,naFunParams,model = mod.cMyBPC_model_final,noisyS = False):
-    output = np.array([])
-    try:
-        output = fun.odeRK4(model,ICs,params,t0,t_end+1,h,naFun,naFunParams)
-        if output[np.where(output<0)].shape[0] > 0:
-            print("Numerical issue occured: negative values\n retrying with reduced stepsize: 0.1")
-            h2 = 0.1
-            if noisyS == False:                
+    output = fun.odeRK4(model,ICs,params,t0,t_end+1,h,naFun,naFunParams,stopOnFailure = (noisyS == False))
+    if np.any(output<0) or np.any(~np.isfinite(output)):
+        print("Numerical issue occured: negative or non-finite values\n retrying with reduced stepsize: 0.1")
+        h2 = 0.1
+        if noisyS == False:                
+            output = fun.odeRK4(model,ICs,params,t0,t_end+1,h2,naFun,naFunParams,stopOnFailure = True)
+            if np.any(output<0) or np.any(~np.isfinite(output)): # checked before decimating so an aborted run cannot slip through
+                print("Numerical issue occured: negative or non-finite values\n retrying with reduced stepsize: 0.01")
+                h2 = 0.01
                 output = fun.odeRK4(model,ICs,params,t0,t_end+1,h2,naFun,naFunParams)
+                output = output[:,::100]
+            else:
                 output = output[:,::10]
-                if output[np.where(output<0)].shape[0] == 0:
-                    print("succeeded!")
-                else:
-                    print("Numerical issue occured: negative values\n retrying with reduced stepsize: 0.01")
-                    h2 = 0.01
-                    output = fun.odeRK4(model,ICs,params,t0,t_end+1,h2,naFun,naFunParams)
-                    output = output[:,::100]                   
-    except RuntimeWarning:
-        try:
-            print("Numerical issue occured: runtime warning\n retrying with reduced stepsize: 0.1")
-            h2 = 0.1
-            output = fun.odeRK4(model,ICs,params,t0,t_end+1,h2,naFun,naFunParams)
-            output = output[:,::10]
-        except:
-              print("Numerical issue occured: runtime warning\n retrying with reduced stepsize: 0.01")
-              h2 = 0.01
-              output = fun.odeRK4(model,ICs,params,t0,t_end+1,h2,naFun,naFunParams)
-              output = output[:,::100] 
+                print("succeeded!")
     return output
 
+def run_SS_point(c_enzymes,p,ICs,t0,t_end,time,signalPulses):
+    # integrates a single steady state sweep point for parameterset p and
+    # returns the final state and relative phosphospecies fractions at t_end
+    k, K, additionalParams = paramSlices[p]
+    params = (k,K,additionalParams,c_enzymes,paramsRSK2)
+    
+    # only the steady state is needed, so evaluate the solution at t_end
+    # alone instead of materializing the full 1 s-resolution trajectory
+    solution = solve_ivp(mod.cMyBPC_model_final_RSK2, (t0, t_end), ICs, rtol=1.e-8, atol=1.e-8,
+                          t_eval=[t_end], args=(params,fun.fromIntv,signalPulses), method='LSODA', jac=mod.cMyBPC_model_final_RSK2_jac)  #RK45, RK23, BDF, LSODA, Radau, DOP853
+    
+    output = solution.y
+    fracs = fun.fractions(output,4)[:,0]
+    return output[:,0], fracs
+
 #############################################################
 #%% ==~~==~~==~~== SIMULATIONS ==~~==~~==~~==~~==~~==~~==~
 
@@ -318,7 +328,8 @@ c_enzymes = np.array([[1e-8,0,1e-7,0], #PKA, PKC, PP1, PP2A
                       [1e-7,0,0,1e-6]                     
                       ])         
 
-onePulse = [300,300+60*60] #start and stop of PKA pulse
+onePulse = np.array([300,300+60*60]) #start and stop of PKA pulse
+profile_signal = fun.sig2array(onePulse,t_end+1,h) # same for every enzyme combination, computed once
 
 for l in range(2):
     for i in range(4):
@@ -335,18 +346,12 @@ for l in range(2):
                 k = paramsHJ[p,2:32]
                 K = paramsHJ[p,32:62]
                 additionalParams = paramsHJ[p,62:]
-                params = [k,K,additionalParams,c_enzymes[ii,:]]
+                params = (k,K,additionalParams,c_enzymes[ii,:])
                 
                 output = run_simulation(ICs,params,t0,t_end,h,fun.fromIntv,onePulse)
                     
                 simDat.append(output)
-                simDat_rel_fracs.append([
-                    fun.fraction(output,'4P',4),
-                    fun.fraction(output,'3P',4),
-                    fun.fraction(output,'2P',4),
-                    fun.fraction(output,'1P',4),
-                    fun.fraction(output,'0P',4),
-                    ])
+                simDat_rel_fracs.append(fun.fractions(output,4))
                     
             simDat = np.reshape(simDat, (nr_paramsets,9,npts+1))        
             simDat_rel_fracs = np.reshape(simDat_rel_fracs, (nr_paramsets,5,npts+1))
@@ -362,7 +367,6 @@ for l in range(2):
         
         plt.figure(figsize=(4,2.5))
         plot_timecourse(time/60)  
-        profile_signal = fun.sig2array(onePulse,t_end+1,h)
         
         plt.yticks([0,0.5,1],fontsize=14); plt.ylabel("value",fontsize=16) 
         plt.xticks([])
@@ -396,8 +400,7 @@ for l in range(2):
 #%% cell 4: Steady state PKA vs PP1/PP2A (Figure 3a,e Supplementary Figure 19, 21)
 
 PP1v = np.array([1e-8,1e-7,1e-6])
-PKAv = np.logspace(-11,-5, num=21)
-PKAv = PKAv[np.where(PKAv<=6e-6)]
+PKAv = np.logspace(-11,-5, num=21)[:20] # last grid point (1e-5) is beyond the 6e-6 cutoff
 
 # Time setting for simulations
 t0 = 0
@@ -411,40 +414,21 @@ time = np.linspace(t0,t_end,npts+1)
 ICs = np.zeros(9)    #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
 ICs[0] = 20e-6      #0P cMyBP-C
 
-signalPulses = [0, t_end+1]
-simDat_SS = []      
-simDat_rel_fracs_SS = []
+signalPulses = np.array([0, t_end+1])
 
 if loadData == False:   
-        for p in range(nr_paramsets):
-            if printSimProg == True:
-                print('simulation for parameterset '+str(p+1)+'/'+str(nr_paramsets))
-            for j in PP1v:
-                for jj in PKAv:
-                    
-                    # parameters
-                    c_enzymes = np.array([jj,0,j,0,0]) #PKA, PKC, PP1, PP2A, RSK2
-                    k = paramsHJ[p,2:32]
-                    K = paramsHJ[p,32:62]
-                    additionalParams = paramsHJ[p,62:]
-                    params = [k,K,additionalParams,c_enzymes,paramsRSK2]
-     
-                    solution = solve_ivp(mod.cMyBPC_model_final_RSK2, (t0, t_end), ICs, rtol=1.e-8, atol=1.e-8,
-                                          t_eval=time, args=(params,fun.fromIntv,signalPulses), method='LSODA')  #RK45, RK23, BDF, LSODA, Radau, DOP853
-                    
-                    output = solution.y
-                        
-                    simDat_SS.append(output[:,t_end])
-                    simDat_rel_fracs_SS.append([
-                        fun.fraction(output,'4P',4)[t_end],
-                        fun.fraction(output,'3P',4)[t_end],
-                        fun.fraction(output,'2P',4)[t_end],
-                        fun.fraction(output,'1P',4)[t_end],
-                        fun.fraction(output,'0P',4)[t_end],
-                        ])
-            
-        simDat_SS = np.reshape(simDat_SS, (nr_paramsets,len(PP1v),len(PKAv),9))        
-        simDat_rel_fracs_SS = np.reshape(simDat_rel_fracs_SS, (nr_paramsets,len(PP1v),len(PKAv),5))
+        sweep = [(np.array([jj,0,j,0,0]),p) for p in range(nr_paramsets) for j in PP1v for jj in PKAv] #PKA, PKC, PP1, PP2A, RSK2
+        if printSimProg == True:
+            print('simulating '+str(len(sweep))+' steady state points in parallel')
+        results = Parallel(n_jobs=-1)(delayed(run_SS_point)(c_enzymes,p,ICs,t0,t_end,time,signalPulses) for c_enzymes,p in sweep)
+        
+        simDat_SS = np.empty((len(sweep),9))
+        simDat_rel_fracs_SS = np.empty((len(sweep),5))
+        for i,(output_SS,fracs) in enumerate(results):
+            simDat_SS[i,:] = output_SS
+            simDat_rel_fracs_SS[i,:] = fracs
+        simDat_SS = simDat_SS.reshape(nr_paramsets,len(PP1v),len(PKAv),9)
+        simDat_rel_fracs_SS = simDat_rel_fracs_SS.reshape(nr_paramsets,len(PP1v),len(PKAv),5)
         
         if saveData == True:
             np.save(os.path.join(path_simdat,'simDat_SS_PKAvsPP1_relFracs.npy'),simDat_rel_fracs_SS)
@@ -468,40 +452,20 @@ PP2Av = np.array([1e-8,1e-7,1e-6])
 ICs = np.zeros(9)    #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
 ICs[0] = 20e-6      #0P cMyBP-C
 
-simDat_SS = []      
-simDat_rel_fracs_SS = []
 
 if loadData == False:   
-        for p in range(nr_paramsets):
-            if printSimProg == True:
-                print('simulation for parameterset '+str(p+1)+'/'+str(nr_paramsets))
-            for j in PP2Av:
-                for jj in PKAv:
-                    
-                    # parameters
-                    c_enzymes = np.array([jj,0,0,j,0]) #PKA, PKC, PP1, PP2A
-                    k = paramsHJ[p,2:32]
-                    K = paramsHJ[p,32:62]
-                    
-                    additionalParams = paramsHJ[p,62:]
-                    params = [k,K,additionalParams,c_enzymes,paramsRSK2]
-                    
-                    solution = solve_ivp(mod.cMyBPC_model_final_RSK2, (t0, t_end), ICs, rtol=1.e-8, atol=1.e-8,
-                                          t_eval=time, args=(params,fun.fromIntv,signalPulses), method='LSODA')  #RK45, RK23, BDF, LSODA, Radau, DOP853
-                    
-                    output = solution.y
-                        
-                    simDat_SS.append(output[:,t_end])
-                    simDat_rel_fracs_SS.append([
-                        fun.fraction(output,'4P',4)[t_end],
-                        fun.fraction(output,'3P',4)[t_end],
-                        fun.fraction(output,'2P',4)[t_end],
-                        fun.fraction(output,'1P',4)[t_end],
-                        fun.fraction(output,'0P',4)[t_end],
-                        ])
-            
-        simDat_SS = np.reshape(simDat_SS, (nr_paramsets,len(PP1v),len(PKAv),9))        
-        simDat_rel_fracs_SS = np.reshape(simDat_rel_fracs_SS, (nr_paramsets,len(PP1v),len(PKAv),5))
+        sweep = [(np.array([jj,0,0,j,0]),p) for p in range(nr_paramsets) for j in PP2Av for jj in PKAv] #PKA, PKC, PP1, PP2A
+        if printSimProg == True:
+            print('simulating '+str(len(sweep))+' steady state points in parallel')
+        results = Parallel(n_jobs=-1)(delayed(run_SS_point)(c_enzymes,p,ICs,t0,t_end,time,signalPulses) for c_enzymes,p in sweep)
+        
+        simDat_SS = np.empty((len(sweep),9))
+        simDat_rel_fracs_SS = np.empty((len(sweep),5))
+        for i,(output_SS,fracs) in enumerate(results):
+            simDat_SS[i,:] = output_SS
+            simDat_rel_fracs_SS[i,:] = fracs
+        simDat_SS = simDat_SS.reshape(nr_paramsets,len(PP1v),len(PKAv),9)
+        simDat_rel_fracs_SS = simDat_rel_fracs_SS.reshape(nr_paramsets,len(PP1v),len(PKAv),5)
         
         if saveData == True:
             np.save(os.path.join(path_simdat,'simDat_SS_PKAvsPP2A_relFracs.npy'),simDat_rel_fracs_SS)
@@ -591,8 +555,7 @@ plot_SS_exp(0,1,'')
 # PKA vs PP1 - comparison to data
 
 PP1v = np.array([5e-7])
-PKAv = np.logspace(-11,-5, num=21)
-PKAv = PKAv[np.where(PKAv<=6e-6)]
+PKAv = np.logspace(-11,-5, num=21)[:20] # last grid point (1e-5) is beyond the 6e-6 cutoff
 # Time setting for simulations
 t0 = 0
 t_end = 1*60*60 #h/min/s
@@ -605,9 +568,7 @@ time = np.linspace(t0,t_end,npts+1)
 ICs = np.zeros(9)    #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
 ICs[0] = 20e-6      #0P cMyBP-C  
 
-signalPulses = [0, t_end+1]
-simDat_SS = []      
-simDat_rel_fracs_SS = []
+signalPulses = np.array([0, t_end+1])
 
 
 bAct_PKA = 1 #activity of PKA batch
@@ -616,34 +577,18 @@ bAct_PP1 = 1 #activity of PKA batch
 # bAct_PKA = 0.03 #activity of PKA batch
 # bAct_PP1 = 0.038 #activity of PKA batch
 
-for p in range(nr_paramsets):#
-    if printSimProg == True:
-        print('simulation for parameterset '+str(p+1)+'/'+str(nr_paramsets))
-    for j in PP1v:
-        for jj in PKAv:
-            c_enzymes = np.array([jj*bAct_PKA,0,j*bAct_PP1,0,0]) #PKA, PKC, PP1, PP2A, RSK2
-            k = paramsHJ[p,2:32]
-            K = paramsHJ[p,32:62]
-            
-            additionalParams = paramsHJ[p,62:]
-            params = [k,K,additionalParams,c_enzymes,paramsRSK2]
-            
-            solution = solve_ivp(mod.cMyBPC_model_final_RSK2, (t0, t_end), ICs, rtol=1.e-8, atol=1.e-8,
-                                  t_eval=time, args=(params,fun.fromIntv,signalPulses), method='LSODA')  #RK45, RK23, BDF, LSODA, Radau, DOP853
-            
-            output = solution.y
-            
-            simDat_SS.append(output[:,t_end])
-            simDat_rel_fracs_SS.append([
-                fun.fraction(output,'4P',4)[t_end],
-                fun.fraction(output,'3P',4)[t_end],
-                fun.fraction(output,'2P',4)[t_end],
-                fun.fraction(output,'1P',4)[t_end],
-                fun.fraction(output,'0P',4)[t_end],
-                ])
-    
-simDat_SS = np.reshape(simDat_SS, (nr_paramsets,len(PP1v),len(PKAv),9))        
-simDat_rel_fracs_SS = np.reshape(simDat_rel_fracs_SS, (nr_paramsets,len(PP1v),len(PKAv),5))
+sweep = [(np.array([jj*bAct_PKA,0,j*bAct_PP1,0,0]),p) for p in range(nr_paramsets) for j in PP1v for jj in PKAv] #PKA, PKC, PP1, PP2A, RSK2
+if printSimProg == True:
+    print('simulating '+str(len(sweep))+' steady state points in parallel')
+results = Parallel(n_jobs=-1)(delayed(run_SS_point)(c_enzymes,p,ICs,t0,t_end,time,signalPulses) for c_enzymes,p in sweep)
+
+simDat_SS = np.empty((len(sweep),9))
+simDat_rel_fracs_SS = np.empty((len(sweep),5))
+for i,(output_SS,fracs) in enumerate(results):
+    simDat_SS[i,:] = output_SS
+    simDat_rel_fracs_SS[i,:] = fracs
+simDat_SS = simDat_SS.reshape(nr_paramsets,len(PP1v),len(PKAv),9)
+simDat_rel_fracs_SS = simDat_rel_fracs_SS.reshape(nr_paramsets,len(PP1v),len(PKAv),5)
 
 
 avg_0P = np.average(simDat_rel_fracs_SS[:,0,:,4], axis = 0)
@@ -702,41 +647,21 @@ time = np.linspace(t0,t_end,npts+1)
 ICs = np.zeros(9)    #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
 ICs[0] = 20e-6      #0P cMyBP-C  
 
-signalPulses = [0, t_end+1]
-simDat_SS = []      
-simDat_rel_fracs_SS = []
+signalPulses = np.array([0, t_end+1])
 
 if loadData == False:   
-        for p in range(nr_paramsets):
-            if printSimProg == True:
-                print('simulation for parameterset '+str(p+1)+'/'+str(nr_paramsets))
-            for j in PP1v:
-                for jj in RSK2v:
-                    
-                    # parameters
-                    c_enzymes = np.array([0,0,j,0,jj]) #PKA, PKC, PP1, PP2A
-                    k = paramsHJ[p,2:32]
-                    K = paramsHJ[p,32:62]
-                    
-                    additionalParams = paramsHJ[p,62:]
-                    params = [k,K,additionalParams,c_enzymes,paramsRSK2]
-                    
-                    solution = solve_ivp(mod.cMyBPC_model_final_RSK2, (t0, t_end), ICs, rtol=1.e-8, atol=1.e-8,
-                                          t_eval=time, args=(params,fun.fromIntv,signalPulses), method='LSODA')  #RK45, RK23, BDF, LSODA, Radau, DOP853
-                    
-                    output = solution.y
-                    
-                    simDat_SS.append(output[:,t_end])
-                    simDat_rel_fracs_SS.append([
-                        fun.fraction(output,'4P',4)[t_end],
-                        fun.fraction(output,'3P',4)[t_end],
-                        fun.fraction(output,'2P',4)[t_end],
-                        fun.fraction(output,'1P',4)[t_end],
-                        fun.fraction(output,'0P',4)[t_end],
-                        ])
-            
-        simDat_SS = np.reshape(simDat_SS, (nr_paramsets,len(PP1v),len(RSK2v),9))        
-        simDat_rel_fracs_SS = np.reshape(simDat_rel_fracs_SS, (nr_paramsets,len(PP1v),len(RSK2v),5))
+        sweep = [(np.array([0,0,j,0,jj]),p) for p in range(nr_paramsets) for j in PP1v for jj in RSK2v] #PKA, PKC, PP1, PP2A
+        if printSimProg == True:
+            print('simulating '+str(len(sweep))+' steady state points in parallel')
+        results = Parallel(n_jobs=-1)(delayed(run_SS_point)(c_enzymes,p,ICs,t0,t_end,time,signalPulses) for c_enzymes,p in sweep)
+        
+        simDat_SS = np.empty((len(sweep),9))
+        simDat_rel_fracs_SS = np.empty((len(sweep),5))
+        for i,(output_SS,fracs) in enumerate(results):
+            simDat_SS[i,:] = output_SS
+            simDat_rel_fracs_SS[i,:] = fracs
+        simDat_SS = simDat_SS.reshape(nr_paramsets,len(PP1v),len(RSK2v),9)
+        simDat_rel_fracs_SS = simDat_rel_fracs_SS.reshape(nr_paramsets,len(PP1v),len(RSK2v),5)
         
         if saveData == True:
             np.save(os.path.join(path_simdat,'simDat_SS_RSK2vsPP1_relFracs.npy'),simDat_rel_fracs_SS)
@@ -771,41 +696,21 @@ time = np.linspace(t0,t_end,npts+1)
 ICs = np.zeros(9)    #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
 ICs[0] = 20e-6      #0P cMyBP-C  
 
-signalPulses = [0, t_end+1]
-simDat_SS = []      
-simDat_rel_fracs_SS = []
+signalPulses = np.array([0, t_end+1])
 
 if loadData == False:   
-        for p in range(nr_paramsets):
-            if printSimProg == True:
-                print('simulation for parameterset '+str(p+1)+'/'+str(nr_paramsets))
-            for j in PP2Av:
-                for jj in RSK2v:
-                    
-                    # parameters
-                    c_enzymes = np.array([0,0,j,0,jj]) #PKA, PKC, PP2A, PP2A
-                    k = paramsHJ[p,2:32]
-                    K = paramsHJ[p,32:62]
-                    
-                    additionalParams = paramsHJ[p,62:]
-                    params = [k,K,additionalParams,c_enzymes,paramsRSK2]
-                    
-                    solution = solve_ivp(mod.cMyBPC_model_final_RSK2, (t0, t_end), ICs, rtol=1.e-8, atol=1.e-8,
-                                          t_eval=time, args=(params,fun.fromIntv,signalPulses), method='LSODA')  #RK45, RK23, BDF, LSODA, Radau, DOP853
-                    
-                    output = solution.y
-                    
-                    simDat_SS.append(output[:,t_end])
-                    simDat_rel_fracs_SS.append([
-                        fun.fraction(output,'4P',4)[t_end],
-                        fun.fraction(output,'3P',4)[t_end],
-                        fun.fraction(output,'2P',4)[t_end],
-                        fun.fraction(output,'1P',4)[t_end],
-                        fun.fraction(output,'0P',4)[t_end],
-                        ])
-            
-        simDat_SS = np.reshape(simDat_SS, (nr_paramsets,len(PP2Av),len(RSK2v),9))        
-        simDat_rel_fracs_SS = np.reshape(simDat_rel_fracs_SS, (nr_paramsets,len(PP2Av),len(RSK2v),5))
+        sweep = [(np.array([0,0,j,0,jj]),p) for p in range(nr_paramsets) for j in PP2Av for jj in RSK2v] #PKA, PKC, PP2A, PP2A
+        if printSimProg == True:
+            print('simulating '+str(len(sweep))+' steady state points in parallel')
+        results = Parallel(n_jobs=-1)(delayed(run_SS_point)(c_enzymes,p,ICs,t0,t_end,time,signalPulses) for c_enzymes,p in sweep)
+        
+        simDat_SS = np.empty((len(sweep),9))
+        simDat_rel_fracs_SS = np.empty((len(sweep),5))
+        for i,(output_SS,fracs) in enumerate(results):
+            simDat_SS[i,:] = output_SS
+            simDat_rel_fracs_SS[i,:] = fracs
+        simDat_SS = simDat_SS.reshape(nr_paramsets,len(PP2Av),len(RSK2v),9)
+        simDat_rel_fracs_SS = simDat_rel_fracs_SS.reshape(nr_paramsets,len(PP2Av),len(RSK2v),5)
         
         if saveData == True:
             np.save(os.path.join(path_simdat,'simDat_SS_RSK2vsPP2A_relFracs.npy'),simDat_rel_fracs_SS)
@@ -827,8 +732,7 @@ if saveFigs == True:
 #%% cell 6: Steady state PKA vs PP1/PP2A in presence of RSK2 (Figure 3c,e, Supplementary Figure 21)
 
 PP1v = np.array([1e-8,1e-7,1e-6])
-PKAv = np.logspace(-11,-5, num=21)
-PKAv = PKAv[np.where(PKAv<=6e-6)]
+PKAv = np.logspace(-11,-5, num=21)[:20] # last grid point (1e-5) is beyond the 6e-6 cutoff
 
 # Time setting for simulations
 t0 = 0
@@ -842,41 +746,21 @@ time = np.linspace(t0,t_end,npts+1)
 ICs = np.zeros(9)    #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
 ICs[0] = 20e-6      #0P cMyBP-C  
 
-signalPulses = [0, t_end+1]
-simDat_SS = []      
-simDat_rel_fracs_SS = []
+signalPulses = np.array([0, t_end+1])
 
 if loadData == False:   
-        for p in range(nr_paramsets):
-            if printSimProg == True:
-                print('simulation for parameterset '+str(p+1)+'/'+str(nr_paramsets))
-            for j in PP1v:
-                for jj in PKAv:
-                    
-                    # parameters
-                    c_enzymes = np.array([jj,0,j,0,1e-7]) #PKA, PKC, PP1, PP2A, RSK2
-                    k = paramsHJ[p,2:32]
-                    K = paramsHJ[p,32:62]
-                    
-                    additionalParams = paramsHJ[p,62:]
-                    params = [k,K,additionalParams,c_enzymes,paramsRSK2]
-                    
-                    solution = solve_ivp(mod.cMyBPC_model_final_RSK2, (t0, t_end), ICs, rtol=1.e-8, atol=1.e-8,
-                                          t_eval=time, args=(params,fun.fromIntv,signalPulses), method='LSODA')  #RK45, RK23, BDF, LSODA, Radau, DOP853
-                    
-                    output = solution.y
-                    
-                    simDat_SS.append(output[:,t_end])
-                    simDat_rel_fracs_SS.append([
-                        fun.fraction(output,'4P',4)[t_end],
-                        fun.fraction(output,'3P',4)[t_end],
-                        fun.fraction(output,'2P',4)[t_end],
-                        fun.fraction(output,'1P',4)[t_end],
-                        fun.fraction(output,'0P',4)[t_end],
-                        ])
-            
-        simDat_SS = np.reshape(simDat_SS, (nr_paramsets,len(PP1v),len(PKAv),9))        
-        simDat_rel_fracs_SS = np.reshape(simDat_rel_fracs_SS, (nr_paramsets,len(PP1v),len(PKAv),5))
+        sweep = [(np.array([jj,0,j,0,1e-7]),p) for p in range(nr_paramsets) for j in PP1v for jj in PKAv] #PKA, PKC, PP1, PP2A, RSK2
+        if printSimProg == True:
+            print('simulating '+str(len(sweep))+' steady state points in parallel')
+        results = Parallel(n_jobs=-1)(delayed(run_SS_point)(c_enzymes,p,ICs,t0,t_end,time,signalPulses) for c_enzymes,p in sweep)
+        
+        simDat_SS = np.empty((len(sweep),9))
+        simDat_rel_fracs_SS = np.empty((len(sweep),5))
+        for i,(output_SS,fracs) in enumerate(results):
+            simDat_SS[i,:] = output_SS
+            simDat_rel_fracs_SS[i,:] = fracs
+        simDat_SS = simDat_SS.reshape(nr_paramsets,len(PP1v),len(PKAv),9)
+        simDat_rel_fracs_SS = simDat_rel_fracs_SS.reshape(nr_paramsets,len(PP1v),len(PKAv),5)
         
         if saveData == True:
             np.save(os.path.join(path_simdat,'simDat_SS_PKA_RSK2_vsPP1_relFracs.npy'),simDat_rel_fracs_SS)
@@ -898,40 +782,20 @@ PP2Av = np.array([1e-8,1e-7,1e-6])
 ICs = np.zeros(9)    #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
 ICs[0] = 20e-6      #0P cMyBP-C
 
-simDat_SS = []      
-simDat_rel_fracs_SS = []
 
 if loadData == False:   
-        for p in range(nr_paramsets):
-            if printSimProg == True:
-                print('simulation for parameterset '+str(p+1)+'/'+str(nr_paramsets))
-            for j in PP2Av:
-                for jj in PKAv:
-                    
-                    # parameters
-                    c_enzymes = np.array([jj,0,0,j,1e-7]) #PKA, PKC, PP1, PP2A, RSK2
-                    k = paramsHJ[p,2:32]
-                    K = paramsHJ[p,32:62]
-                    
-                    additionalParams = paramsHJ[p,62:]
-                    params = [k,K,additionalParams,c_enzymes,paramsRSK2]
-                    
-                    solution = solve_ivp(mod.cMyBPC_model_final_RSK2, (t0, t_end), ICs, rtol=1.e-8, atol=1.e-8,
-                                          t_eval=time, args=(params,fun.fromIntv,signalPulses), method='LSODA')  #RK45, RK23, BDF, LSODA, Radau, DOP853
-                    
-                    output = solution.y
-                    
-                    simDat_SS.append(output[:,t_end])
-                    simDat_rel_fracs_SS.append([
-                        fun.fraction(output,'4P',4)[t_end],
-                        fun.fraction(output,'3P',4)[t_end],
-                        fun.fraction(output,'2P',4)[t_end],
-                        fun.fraction(output,'1P',4)[t_end],
-                        fun.fraction(output,'0P',4)[t_end],
-                        ])
-            
-        simDat_SS = np.reshape(simDat_SS, (nr_paramsets,len(PP1v),len(PKAv),9))        
-        simDat_rel_fracs_SS = np.reshape(simDat_rel_fracs_SS, (nr_paramsets,len(PP1v),len(PKAv),5))
+        sweep = [(np.array([jj,0,0,j,1e-7]),p) for p in range(nr_paramsets) for j in PP2Av for jj in PKAv] #PKA, PKC, PP1, PP2A, RSK2
+        if printSimProg == True:
+            print('simulating '+str(len(sweep))+' steady state points in parallel')
+        results = Parallel(n_jobs=-1)(delayed(run_SS_point)(c_enzymes,p,ICs,t0,t_end,time,signalPulses) for c_enzymes,p in sweep)
+        
+        simDat_SS = np.empty((len(sweep),9))
+        simDat_rel_fracs_SS = np.empty((len(sweep),5))
+        for i,(output_SS,fracs) in enumerate(results):
+            simDat_SS[i,:] = output_SS
+            simDat_rel_fracs_SS[i,:] = fracs
+        simDat_SS = simDat_SS.reshape(nr_paramsets,len(PP1v),len(PKAv),9)
+        simDat_rel_fracs_SS = simDat_rel_fracs_SS.reshape(nr_paramsets,len(PP1v),len(PKAv),5)
         
         if saveData == True:
             np.save(os.path.join(path_simdat,'simDat_SS_PKA_RSK2_vsPP2A_relFracs.npy'),simDat_rel_fracs_SS)
@@ -965,41 +829,21 @@ time = np.linspace(t0,t_end,npts+1)
 ICs = np.zeros(9)    #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
 ICs[0] = 20e-6      #0P cMyBP-C  
 
-signalPulses = [0, t_end+1]
-simDat_SS = []      
-simDat_rel_fracs_SS = []
+signalPulses = np.array([0, t_end+1])
 
 if loadData == False:   
-        for p in range(nr_paramsets):
-            if printSimProg == True:
-                print('simulation for parameterset '+str(p+1)+'/'+str(nr_paramsets))
-            for j in PP1v:
-                for jj in PKCv:
-                    
-                    # parameters
-                    c_enzymes = np.array([0,jj,j,0,0]) #PKA, PKC, PP1, PP2A
-                    k = paramsHJ[p,2:32]
-                    K = paramsHJ[p,32:62]
-                    
-                    additionalParams = paramsHJ[p,62:]
-                    params = [k,K,additionalParams,c_enzymes,paramsRSK2]
-                    
-                    solution = solve_ivp(mod.cMyBPC_model_final_RSK2, (t0, t_end), ICs, rtol=1.e-8, atol=1.e-8,
-                                          t_eval=time, args=(params,fun.fromIntv,signalPulses), method='LSODA')  #RK45, RK23, BDF, LSODA, Radau, DOP853
-                    
-                    output = solution.y
-                    
-                    simDat_SS.append(output[:,t_end])
-                    simDat_rel_fracs_SS.append([
-                        fun.fraction(output,'4P',4)[t_end],
-                        fun.fraction(output,'3P',4)[t_end],
-                        fun.fraction(output,'2P',4)[t_end],
-                        fun.fraction(output,'1P',4)[t_end],
-                        fun.fraction(output,'0P',4)[t_end],
-                        ])
-            
-        simDat_SS = np.reshape(simDat_SS, (nr_paramsets,len(PP1v),len(PKCv),9))        
-        simDat_rel_fracs_SS = np.reshape(simDat_rel_fracs_SS, (nr_paramsets,len(PP1v),len(PKCv),5))
+        sweep = [(np.array([0,jj,j,0,0]),p) for p in range(nr_paramsets) for j in PP1v for jj in PKCv] #PKA, PKC, PP1, PP2A
+        if printSimProg == True:
+            print('simulating '+str(len(sweep))+' steady state points in parallel')
+        results = Parallel(n_jobs=-1)(delayed(run_SS_point)(c_enzymes,p,ICs,t0,t_end,time,signalPulses) for c_enzymes,p in sweep)
+        
+        simDat_SS = np.empty((len(sweep),9))
+        simDat_rel_fracs_SS = np.empty((len(sweep),5))
+        for i,(output_SS,fracs) in enumerate(results):
+            simDat_SS[i,:] = output_SS
+            simDat_rel_fracs_SS[i,:] = fracs
+        simDat_SS = simDat_SS.reshape(nr_paramsets,len(PP1v),len(PKCv),9)
+        simDat_rel_fracs_SS = simDat_rel_fracs_SS.reshape(nr_paramsets,len(PP1v),len(PKCv),5)
         
         if saveData == True:
             np.save(os.path.join(path_simdat,'simDat_SS_PKCvsPP1_relFracs.npy'),simDat_rel_fracs_SS)
@@ -1032,41 +876,21 @@ time = np.linspace(t0,t_end,npts+1)
 ICs = np.zeros(9)    #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
 ICs[0] = 20e-6      #0P cMyBP-C  
 
-signalPulses = [0, t_end+1]
-simDat_SS = []      
-simDat_rel_fracs_SS = []
+signalPulses = np.array([0, t_end+1])
 
 if loadData == False:   
-        for p in range(nr_paramsets):
-            if printSimProg == True:
-                print('simulation for parameterset '+str(p+1)+'/'+str(nr_paramsets))
-            for j in PP2Av:
-                for jj in PKCv:
-                    
-                    # parameters
-                    c_enzymes = np.array([0,jj,j,0,0]) #PKA, PKC, PP2A, PP2A
-                    k = paramsHJ[p,2:32]
-                    K = paramsHJ[p,32:62]
-                    
-                    additionalParams = paramsHJ[p,62:]
-                    params = [k,K,additionalParams,c_enzymes,paramsRSK2]
-                    
-                    solution = solve_ivp(mod.cMyBPC_model_final_RSK2, (t0, t_end), ICs, rtol=1.e-8, atol=1.e-8,
-                                          t_eval=time, args=(params,fun.fromIntv,signalPulses), method='LSODA')  #RK45, RK23, BDF, LSODA, Radau, DOP853
-                    
-                    output = solution.y
-                    
-                    simDat_SS.append(output[:,t_end])
-                    simDat_rel_fracs_SS.append([
-                        fun.fraction(output,'4P',4)[t_end],
-                        fun.fraction(output,'3P',4)[t_end],
-                        fun.fraction(output,'2P',4)[t_end],
-                        fun.fraction(output,'1P',4)[t_end],
-                        fun.fraction(output,'0P',4)[t_end],
-                        ])
-            
-        simDat_SS = np.reshape(simDat_SS, (nr_paramsets,len(PP2Av),len(PKCv),9))        
-        simDat_rel_fracs_SS = np.reshape(simDat_rel_fracs_SS, (nr_paramsets,len(PP2Av),len(PKCv),5))
+        sweep = [(np.array([0,jj,j,0,0]),p) for p in range(nr_paramsets) for j in PP2Av for jj in PKCv] #PKA, PKC, PP2A, PP2A
+        if printSimProg == True:
+            print('simulating '+str(len(sweep))+' steady state points in parallel')
+        results = Parallel(n_jobs=-1)(delayed(run_SS_point)(c_enzymes,p,ICs,t0,t_end,time,signalPulses) for c_enzymes,p in sweep)
+        
+        simDat_SS = np.empty((len(sweep),9))
+        simDat_rel_fracs_SS = np.empty((len(sweep),5))
+        for i,(output_SS,fracs) in enumerate(results):
+            simDat_SS[i,:] = output_SS
+            simDat_rel_fracs_SS[i,:] = fracs
+        simDat_SS = simDat_SS.reshape(nr_paramsets,len(PP2Av),len(PKCv),9)
+        simDat_rel_fracs_SS = simDat_rel_fracs_SS.reshape(nr_paramsets,len(PP2Av),len(PKCv),5)
         
         if saveData == True:
             np.save(os.path.join(path_simdat,'simDat_SS_PKCvsPP2A_relFracs.npy'),simDat_rel_fracs_SS)
@@ -1088,8 +912,7 @@ if saveFigs == True:
 #%% cell 8: Steady state PKA vs PP1/PP2A in presence of PKC (Figure 3c,d,e, Supplementary Figure 22)
 
 PP1v = np.array([1e-8,1e-7,1e-6])
-PKAv = np.logspace(-11,-5, num=21)
-PKAv = PKAv[np.where(PKAv<=6e-6)]
+PKAv = np.logspace(-11,-5, num=21)[:20] # last grid point (1e-5) is beyond the 6e-6 cutoff
 
 # Time setting for simulations
 t0 = 0
@@ -1103,41 +926,21 @@ time = np.linspace(t0,t_end,npts+1)
 ICs = np.zeros(9)    #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
 ICs[0] = 20e-6      #0P cMyBP-C  
 
-signalPulses = [0, t_end+1]
-simDat_SS = []      
-simDat_rel_fracs_SS = []
+signalPulses = np.array([0, t_end+1])
 
 if loadData == False:   
-        for p in range(nr_paramsets):
-            if printSimProg == True:
-                print('simulation for parameterset '+str(p+1)+'/'+str(nr_paramsets))
-            for j in PP1v:
-                for jj in PKAv:
-                    
-                    # parameters
-                    c_enzymes = np.array([jj,1e-7,j,0,0]) #PKA, PKC, PP1, PP2A, RSK2
-                    k = paramsHJ[p,2:32]
-                    K = paramsHJ[p,32:62]
-                    
-                    additionalParams = paramsHJ[p,62:]
-                    params = [k,K,additionalParams,c_enzymes,paramsRSK2]
-                    
-                    solution = solve_ivp(mod.cMyBPC_model_final_RSK2, (t0, t_end), ICs, rtol=1.e-8, atol=1.e-8,
-                                          t_eval=time, args=(params,fun.fromIntv,signalPulses), method='LSODA')  #RK45, RK23, BDF, LSODA, Radau, DOP853
-                    
-                    output = solution.y
-                    
-                    simDat_SS.append(output[:,t_end])
-                    simDat_rel_fracs_SS.append([
-                        fun.fraction(output,'4P',4)[t_end],
-                        fun.fraction(output,'3P',4)[t_end],
-                        fun.fraction(output,'2P',4)[t_end],
-                        fun.fraction(output,'1P',4)[t_end],
-                        fun.fraction(output,'0P',4)[t_end],
-                        ])
-            
-        simDat_SS = np.reshape(simDat_SS, (nr_paramsets,len(PP1v),len(PKAv),9))        
-        simDat_rel_fracs_SS = np.reshape(simDat_rel_fracs_SS, (nr_paramsets,len(PP1v),len(PKAv),5))
+        sweep = [(np.array([jj,1e-7,j,0,0]),p) for p in range(nr_paramsets) for j in PP1v for jj in PKAv] #PKA, PKC, PP1, PP2A, RSK2
+        if printSimProg == True:
+            print('simulating '+str(len(sweep))+' steady state points in parallel')
+        results = Parallel(n_jobs=-1)(delayed(run_SS_point)(c_enzymes,p,ICs,t0,t_end,time,signalPulses) for c_enzymes,p in sweep)
+        
+        simDat_SS = np.empty((len(sweep),9))
+        simDat_rel_fracs_SS = np.empty((len(sweep),5))
+        for i,(output_SS,fracs) in enumerate(results):
+            simDat_SS[i,:] = output_SS
+            simDat_rel_fracs_SS[i,:] = fracs
+        simDat_SS = simDat_SS.reshape(nr_paramsets,len(PP1v),len(PKAv),9)
+        simDat_rel_fracs_SS = simDat_rel_fracs_SS.reshape(nr_paramsets,len(PP1v),len(PKAv),5)
         
         if saveData == True:
             np.save(os.path.join(path_simdat,'simDat_SS_PKA_PKC_vsPP1_relFracs.npy'),simDat_rel_fracs_SS)
@@ -1168,40 +971,20 @@ PP2Av = np.array([1e-8,1e-7,1e-6])
 ICs = np.zeros(9)    #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
 ICs[0] = 20e-6      #0P cMyBP-C
 
-simDat_SS = []      
-simDat_rel_fracs_SS = []
 
 if loadData == False:   
-        for p in range(nr_paramsets):
-            if printSimProg == True:
-                print('simulation for parameterset '+str(p+1)+'/'+str(nr_paramsets))
-            for j in PP2Av:
-                for jj in PKAv:
-                    
-                    # parameters
-                    c_enzymes = np.array([jj,1e-7,0,j,0]) #PKA, PKC, PP1, PP2A, RSK2
-                    k = paramsHJ[p,2:32]
-                    K = paramsHJ[p,32:62]
-                    
-                    additionalParams = paramsHJ[p,62:]
-                    params = [k,K,additionalParams,c_enzymes,paramsRSK2]
-                    
-                    solution = solve_ivp(mod.cMyBPC_model_final_RSK2, (t0, t_end), ICs, rtol=1.e-8, atol=1.e-8,
-                                          t_eval=time, args=(params,fun.fromIntv,signalPulses), method='LSODA')  #RK45, RK23, BDF, LSODA, Radau, DOP853
-                    
-                    output = solution.y
-                    
-                    simDat_SS.append(output[:,t_end])
-                    simDat_rel_fracs_SS.append([
-                        fun.fraction(output,'4P',4)[t_end],
-                        fun.fraction(output,'3P',4)[t_end],
-                        fun.fraction(output,'2P',4)[t_end],
-                        fun.fraction(output,'1P',4)[t_end],
-                        fun.fraction(output,'0P',4)[t_end],
-                        ])
-            
-        simDat_SS = np.reshape(simDat_SS, (nr_paramsets,len(PP1v),len(PKAv),9))        
-        simDat_rel_fracs_SS = np.reshape(simDat_rel_fracs_SS, (nr_paramsets,len(PP1v),len(PKAv),5))
+        sweep = [(np.array([jj,1e-7,0,j,0]),p) for p in range(nr_paramsets) for j in PP2Av for jj in PKAv] #PKA, PKC, PP1, PP2A, RSK2
+        if printSimProg == True:
+            print('simulating '+str(len(sweep))+' steady state points in parallel')
+        results = Parallel(n_jobs=-1)(delayed(run_SS_point)(c_enzymes,p,ICs,t0,t_end,time,signalPulses) for c_enzymes,p in sweep)
+        
+        simDat_SS = np.empty((len(sweep),9))
+        simDat_rel_fracs_SS = np.empty((len(sweep),5))
+        for i,(output_SS,fracs) in enumerate(results):
+            simDat_SS[i,:] = output_SS
+            simDat_rel_fracs_SS[i,:] = fracs
+        simDat_SS = simDat_SS.reshape(nr_paramsets,len(PP1v),len(PKAv),9)
+        simDat_rel_fracs_SS = simDat_rel_fracs_SS.reshape(nr_paramsets,len(PP1v),len(PKAv),5)
         
         if saveData == True:
             np.save(os.path.join(path_simdat,'simDat_SS_PKA_PKC_vsPP2A_relFracs.npy'),simDat_rel_fracs_SS)
@@ -1251,6 +1034,10 @@ k[:,[25,26]] = k[:,[26,25]]
 K[:,[19,20]] = K[:,[20,19]]
 K[:,[25,26]] = K[:,[26,25]]
 
+# per-parameterset slices of the swapped matrices, hoisted out of the sweep
+# like paramSlices in cell 1
+paramSlicesSwapped = [(k[p],K[p],paramsHJ[p,62:]) for p in range(nr_paramsets)]
+
 
 PP1v = np.array([1e-8,1e-7,1e-6])
 PKAv = np.logspace(-11,-5, num=41)
@@ -1259,48 +1046,42 @@ PKAv = np.logspace(-11,-5, num=41)
 t0 = 0
 t_end = 1*60*60 #h/min/s
 h = 1
-npts = int(t_end/h)
-time = np.linspace(t0,t_end,npts+1)        
 
 
 # Initial conditions
 ICs = np.zeros(9)    #P0,A,Atr,AB,ABG,D,AD,ABD,ABGD
 ICs[0] = 20e-6      #0P cMyBP-C  
 
-signalPulses = [0, t_end+1]
-simDat_SS = []      
-simDat_rel_fracs_SS = []
+signalPulses = np.array([0, t_end+1])
+
+def run_SS_point_pp2ified(c_enzymes,p,ICs,t0,t_end,signalPulses):
+    # cell 9 counterpart of run_SS_point, using the swapped PP2A-ified k/K
+    # matrices; each worker looks up the row of its own parameterset
+    k, K, additionalParams = paramSlicesSwapped[p]
+    params = (k,K,additionalParams,c_enzymes,paramsRSK2)
+    
+    # only the steady state is needed, so evaluate the solution at t_end
+    # alone instead of materializing the full 1 s-resolution trajectory
+    solution = solve_ivp(mod.cMyBPC_model_final_RSK2, (t0, t_end), ICs, rtol=1.e-8, atol=1.e-8,
+                          t_eval=[t_end], args=(params,fun.fromIntv,signalPulses), method='LSODA', jac=mod.cMyBPC_model_final_RSK2_jac)  #RK45, RK23, BDF, LSODA, Radau, DOP853
+    
+    output = solution.y
+    return output[:,0], fun.fractions(output,4)[:,0]
 
 if loadData == False:   
-        for p in range(nr_paramsets):#
-            if printSimProg == True:
-                print('simulation for parameterset '+str(p+1)+'/'+str(nr_paramsets))
-            for j in PP1v:
-                for jj in PKAv:
-                    c_enzymes = np.array([jj,1e-7,j,0,0]) #PKA, PKC, PP1, PP2A, RSK2
-                    
-                    
-                    additionalParams = paramsHJ[p,62:]
-                    params = [k,K,additionalParams,c_enzymes,paramsRSK2]
-                    
-                    # output = run_simulation(ICs,params,t0,t_end,h,fun.fromIntv,signalPulses,mod.cMyBPC_model_final_RSK2)
-                        
-                    solution = solve_ivp(mod.cMyBPC_model_final_RSK2, (t0, t_end), ICs, rtol=1.e-8, atol=1.e-8,
-                                          t_eval=time, args=(params,fun.fromIntv,signalPulses), method='LSODA')  #RK45, RK23, BDF, LSODA, Radau, DOP853
-                    
-                    output = solution.y
-                    
-                    simDat_SS.append(output[:,t_end])
-                    simDat_rel_fracs_SS.append([
-                        fun.fraction(output,'4P',4)[t_end],
-                        fun.fraction(output,'3P',4)[t_end],
-                        fun.fraction(output,'2P',4)[t_end],
-                        fun.fraction(output,'1P',4)[t_end],
-                        fun.fraction(output,'0P',4)[t_end],
-                        ])
-            
-        simDat_SS = np.reshape(simDat_SS, (nr_paramsets,len(PP1v),len(PKAv),9))        
-        simDat_rel_fracs_SS = np.reshape(simDat_rel_fracs_SS, (nr_paramsets,len(PP1v),len(PKAv),5))
+        sweep = [(np.array([jj,1e-7,j,0,0]),p) for p in range(nr_paramsets) for j in PP1v for jj in PKAv] #PKA, PKC, PP1, PP2A, RSK2
+        if printSimProg == True:
+            print('simulating '+str(len(sweep))+' steady state points in parallel')
+        results = Parallel(n_jobs=-1)(delayed(run_SS_point_pp2ified)(c_enzymes,p,ICs,t0,t_end,signalPulses) for c_enzymes,p in sweep)
+        
+        simDat_SS = np.empty((len(sweep),9))
+        simDat_rel_fracs_SS = np.empty((len(sweep),5))
+        for i,(output_SS,fracs) in enumerate(results):
+            simDat_SS[i,:] = output_SS
+            simDat_rel_fracs_SS[i,:] = fracs
+        simDat_SS = simDat_SS.reshape(nr_paramsets,len(PP1v),len(PKAv),9)
+        simDat_rel_fracs_SS = simDat_rel_fracs_SS.reshape(nr_paramsets,len(PP1v),len(PKAv),5)
+
         
         if saveData == True:
             np.save(os.path.join(path_simdat,'simDat_SS_PKA_PKC_vsPP1pp2ified_relFracs.npy'),simDat_rel_fracs_SS)
@@ -1331,48 +1112,49 @@ if saveFigs == True:
 # nH values, nHs avg, nHs sd, EC50 values, EC50 avg, EC50 sd
 doseResponses = {} 
 
+# All six sweep archives used by the Hill fits, loaded once up front so the
+# fit loops below index into memory instead of re-reading .npy files per key
+simDatFiles = {'PKAvsPP1':'simDat_SS_PKAvsPP1','PKARSK2vsPP1':'simDat_SS_PKA_RSK2_vsPP1','PKAPKCvsPP1':'simDat_SS_PKA_PKC_vsPP1',
+               'PKAvsPP2A':'simDat_SS_PKAvsPP2A','PKARSK2vsPP2A':'simDat_SS_PKA_RSK2_vsPP2A','PKAPKCvsPP2A':'simDat_SS_PKA_PKC_vsPP2A'}
+simDatCache = {key: (np.load(os.path.join(path_simdat,name+'_relFracs.npy')),
+                     np.load(os.path.join(path_simdat,name+'.npy'))) for key,name in simDatFiles.items()}
+
 # Hill fits PP1
 
 plt.figure(figsize=(20,4.5))
 
 PP1v = np.array([1e-8,1e-7,1e-6])
-PKAv = np.logspace(-11,-5, num=21)
-PKAv = PKAv[np.where(PKAv<=6e-6)]
+PKAv = np.logspace(-11,-5, num=21)[:20] # last grid point (1e-5) is beyond the 6e-6 cutoff
 
 keys = ['PKAPKCvsPP1','PKARSK2vsPP1','PKAvsPP1']
 
 
 for i in range(3):
-    if i == 2:    
-        simDat_rel_fracs_SS = np.load(os.path.join(path_simdat,'simDat_SS_PKAvsPP1_relFracs.npy'))
-        simDat_SS = np.load(os.path.join(path_simdat,'simDat_SS_PKAvsPP1.npy'))
-    if i == 1:    
-        simDat_rel_fracs_SS = np.load(os.path.join(path_simdat,'simDat_SS_PKA_RSK2_vsPP1_relFracs.npy'))
-        simDat_SS = np.load(os.path.join(path_simdat,'simDat_SS_PKA_RSK2_vsPP1.npy'))
-    if i == 0:
-        simDat_rel_fracs_SS = np.load(os.path.join(path_simdat,'simDat_SS_PKA_PKC_vsPP1_relFracs.npy'))
-        simDat_SS = np.load(os.path.join(path_simdat,'simDat_SS_PKA_PKC_vsPP1.npy'))
+    simDat_rel_fracs_SS, simDat_SS = simDatCache[keys[i]]
+    # dose-response curves of all parametersets and PPase levels in one
+    # vectorized pass instead of re-slicing and re-summing inside the fit loop
+    ABG_D_all = (simDat_SS[:,:,:,4]+simDat_SS[:,:,:,8])/np.sum(simDat_SS,3)
     
     # Dose response fit to Hill equation
     
     PPaseV = PP1v
-    nHs_hill = []
-    Ks_hill = []
-    
     if i == 2: myColor = 'slateblue'; myAlpha = 0.75
     if i == 1 or i == 4: myColor = 'pink'; myAlpha = 1
     if i == 0: myColor = 'red'; myAlpha = 0.55
     
+    # the fits of this dose-response family are independent, so dispatch them
+    # across cores in one go and keep the loop below for plotting only
+    fits = Parallel(n_jobs=-1)(delayed(curve_fit)(fun.hillEQ, PKAv, ABG_D_all[ii,p], p0 = [1, 1e-9], bounds=(0,[10,1e-3]))
+                               for p in range(len(PPaseV)) for ii in range(nr_paramsets))
+    nHs_hill = [par_opt[0] for par_opt,_ in fits]
+    Ks_hill = [par_opt[1] for par_opt,_ in fits]
+    
     for p in range(len(PPaseV)):
     
         plt.subplot(1,len(PPaseV)+1,p+1)
             
         for ii in range(nr_paramsets):
-            ABG_D = (simDat_SS[ii,p,:,4]+simDat_SS[ii,p,:,8])/np.sum(simDat_SS[ii,p,:,:],1)
-            plt.plot(PKAv, ABG_D, 'o', color = myColor, alpha = 0.1)
-            par_opt, _ = curve_fit(fun.hillEQ, PKAv, ABG_D, p0 = [1, 1e-9], bounds=(0,[10,1e-3]))
-            nHs_hill.append(par_opt[0])
-            Ks_hill.append(par_opt[1])
+            plt.plot(PKAv, ABG_D_all[ii,p], 'o', color = myColor, alpha = 0.1)
         plt.xscale('log')
         if p == 1:
             plt.xlim(5e-10,1e-6)
@@ -1411,43 +1193,37 @@ if saveFigs == True:
 plt.figure(figsize=(20,4.5))
 
 PP2Av = np.array([1e-8,1e-7,1e-6])
-PKAv = np.logspace(-11,-5, num=21)
-PKAv = PKAv[np.where(PKAv<=6e-6)]
+PKAv = np.logspace(-11,-5, num=21)[:20] # last grid point (1e-5) is beyond the 6e-6 cutoff
 
 keys = ['PKAPKCvsPP2A','PKARSK2vsPP2A','PKAvsPP2A']
 
 
 for i in range(3):
-    if i == 2:    
-        simDat_rel_fracs_SS = np.load(os.path.join(path_simdat,'simDat_SS_PKAvsPP2A_relFracs.npy'))
-        simDat_SS = np.load(os.path.join(path_simdat,'simDat_SS_PKAvsPP2A.npy'))
-    if i == 1:    
-        simDat_rel_fracs_SS = np.load(os.path.join(path_simdat,'simDat_SS_PKA_RSK2_vsPP2A_relFracs.npy'))
-        simDat_SS = np.load(os.path.join(path_simdat,'simDat_SS_PKA_RSK2_vsPP2A.npy'))
-    if i == 0:
-        simDat_rel_fracs_SS = np.load(os.path.join(path_simdat,'simDat_SS_PKA_PKC_vsPP2A_relFracs.npy'))
-        simDat_SS = np.load(os.path.join(path_simdat,'simDat_SS_PKA_PKC_vsPP2A.npy'))
+    simDat_rel_fracs_SS, simDat_SS = simDatCache[keys[i]]
+    # dose-response curves of all parametersets and PPase levels in one
+    # vectorized pass instead of re-slicing and re-summing inside the fit loop
+    ABG_D_all = (simDat_SS[:,:,:,4]+simDat_SS[:,:,:,8])/np.sum(simDat_SS,3)
     
     # Dose response fit to Hill equation
     
     PPaseV = PP2Av
-    nHs_hill = []
-    Ks_hill = []
-    
     if i == 2: myColor = 'slateblue'; myAlpha = 0.75
     if i == 1 or i == 4: myColor = 'pink'; myAlpha = 1
     if i == 0: myColor = 'red'; myAlpha = 0.55
     
+    # the fits of this dose-response family are independent, so dispatch them
+    # across cores in one go and keep the loop below for plotting only
+    fits = Parallel(n_jobs=-1)(delayed(curve_fit)(fun.hillEQ, PKAv, ABG_D_all[ii,p], p0 = [1, 1e-9], bounds=(0,[10,1e-3]))
+                               for p in range(len(PPaseV)) for ii in range(nr_paramsets))
+    nHs_hill = [par_opt[0] for par_opt,_ in fits]
+    Ks_hill = [par_opt[1] for par_opt,_ in fits]
+    
     for p in range(len(PPaseV)):
     
         plt.subplot(1,len(PPaseV)+1,p+1)
             
         for ii in range(nr_paramsets):
-            ABG_D = (simDat_SS[ii,p,:,4]+simDat_SS[ii,p,:,8])/np.sum(simDat_SS[ii,p,:,:],1)
-            plt.plot(PKAv, ABG_D, 'o', color = myColor, alpha = 0.1)
-            par_opt, _ = curve_fit(fun.hillEQ, PKAv, ABG_D, p0 = [1, 1e-9], bounds=(0,[10,1e-3]))
-            nHs_hill.append(par_opt[0])
-            Ks_hill.append(par_opt[1])
+            plt.plot(PKAv, ABG_D_all[ii,p], 'o', color = myColor, alpha = 0.1)
         plt.xscale('log')
         if p == 1:
             plt.xlim(5e-10,1e-6)
@@ -1574,6 +1350,7 @@ print('######################################################## \n \n')
 print('Shapiro-Wilk tests for Hill-exponent distributions\n \n') #if pvalue < 0.05, values are likely not from normal distribution
 
 PPaseV = [1e-8,1e-7,1e-6]
+strings = ['PKAvsPP1','PKARSK2vsPP1','PKAPKCvsPP1','PKAvsPP2A','PKARSK2vsPP2A','PKAPKCvsPP2A']
 
 for p in range(len(PPaseV)):
     nHs = [doseResponses['PKAvsPP1'][0][p],
@@ -1583,7 +1360,6 @@ for p in range(len(PPaseV)):
                 doseResponses['PKARSK2vsPP2A'][0][p],
                 doseResponses['PKAPKCvsPP2A'][0][p]
                 ]
-    strings = ['PKAvsPP1','PKARSK2vsPP1','PKAPKCvsPP1','PKAvsPP2A','PKARSK2vsPP2A','PKAPKCvsPP2A']
     for i in range(len(nHs)):
         print(strings[i], ', [PPase] = ',PPaseV[p],':', stats.shapiro(nHs[i]),'\n\n')
 
@@ -1592,7 +1368,6 @@ print('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~')
 print('1 - comparisons within dose response experiment at different [PPase]:') 
 print('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~\n \n')
 
-strings = ['PKAvsPP1','PKARSK2vsPP1','PKAPKCvsPP1','PKAvsPP2A','PKARSK2vsPP2A','PKAPKCvsPP2A']
 pvals = []
 for i in range(len(nHs)):
     pvals.append(stats.kruskal(doseResponses[strings[i]][0][0],
@@ -1653,7 +1428,6 @@ print('######################################################## \n \n')
 
 print('Shapiro-Wilk tests for EC50 value distributions\n \n') #if pvalue < 0.05, values are likely not from normal distribution
 
-PPaseV = [1e-8,1e-7,1e-6]
 
 for p in range(len(PPaseV)):
     EC50s = [doseResponses['PKAvsPP1'][3][p],
@@ -1663,7 +1437,6 @@ for p in range(len(PPaseV)):
                 doseResponses['PKARSK2vsPP2A'][3][p],
                 doseResponses['PKAPKCvsPP2A'][3][p]
                 ]
-    strings = ['PKAvsPP1','PKARSK2vsPP1','PKAPKCvsPP1','PKAvsPP2A','PKARSK2vsPP2A','PKAPKCvsPP2A']
     for i in range(len(EC50s)):
         print(strings[i], ', [PPase] = ',PPaseV[p],':', stats.shapiro(EC50s[i]),'\n\n')
 